@@ -0,0 +1,340 @@
+import html
+import io
+import json
+import os
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+# 목록 페이지의 "더보기" 버튼이 /api/items 를 불러와 항목을 이어 붙이는 스크립트
+_LIST_SCRIPT = """
+const total = %(total)d, pageSize = %(page_size)d, delayMs = %(delay_ms)d;
+let offset = pageSize;
+const render = (item) =>
+    `<li class="item" data-id="${item.id}"><a class="name" href="${item.url}">${item.name}</a>` +
+    `<span class="price">${item.price}</span><img class="thumb" data-src="${item.image}"></li>`;
+
+document.getElementById("more").addEventListener("click", async () => {
+    if (offset >= total) return;
+    const res = await fetch(`/api/items?offset=${offset}&limit=${pageSize}&total=${total}&delay_ms=${delayMs}`);
+    const data = await res.json();
+    document.getElementById("items").insertAdjacentHTML("beforeend", data.items.map(render).join(""));
+    offset += data.items.length;
+});
+"""
+
+
+class FixtureSite:
+    """
+    벤치마크용 합성 페이지를 제공하는 로컬 HTTP 서버 (백그라운드 스레드).
+
+    - /product/<n>              상품 상세 (제목/가격/태그/사진 + iframe)
+    - /frame/<n>                iframe 내용
+    - /list?total=&page_size=   "더보기" 버튼으로 page_size 개씩 늘어나는 긴 목록
+    - /api/items?offset=&limit= 목록 항목 JSON (next 에 다음 페이지 URL)
+    - /slow/<ms>                ms 만큼 늦게 응답하는 상품 페이지
+    - /fail/<status>            지정한 상태 코드로 응답
+    - /flaky/<n>?rate=          URL 마다 일정하게 rate 비율로 503 응답
+    - /reset                    응답 없이 연결 종료
+    - /img/<brand>/<n>.jpg      image_root 의 사진 (없으면 작은 기본 JPEG)
+
+    with FixtureSite(latency_ms=20) as site:
+        scraper.goto(site.url("/product/1"))
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0,
+        image_root: Optional[str] = None,
+    ):
+        """
+        :param host: 바인딩 주소
+        :param port: 포트 (0 이면 빈 포트 자동 선택)
+        :param latency_ms: 모든 응답에 더할 지연 시간 (ms)
+        :param image_root: /img 로 제공할 <브랜드>/<번호>.jpg 사진 폴더 (선택)
+        """
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.image_root = image_root
+        self.hits = Counter()
+
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def start(self):
+        site = self
+
+        class Handler(_FixtureHandler):
+            fixture = site
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="FixtureSite", daemon=True
+        )
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def product_urls(
+        self, count: int, slow_every: int = 0, fail_every: int = 0, slow_ms: int = 500
+    ):
+        """
+        상품 페이지 URL count 개. slow_every/fail_every 번째마다 느린/실패 페이지를 섞음.
+        """
+        urls = []
+        for n in range(1, count + 1):
+            if fail_every and n % fail_every == 0:
+                urls.append(self.url(f"/fail/500?n={n}"))
+            elif slow_every and n % slow_every == 0:
+                urls.append(self.url(f"/slow/{slow_ms}?n={n}"))
+            else:
+                urls.append(self.url(f"/product/{n}"))
+
+        return urls
+
+    def _record_hit(self, route):
+        with self._lock:
+            self.hits[route] += 1
+
+    @staticmethod
+    def make_image_folder(
+        root: str, brands: int = 10, per_brand: int = 1000, size=(120, 120)
+    ) -> str:
+        """
+        root/<brandNN>/<번호>.jpg 구조의 사진 폴더를 생성 (이미 있는 파일은 건너뜀, Pillow 필요).
+        모든 파일은 같은 작은 JPEG 이므로 개수가 많아도 빠르게 생성됨.
+        """
+        image = FixtureSite.jpeg_bytes(size)
+
+        for b in range(brands):
+            brand_dir = os.path.join(root, FixtureSite.brand_name(b))
+            os.makedirs(brand_dir, exist_ok=True)
+
+            for number in range(per_brand):
+                path = os.path.join(brand_dir, f"{number}.jpg")
+                if not os.path.exists(path):
+                    with open(path, "wb") as f:
+                        f.write(image)
+
+        return root
+
+    @staticmethod
+    def brand_name(index: int) -> str:
+        return f"brand{index:02d}"
+
+    @staticmethod
+    def jpeg_bytes(size=(120, 120)) -> bytes:
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.new("RGB", size, (200, 120, 40)).save(buffer, format="JPEG")
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def item(n: int):
+        """
+        목록/API 에서 쓰는 n 번째 항목.
+        """
+        return {
+            "id": n,
+            "name": f"상품 {n}",
+            "price": 1000 + (n * 37) % 9000,
+            "url": f"/product/{n}",
+            "image": f"/img/{FixtureSite.brand_name(n % 10)}/{n}.jpg",
+        }
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """
+    FixtureSite 의 경로별 응답. fixture 는 FixtureSite.start 에서 지정됨.
+    """
+
+    protocol_version = "HTTP/1.1"
+    fixture = None
+
+    _default_jpeg = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        segments = [s for s in parts.path.split("/") if s]
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        route = segments[0] if segments else "index"
+
+        self.fixture._record_hit(route)
+
+        if self.fixture.latency_ms:
+            time.sleep(self.fixture.latency_ms / 1000)
+
+        handler = getattr(self, f"_route_{route}", None)
+        if handler is None:
+            self._send(404, "text/plain", "not found")
+            return
+
+        try:
+            handler(segments[1:], query)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _route_index(self, args, query):
+        links = "".join(f'<li><a href="/product/{n}">상품 {n}</a></li>' for n in range(1, 21))
+        self._send_html("index", f'<ul>{links}</ul><a href="/list">목록</a>')
+
+    def _route_product(self, args, query):
+        self._send_html(f"product {args[0]}", _product_body(int(args[0])))
+
+    def _route_frame(self, args, query):
+        n = int(args[0])
+        self._send_html(f"frame {n}", f'<div class="detail">상세 정보 {n}</div>')
+
+    def _route_list(self, args, query):
+        total = int(query.get("total", 1000))
+        page_size = int(query.get("page_size", 50))
+        delay_ms = int(query.get("delay_ms", 0))
+
+        items = "".join(_item_html(FixtureSite.item(n)) for n in range(min(page_size, total)))
+        script = _LIST_SCRIPT % {"total": total, "page_size": page_size, "delay_ms": delay_ms}
+
+        self._send_html(
+            "list",
+            f'<ul id="items">{items}</ul><button id="more">더보기</button>'
+            f"<script>{script}</script>",
+        )
+
+    def _route_api(self, args, query):
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 50))
+        total = int(query.get("total", 1000))
+        delay_ms = int(query.get("delay_ms", 0))
+
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+
+        items = [FixtureSite.item(n) for n in range(offset, min(offset + limit, total))]
+        next_offset = offset + len(items)
+        next_url = None
+        if next_offset < total:
+            next_url = (
+                f"/api/items?offset={next_offset}&limit={limit}"
+                f"&total={total}&delay_ms={delay_ms}"
+            )
+
+        body = json.dumps(
+            {"items": items, "offset": offset, "total": total, "next": next_url},
+            ensure_ascii=False,
+        )
+        self._send(200, "application/json; charset=utf-8", body)
+
+    def _route_slow(self, args, query):
+        time.sleep(int(args[0]) / 1000)
+        n = int(query.get("n", 0))
+        self._send_html(f"slow {n}", _product_body(n))
+
+    def _route_fail(self, args, query):
+        status = int(args[0]) if args else 500
+        self._send(status, "text/html; charset=utf-8", f"<h1>error {status}</h1>")
+
+    def _route_flaky(self, args, query):
+        n = int(args[0])
+        rate = float(query.get("rate", 0.3))
+
+        if zlib.crc32(self.path.encode()) % 1000 < rate * 1000:
+            self._send(503, "text/html; charset=utf-8", "<h1>unavailable</h1>")
+        else:
+            self._send_html(f"flaky {n}", _product_body(n))
+
+    def _route_reset(self, args, query):
+        self.close_connection = True
+
+    def _route_img(self, args, query):
+        data = None
+        root = self.fixture.image_root
+        if root and len(args) == 2:
+            path = os.path.join(root, os.path.basename(args[0]), os.path.basename(args[1]))
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    data = f.read()
+
+        if data is None:
+            if _FixtureHandler._default_jpeg is None:
+                _FixtureHandler._default_jpeg = FixtureSite.jpeg_bytes()
+            data = _FixtureHandler._default_jpeg
+
+        self._send(200, "image/jpeg", data)
+
+    def _send_html(self, title, body):
+        self._send(
+            200,
+            "text/html; charset=utf-8",
+            f'<!doctype html><html><head><meta charset="utf-8"><title>{title}</title>'
+            f"</head><body>{body}</body></html>",
+        )
+
+    def _send(self, status, content_type, body):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _product_body(n):
+    tags = "".join(f'<li class="tag">tag-{(n + i) % 50}</li>' for i in range(3))
+    brand = FixtureSite.brand_name(n % 10)
+
+    return (
+        f'<div class="product" data-id="{n}">'
+        f'<h1 class="title">상품 {n}</h1>'
+        f'<span class="price">{1000 + (n * 37) % 9000}</span>'
+        f'<ul class="tags">{tags}</ul>'
+        f'<img class="thumb" data-src="/img/{brand}/{n}.jpg">'
+        f'<a class="next" href="/product/{n + 1}">다음</a>'
+        f"</div>"
+        f'<iframe src="/frame/{n}" width="300" height="80"></iframe>'
+    )
+
+
+def _item_html(item):
+    return (
+        f'<li class="item" data-id="{item["id"]}">'
+        f'<a class="name" href="{item["url"]}">{html.escape(item["name"])}</a>'
+        f'<span class="price">{item["price"]}</span>'
+        f'<img class="thumb" data-src="{item["image"]}"></li>'
+    )
@@ -0,0 +1,196 @@
+"""
+모듈별 콜드 스타트 import 시간 측정 및 회귀 검사.
+
+각 모듈을 새 인터프리터에서 import 하여 소요 시간(ms)의 중앙값을 재고,
+import 만으로 무거운 의존성(selenium, pandas, numpy, openpyxl)이 로드되거나
+로그 디렉토리가 생기는지 확인. 기준값(JSON)보다 tolerance 이상 느려지면 실패.
+
+python -m app.core.benchmarks.ImportTime --save .benchmarks/import_time.json
+python -m app.core.benchmarks.ImportTime --baseline .benchmarks/import_time.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# 진입 모듈 → import 직후 로드되어 있으면 안 되는 의존성
+ENTRY_MODULES = {
+    "app.core.utils.Logger": ("selenium", "pandas", "numpy", "openpyxl"),
+    "app.core.utils.Metrics": ("selenium", "pandas", "numpy", "openpyxl"),
+    "app.core.utils.RecordSink": ("selenium", "pandas", "numpy", "openpyxl", "pyarrow"),
+    "app.core.utils.ImageIndex": ("selenium", "pandas", "numpy", "openpyxl", "PIL"),
+    "app.core.utils.FileMaker": ("selenium", "pandas", "numpy", "openpyxl"),
+    "app.core.services.CrawlState": ("selenium", "pandas", "numpy", "openpyxl"),
+    "app.core.services.SeniumScraper": ("selenium", "pandas", "numpy", "openpyxl"),
+    "app.core.services.SeniumDriverPool": ("selenium", "pandas", "numpy", "openpyxl"),
+    "app.core.services.SeniumRunner": ("selenium", "pandas", "numpy", "openpyxl"),
+    "app.core.services.SeniumBatchSearch": ("selenium", "pandas", "numpy", "openpyxl"),
+    "app.core.services.WrightBrowser": ("selenium", "pandas", "numpy", "openpyxl"),
+}
+
+# 자식 인터프리터에서 실행하는 측정 코드
+_PROBE = """
+import json, os, sys, time
+started = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({{
+    "ms": elapsed_ms,
+    "loaded": [name for name in {forbidden!r} if name in sys.modules],
+    "created": sorted(os.listdir(".")),
+}}))
+"""
+
+
+def measure(module: str, forbidden=(), repeat: int = 5):
+    """
+    module 의 콜드 import 시간을 repeat 번 재서 중앙값과 부작용을 반환.
+    import 에 실패하면 {"error": 메시지}.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    code = _PROBE.format(module=module, forbidden=tuple(forbidden))
+
+    samples = []
+    loaded, created = set(), set()
+
+    for _ in range(repeat):
+        # 빈 임시 디렉토리에서 실행하여 import 시점에 생기는 파일/디렉토리를 확인
+        with tempfile.TemporaryDirectory() as cwd:
+            proc = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=cwd,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+
+        if proc.returncode != 0:
+            return {"error": proc.stderr.strip().splitlines()[-1]}
+
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        samples.append(result["ms"])
+        loaded.update(result["loaded"])
+        created.update(result["created"])
+
+    return {
+        "ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+        "loaded": sorted(loaded),
+        "created": sorted(created),
+    }
+
+
+def top_imports(module: str, limit: int = 10):
+    """
+    python -X importtime 기준으로 자체 import 시간이 긴 모듈 limit 개 [(모듈, ms)].
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+
+    with tempfile.TemporaryDirectory() as cwd:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        entries.append((name.strip(), int(self_us) / 1000))
+
+    return sorted(entries, key=lambda entry: entry[1], reverse=True)[:limit]
+
+
+def run(modules=None, repeat: int = 5):
+    """
+    {모듈: measure 결과} (modules 생략 시 ENTRY_MODULES 전체).
+    """
+    modules = modules or list(ENTRY_MODULES)
+
+    return {
+        module: measure(module, ENTRY_MODULES.get(module, ()), repeat=repeat)
+        for module in modules
+    }
+
+
+def check(results, baseline=None, tolerance: float = 0.3, slack_ms: float = 5.0):
+    """
+    실패 사유 목록을 반환 (비어 있으면 통과).
+
+    - 금지된 의존성이 로드되었거나 import 만으로 파일/디렉토리가 생김
+    - 기준값보다 tolerance 비율 + slack_ms 이상 느려짐
+    """
+    failures = []
+
+    for module, result in results.items():
+        if "error" in result:
+            continue
+
+        if result["loaded"]:
+            failures.append(f"{module}: import 시 로드됨 {result['loaded']}")
+        if result["created"]:
+            failures.append(f"{module}: import 시 생성됨 {result['created']}")
+
+        base = (baseline or {}).get(module)
+        if base and "ms" in base:
+            budget = base["ms"] * (1 + tolerance) + slack_ms
+            if result["ms"] > budget:
+                failures.append(
+                    f"{module}: {result['ms']}ms > 기준 {base['ms']}ms (허용 {budget:.1f}ms)"
+                )
+
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="모듈별 콜드 스타트 import 시간 측정")
+    parser.add_argument("modules", nargs="*", help="측정할 모듈 (생략 시 전체 진입 모듈)")
+    parser.add_argument("--repeat", type=int, default=5, help="모듈별 측정 횟수")
+    parser.add_argument("--baseline", help="비교할 기준값 JSON 경로")
+    parser.add_argument("--save", help="측정 결과를 기준값으로 저장할 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="허용 비율 (0.3 = 30%%)")
+    parser.add_argument("--detail", action="store_true", help="모듈별 느린 import 상위 10개 출력")
+    args = parser.parse_args(argv)
+
+    results = run(args.modules, repeat=args.repeat)
+
+    for module, result in results.items():
+        if "error" in result:
+            print(f"{module:<40} 건너뜀 ({result['error']})")
+            continue
+
+        print(f"{module:<40} {result['ms']:>8.1f}ms (최소 {result['min_ms']:.1f}ms)")
+
+        if args.detail:
+            for name, ms in top_imports(module):
+                print(f"    {name:<50} {ms:>8.1f}ms")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    failures = check(results, baseline, tolerance=args.tolerance)
+    for failure in failures:
+        print(f"실패 - {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
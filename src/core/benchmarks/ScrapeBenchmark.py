@@ -0,0 +1,469 @@
+"""
+로컬 픽스처 사이트(FixtureSite)를 대상으로 한 스크래핑/엑셀 저장 벤치마크.
+
+- senium: 페이지/초, goto p50/p99, iframe 전환, 더보기 스크롤 완료 시간, 일괄추출 처리량
+- wright: 페이지/초 (crawl), goto p50/p99, 더보기 스크롤 완료 시간, 일괄추출 처리량
+- startup: 실행 프로필별 브라우저 시작 시간, 첫 페이지 이동 시간, 종료 시간
+- excel: 1k/10k/100k 행 엑셀 저장 시간 (스트리밍 / 메모리 방식)
+
+결과는 JSON 으로 저장하고, 기준값과 비교하여 tolerance 이상 나빠진 항목이 있으면 실패.
+
+python -m app.core.benchmarks.ScrapeBenchmark --save .benchmarks/scrape.json
+python -m app.core.benchmarks.ScrapeBenchmark --only excel --rows 1000,10000 \\
+    --baseline .benchmarks/scrape.json
+python -m app.core.benchmarks.ScrapeBenchmark --only wright,startup --profile lean
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from app.core.benchmarks.FixtureSite import FixtureSite
+from app.core.utils.Metrics import metrics
+
+ENGINES = ("excel", "senium", "wright", "startup")
+
+PRODUCT_FIELDS = {
+    "title": (".title", "text"),
+    "price": (".price", "text"),
+    "tags": (".tag", "text", True),
+    "image": ("img.thumb", "@data-src"),
+}
+
+ITEM_FIELDS = {
+    "name": (".name", "text"),
+    "link": (".name", "href"),
+    "price": (".price", "text"),
+    "image": ("img.thumb", "@data-src"),
+}
+
+# 페이지 안에서 목록 항목을 한 번에 수집하는 스크립트 (wright)
+_EXTRACT_ITEMS_SCRIPT = """
+els => els.map(el => ({
+    name: el.querySelector('.name').textContent,
+    link: el.querySelector('.name').href,
+    price: el.querySelector('.price').textContent,
+    image: el.querySelector('img.thumb').dataset.src,
+}))
+"""
+
+EXCEL_FIXED_COLUMNS = ["브랜드", "브랜드 페이지"]
+
+
+def bench_excel(
+    sizes=(1_000, 10_000, 100_000), workdir=None, image_ratio=0.1, in_memory_max_rows=10_000
+):
+    """
+    행 수별 엑셀 저장 시간. in_memory_max_rows 이하에서만 메모리 방식(save_to_excel_for_musinsa)도 측정.
+    출원번호의 image_ratio 비율에 해당하는 사진이 사진 폴더에 있음.
+    """
+    from app.core.utils.FileMaker import FileMaker
+    from app.core.utils.ImageIndex import ImageIndex
+
+    workdir = workdir or tempfile.mkdtemp(prefix="bench_excel_")
+    brands = 10
+    per_brand = max(1, int(max(sizes) * image_ratio / brands))
+
+    started = time.perf_counter()
+    image_root = FixtureSite.make_image_folder(
+        os.path.join(workdir, "images"), brands=brands, per_brand=per_brand
+    )
+    result = {"image_folder_s": _elapsed(started), "images": brands * per_brand}
+
+    started = time.perf_counter()
+    image_index = ImageIndex(image_root)
+    result["image_index_s"] = _elapsed(started)
+
+    # pandas/openpyxl 은 처음 저장할 때 import 되므로 측정 전에 한 번 저장해 둠
+    FileMaker.save_to_excel_streaming(
+        iter(_excel_records(10, brands, per_brand, image_ratio)),
+        file_name=os.path.join(workdir, "warmup.xlsx"),
+        fixed_columns=EXCEL_FIXED_COLUMNS,
+        image_index=image_index,
+    )
+
+    for rows in sizes:
+        records = _excel_records(rows, brands, per_brand, image_ratio)
+        entry = {}
+
+        started = time.perf_counter()
+        path = FileMaker.save_to_excel_streaming(
+            iter(records),
+            file_name=os.path.join(workdir, f"streaming_{rows}.xlsx"),
+            fixed_columns=EXCEL_FIXED_COLUMNS,
+            image_index=image_index,
+        )
+        entry["streaming_s"] = _elapsed(started)
+        entry["streaming_rows_per_sec"] = round(rows / max(entry["streaming_s"], 1e-9), 1)
+        entry["streaming_mb"] = round(os.path.getsize(path) / 1024 / 1024, 2)
+
+        if rows <= in_memory_max_rows:
+            started = time.perf_counter()
+            FileMaker.save_to_excel_for_musinsa(
+                records,
+                file_name=os.path.join(workdir, f"in_memory_{rows}.xlsx"),
+                fixed_columns=EXCEL_FIXED_COLUMNS,
+                image_index=image_index,
+            )
+            entry["in_memory_s"] = _elapsed(started)
+            entry["in_memory_rows_per_sec"] = round(rows / max(entry["in_memory_s"], 1e-9), 1)
+
+        result[f"rows_{rows}"] = entry
+
+    return result
+
+
+def bench_senium(site, pages=200, list_total=2000, driver_factory=None):
+    """
+    SeniumScraper 로 상품 페이지 방문/추출, 목록 더보기 스크롤, 일괄추출 처리량 측정.
+    """
+    from app.core.services.SeniumDriverPool import create_headless_chrome
+    from app.core.services.SeniumScraper import By, SeniumScraper
+
+    driver = (driver_factory or create_headless_chrome)()
+    result = {"pages": pages}
+
+    try:
+        scraper = SeniumScraper(driver, fast_lookup=True)
+
+        with _recording():
+            started = time.perf_counter()
+            for url in site.product_urls(pages, slow_every=20, fail_every=50, slow_ms=300):
+                scraper.goto(url)
+                scraper.extract_all(".product", PRODUCT_FIELDS)
+
+                # 실패 페이지에는 iframe 이 없음
+                if "/fail/" in url:
+                    continue
+
+                with metrics.timer("bench.iframe"):
+                    with scraper.switch_to_iframe():
+                        scraper.find_element(
+                            By.CSS_SELECTOR, ".detail", element_description="iframe 상세", timeout=1
+                        )
+
+            result["pages_per_sec"] = round(pages / (time.perf_counter() - started), 2)
+            result.update(_quantiles("senium.goto", "goto"))
+            result.update(_quantiles("bench.iframe", "iframe"))
+
+        scraper.goto(site.url(f"/list?total={list_total}&page_size=50&delay_ms=20"))
+
+        started = time.perf_counter()
+        scraper.scroll_with_more_btn(
+            By.CSS_SELECTOR,
+            "#more",
+            max_scroll_attempts=list_total // 50 + 5,
+            mode="observe",
+            item_selector=".item",
+        )
+        result["scroll_s"] = _elapsed(started)
+
+        started = time.perf_counter()
+        items = scraper.extract_all(".item", ITEM_FIELDS) or []
+        result.update(_throughput(items, started))
+    finally:
+        driver.quit()
+
+    return result
+
+
+def bench_wright(site, pages=200, list_total=2000, concurrency=4, profile=None):
+    """
+    WrightBrowser.crawl 로 상품 페이지 방문/추출, 목록 더보기 스크롤, 일괄추출 처리량 측정.
+    :param profile: 실행 프로필 이름 (None 이면 WRIGHT_PROFILE 환경변수)
+    """
+    return asyncio.run(_bench_wright(site, pages, list_total, concurrency, profile))
+
+
+async def _bench_wright(site, pages, list_total, concurrency, profile):
+    from playwright.async_api import async_playwright
+    from app.core.services.WrightBrowser import WrightBrowser
+
+    async def handler(browser, url):
+        return await browser.page.eval_on_selector_all(
+            ".tag", "els => els.map(el => el.textContent)"
+        )
+
+    result = {"pages": pages, "concurrency": concurrency}
+
+    async with async_playwright() as playwright:
+        async with WrightBrowser(playwright, profile=profile) as browser:
+            result["profile"] = browser.profile.name
+            with _recording():
+                ok = 0
+                started = time.perf_counter()
+                urls = site.product_urls(pages, slow_every=20, fail_every=50, slow_ms=300)
+                async for crawled in browser.crawl(
+                    urls, concurrency=concurrency, handler=handler, timeout=5000
+                ):
+                    ok += crawled.ok
+
+                result["pages_per_sec"] = round(pages / (time.perf_counter() - started), 2)
+                result["ok"] = ok
+                result.update(_quantiles("wright.goto", "goto"))
+
+            page = browser.page
+            await browser.goto(site.url(f"/list?total={list_total}&page_size=50&delay_ms=20"))
+
+            started = time.perf_counter()
+            while True:
+                count = await page.locator(".item").count()
+                if count >= list_total:
+                    break
+
+                await page.click("#more")
+                try:
+                    await page.wait_for_function(
+                        f"document.querySelectorAll('.item').length > {count}", timeout=2000
+                    )
+                except Exception:
+                    break
+            result["scroll_s"] = _elapsed(started)
+
+            started = time.perf_counter()
+            items = await page.eval_on_selector_all(".item", _EXTRACT_ITEMS_SCRIPT)
+            result.update(_throughput(items, started))
+
+    return result
+
+
+def bench_startup(site, profiles=None, repeat=3, workdir=None):
+    """
+    실행 프로필별 브라우저 시작 → 첫 페이지 이동 → 종료 시간의 중앙값.
+    첫 회는 startup_cold_ms 로 따로 기록 (영구 프로필은 두 번째부터 캐시가 데워진 상태).
+    """
+    return asyncio.run(_bench_startup(site, profiles, repeat, workdir))
+
+
+async def _bench_startup(site, profiles, repeat, workdir):
+    from playwright.async_api import async_playwright
+    from app.core.services.WrightBrowser import WrightBrowser
+    from app.core.services.WrightLaunchProfile import PROFILES, LaunchProfile
+
+    result = {"repeat": repeat}
+
+    async with async_playwright() as playwright:
+        for name in profiles or list(PROFILES):
+            profile = LaunchProfile.resolve(name)
+            if profile.persistent and workdir:
+                # 기존 프로필 폴더를 건드리지 않도록 임시 폴더에서 측정
+                profile = profile.replace(user_data_dir=os.path.join(workdir, f"profile_{name}"))
+
+            samples = {"startup_ms": [], "first_goto_ms": [], "close_ms": []}
+            try:
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    async with WrightBrowser(playwright, profile=profile) as browser:
+                        ready = time.perf_counter()
+                        await browser.goto(site.url("/product/1"))
+                        loaded = time.perf_counter()
+
+                    samples["startup_ms"].append((ready - started) * 1000)
+                    samples["first_goto_ms"].append((loaded - ready) * 1000)
+                    samples["close_ms"].append((time.perf_counter() - loaded) * 1000)
+            except Exception as e:
+                result[name] = {"error": f"{type(e).__name__}: {e}"}
+                continue
+
+            result[name] = {
+                "startup_cold_ms": round(samples["startup_ms"][0], 1),
+                **{key: round(statistics.median(values), 1) for key, values in samples.items()},
+                "executable": profile.describe(playwright)["executable"],
+            }
+
+    return result
+
+
+def run(
+    engines=ENGINES,
+    rows=(1_000, 10_000, 100_000),
+    pages=200,
+    list_total=2000,
+    latency_ms=0,
+    profile=None,
+    profiles=None,
+):
+    """
+    {"meta": {...}, 엔진: 결과 또는 {"error": 메시지}}
+    :param profile: wright 벤치마크에 쓸 실행 프로필 이름
+    :param profiles: startup 벤치마크에서 비교할 실행 프로필 이름 목록 (None 이면 전체)
+    """
+    results = {
+        "meta": {
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pages": pages,
+            "list_total": list_total,
+            "latency_ms": latency_ms,
+            "profile": profile,
+        }
+    }
+
+    with tempfile.TemporaryDirectory(prefix="bench_") as workdir:
+        with FixtureSite(latency_ms=latency_ms) as site:
+            for engine in engines:
+                print(f"[{engine}] 측정 중...", flush=True)
+                try:
+                    if engine == "excel":
+                        results[engine] = bench_excel(rows, workdir=workdir)
+                    elif engine == "senium":
+                        results[engine] = bench_senium(site, pages=pages, list_total=list_total)
+                    elif engine == "wright":
+                        results[engine] = bench_wright(
+                            site, pages=pages, list_total=list_total, profile=profile
+                        )
+                    elif engine == "startup":
+                        results[engine] = bench_startup(site, profiles=profiles, workdir=workdir)
+                    else:
+                        raise ValueError(f"ValueError - 지원하지 않는 벤치마크: {engine}")
+                except Exception as e:
+                    results[engine] = {"error": f"{type(e).__name__}: {e}"}
+
+    return results
+
+
+def compare(results, baseline, tolerance: float = 0.2):
+    """
+    기준값 대비 tolerance 이상 나빠진 항목의 설명 목록.
+    이름이 _per_sec 로 끝나는 값은 클수록, 그 외 시간(_s, _ms) 값은 작을수록 좋음.
+    """
+    current = _flatten(results)
+    failures = []
+
+    for key, base in _flatten(baseline).items():
+        value = current.get(key)
+        if value is None or not base:
+            continue
+
+        if key.endswith("_per_sec"):
+            worse = value < base * (1 - tolerance)
+        elif key.endswith(("_s", "_ms")):
+            worse = value > base * (1 + tolerance)
+        else:
+            continue
+
+        if worse:
+            failures.append(f"{key}: {value} (기준 {base}, {(value - base) / base:+.0%})")
+
+    return failures
+
+
+def _excel_records(rows, brands, per_brand, image_ratio):
+    # image_ratio 비율의 행만 사진 폴더에 있는 출원번호를 갖도록 번호 범위를 조정
+    span = max(1, int(per_brand / image_ratio))
+
+    return [
+        {
+            "브랜드": FixtureSite.brand_name(i % brands),
+            "브랜드 페이지": f"https://example.com/brand/{i % brands}?page={i}",
+            "상품명": f"상품 {i}",
+            "출원번호": (i * 7919) % span,
+        }
+        for i in range(rows)
+    ]
+
+
+@contextmanager
+def _recording():
+    """
+    블록 안에서만 기본 메트릭 레지스트리를 켜고 초기화된 상태로 기록.
+    """
+    enabled = metrics.enabled
+    metrics.enabled = True
+    metrics.reset()
+    try:
+        yield metrics
+    finally:
+        metrics.enabled = enabled
+
+
+def _quantiles(name, prefix):
+    histogram = metrics.histograms.get((name, ()))
+    if histogram is None:
+        return {}
+
+    p50, p99 = histogram.quantiles((0.5, 0.99))
+    return {f"{prefix}_p50_ms": round(p50, 1), f"{prefix}_p99_ms": round(p99, 1)}
+
+
+def _throughput(items, started):
+    elapsed = time.perf_counter() - started
+
+    return {
+        "extract_items": len(items),
+        "extract_ms": round(elapsed * 1000, 1),
+        "extract_items_per_sec": round(len(items) / max(elapsed, 1e-9), 1),
+    }
+
+
+def _elapsed(started):
+    return round(time.perf_counter() - started, 3)
+
+
+def _flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        if key == "meta":
+            continue
+
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+
+    return flat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="픽스처 사이트 대상 스크래핑/엑셀 저장 벤치마크")
+    parser.add_argument("--only", default=",".join(ENGINES), help="실행할 벤치마크 (쉼표 구분)")
+    parser.add_argument("--rows", default="1000,10000,100000", help="엑셀 행 수 (쉼표 구분)")
+    parser.add_argument("--pages", type=int, default=200, help="방문할 상품 페이지 수")
+    parser.add_argument("--list-total", type=int, default=2000, help="더보기 목록 항목 수")
+    parser.add_argument("--latency-ms", type=float, default=0, help="모든 응답에 더할 지연 (ms)")
+    parser.add_argument("--profile", help="wright 벤치마크의 실행 프로필 (생략 시 WRIGHT_PROFILE)")
+    parser.add_argument("--profiles", help="startup 벤치마크에서 비교할 프로필 (쉼표 구분, 생략 시 전체)")
+    parser.add_argument("--baseline", help="비교할 기준값 JSON 경로")
+    parser.add_argument("--save", help="결과를 저장할 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 비율 (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = run(
+        engines=[e.strip() for e in args.only.split(",") if e.strip()],
+        rows=[int(r) for r in args.rows.split(",") if r.strip()],
+        pages=args.pages,
+        list_total=args.list_total,
+        latency_ms=args.latency_ms,
+        profile=args.profile,
+        profiles=[p.strip() for p in args.profiles.split(",") if p.strip()] if args.profiles else None,
+    )
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            failures = compare(results, json.load(f), tolerance=args.tolerance)
+
+    for failure in failures:
+        print(f"실패 - {failure}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
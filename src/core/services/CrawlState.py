@@ -0,0 +1,261 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+
+class CrawlState:
+    """
+    방문한 URL, 본문 해시, 추출 결과를 SQLite 에 저장하는 크롤 상태 저장소.
+
+    - 중단된 실행은 resume=True 로 다시 열면 같은 실행으로 이어짐 (이미 성공한 URL 은 건너뜀)
+    - max_age 안에 성공한 URL 은 다음 실행에서도 건너뜀 (None 이면 매 실행 다시 방문)
+    - 다시 방문한 페이지의 해시가 이전과 같으면 저장된 결과를 재사용 (unchanged)
+      페이지는 그대로 받아 렌더링하고 추출(handler)만 건너뛰므로, 방문 자체를 줄이려면 max_age 사용
+    - checkpoint_every 개의 결과마다 커밋하므로 비정상 종료 시에도 그 이전 결과는 보존됨
+
+    with CrawlState(".data/crawl_state.sqlite3", max_age=24 * 3600) as state:
+        async for result in browser.crawl(urls, handler=parse, state=state):
+            ...
+    """
+
+    def __init__(
+        self,
+        db_path: str = ".data/crawl_state.sqlite3",
+        max_age: Optional[float] = None,
+        resume: bool = True,
+        checkpoint_every: int = 50,
+    ):
+        """
+        :param db_path: SQLite 파일 경로
+        :param max_age: 이 시간(초) 안에 성공한 URL 은 방문하지 않음
+        :param resume: 완료되지 않은 이전 실행이 있으면 이어서 진행할지 여부
+        :param checkpoint_every: 몇 개의 결과마다 커밋할지
+        """
+        self.db_path = db_path
+        self.max_age = max_age
+        self.checkpoint_every = checkpoint_every
+
+        self.counters = Counter()
+        self._pending_writes = 0
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at REAL NOT NULL,
+                finished_at REAL
+            )
+            """
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                run_id INTEGER NOT NULL,
+                ok INTEGER NOT NULL,
+                content_hash TEXT,
+                data TEXT,
+                error_class TEXT,
+                elapsed_ms REAL,
+                visited_at REAL NOT NULL,
+                changed_at REAL
+            )
+            """
+        )
+        self._db.commit()
+
+        self.run_id = self._start_run(resume)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # 예외로 끝난 실행은 완료 처리하지 않아 다음 실행에서 이어갈 수 있게 함
+        if exc_type is None:
+            self.finish()
+        self.close()
+
+    def should_visit(self, url: str) -> bool:
+        """
+        이번 실행에서 이미 성공했거나 max_age 안에 성공한 URL 이면 False.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT run_id, ok, visited_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+
+            if row:
+                run_id, ok, visited_at = row
+                if ok and (
+                    run_id == self.run_id
+                    or (self.max_age is not None and time.time() - visited_at < self.max_age)
+                ):
+                    self.counters["skipped"] += 1
+                    return False
+
+        return True
+
+    def lookup(self, url: str):
+        """
+        URL 의 마지막 기록 (없으면 None).
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT ok, content_hash, data, error_class, visited_at FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+
+        if not row:
+            return None
+
+        ok, content_hash, data, error_class, visited_at = row
+
+        return {
+            "ok": bool(ok),
+            "content_hash": content_hash,
+            "data": json.loads(data) if data is not None else None,
+            "error_class": error_class,
+            "visited_at": visited_at,
+        }
+
+    def record(
+        self,
+        url: str,
+        ok: bool,
+        content_hash: Optional[str] = None,
+        data=None,
+        error_class: Optional[str] = None,
+        elapsed_ms: float = 0.0,
+    ) -> bool:
+        """
+        방문 결과를 기록하고, 이전 기록과 본문 해시가 달라졌는지 반환.
+        실패한 방문은 이전에 성공했을 때의 본문 해시와 데이터를 지우지 않음.
+        """
+        now = time.time()
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT ok, content_hash FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+
+            changed = not (row and content_hash and row[1] == content_hash)
+
+            if ok:
+                self._db.execute(
+                    """
+                    INSERT INTO pages VALUES (?, ?, 1, ?, ?, NULL, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        run_id = excluded.run_id, ok = 1,
+                        content_hash = excluded.content_hash, data = excluded.data,
+                        error_class = NULL, elapsed_ms = excluded.elapsed_ms,
+                        visited_at = excluded.visited_at,
+                        changed_at = CASE WHEN ? THEN excluded.visited_at ELSE changed_at END
+                    """,
+                    (
+                        url,
+                        self.run_id,
+                        content_hash,
+                        json.dumps(data, ensure_ascii=False, default=str),
+                        elapsed_ms,
+                        now,
+                        now,
+                        changed,
+                    ),
+                )
+            else:
+                self._db.execute(
+                    """
+                    INSERT INTO pages VALUES (?, ?, 0, NULL, NULL, ?, ?, ?, NULL)
+                    ON CONFLICT(url) DO UPDATE SET
+                        run_id = excluded.run_id, error_class = excluded.error_class,
+                        elapsed_ms = excluded.elapsed_ms, visited_at = excluded.visited_at, ok = 0
+                    """,
+                    (url, self.run_id, error_class, elapsed_ms, now),
+                )
+
+            self._pending_writes += 1
+            if self._pending_writes >= self.checkpoint_every:
+                self._commit()
+
+            if not ok:
+                self.counters["failed"] += 1
+            elif changed:
+                self.counters["changed"] += 1
+            else:
+                self.counters["unchanged"] += 1
+
+        return changed
+
+    def checkpoint(self) -> None:
+        with self._lock:
+            self._commit()
+
+    def finish(self) -> None:
+        """
+        현재 실행을 완료 처리. 이후 같은 저장소를 열면 새 실행으로 시작됨.
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE runs SET finished_at = ? WHERE run_id = ?", (time.time(), self.run_id)
+            )
+            self._commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._db.close()
+
+    def stats(self):
+        with self._lock:
+            total, ok = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(ok), 0) FROM pages"
+            ).fetchone()
+            counters = dict(self.counters)
+
+        return {**counters, "run_id": self.run_id, "urls": total, "ok": ok}
+
+    @staticmethod
+    def content_hash(content) -> str:
+        """
+        본문(str/bytes) 또는 추출 결과(JSON 직렬화 가능 객체)의 sha256 해시.
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        elif not isinstance(content, bytes):
+            content = json.dumps(
+                content, ensure_ascii=False, sort_keys=True, default=str
+            ).encode("utf-8")
+
+        return hashlib.sha256(content).hexdigest()
+
+    def _start_run(self, resume):
+        with self._lock:
+            if resume:
+                row = self._db.execute(
+                    "SELECT run_id FROM runs WHERE finished_at IS NULL ORDER BY run_id DESC LIMIT 1"
+                ).fetchone()
+                if row:
+                    self.counters["resumed"] = 1
+                    return row[0]
+
+            cursor = self._db.execute(
+                "INSERT INTO runs (started_at) VALUES (?)", (time.time(),)
+            )
+            self._db.commit()
+
+            return cursor.lastrowid
+
+    def _commit(self):
+        self._db.commit()
+        self._pending_writes = 0
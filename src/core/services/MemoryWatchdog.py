@@ -0,0 +1,227 @@
+from collections import Counter
+from typing import Optional
+from app.core.utils.Logger import Logger
+from app.core.utils.Metrics import metrics
+
+_MB = 1024 * 1024
+
+# 재시작 사유
+PAGES = "pages"
+RSS = "rss"
+JS_HEAP = "js_heap"
+
+
+class MemoryWatchdog:
+    """
+    브라우저 프로세스 RSS 와 JS 힙 크기를 측정해 기준을 넘으면 재시작(recycle)이 필요하다고 판단.
+    실제 재시작은 작업 사이에 SeniumDriverPool(드라이버 교체) / WrightBrowser(컨텍스트 교체)가 수행하고,
+    재시작 전후 메모리와 회수된 양을 로그로 남김.
+
+    - RSS: psutil 로 브라우저 프로세스들의 합계 (psutil 이 없으면 측정하지 않음)
+    - JS 힙: CDP Performance.getMetrics 의 JSHeapUsedSize
+    - 측정은 check_every 페이지마다 한 번, 페이지 수 기준은 매번 확인
+
+    watchdog = MemoryWatchdog(max_rss_mb=1500, max_js_heap_mb=300, max_pages=500)
+    with SeniumDriverPool(size=4, watchdog=watchdog) as pool: ...
+    async with WrightBrowser(playwright, watchdog=watchdog) as browser: ...
+    """
+
+    logger = Logger.lazy(
+        name="MemoryWatchdog", log_file="MemoryWatchdog.log", json_format=True
+    )
+
+    def __init__(
+        self,
+        max_rss_mb: Optional[float] = None,
+        max_js_heap_mb: Optional[float] = None,
+        max_pages: Optional[int] = None,
+        check_every: int = 10,
+    ):
+        """
+        :param max_rss_mb: 브라우저 프로세스 RSS 합계 상한 (MB)
+        :param max_js_heap_mb: 페이지 JS 힙 사용량 상한 (MB)
+        :param max_pages: 드라이버/컨텍스트 하나가 처리할 최대 페이지 수
+        :param check_every: 메모리를 측정할 페이지 간격 (측정에는 CDP 호출/프로세스 조회 비용이 듦)
+        """
+        self.max_rss_mb = max_rss_mb
+        self.max_js_heap_mb = max_js_heap_mb
+        self.max_pages = max_pages
+        self.check_every = max(1, check_every)
+
+        self.counters = Counter()
+        self.reclaimed_mb = 0.0
+        self._sampled_at = {}
+
+    @property
+    def samples_memory(self) -> bool:
+        return bool(self.max_rss_mb or self.max_js_heap_mb)
+
+    def due(self, target, pages: int) -> bool:
+        """
+        target(드라이버/브라우저)이 마지막 측정 후 check_every 페이지 이상 처리했으면 True.
+        """
+        if not self.samples_memory:
+            return False
+
+        last = self._sampled_at.get(id(target))
+        if last is not None and 0 <= pages - last < self.check_every:
+            return False
+
+        self._sampled_at[id(target)] = pages
+        return True
+
+    def check(self, pages: int, sample=None) -> Optional[str]:
+        """
+        재시작이 필요하면 사유(PAGES, RSS, JS_HEAP)를, 아니면 None 을 반환.
+        """
+        if self.max_pages and pages >= self.max_pages:
+            return PAGES
+
+        if sample:
+            rss_mb = sample.get("rss_mb")
+            if self.max_rss_mb and rss_mb is not None and rss_mb > self.max_rss_mb:
+                return RSS
+
+            js_heap_mb = sample.get("js_heap_mb")
+            if self.max_js_heap_mb and js_heap_mb is not None and js_heap_mb > self.max_js_heap_mb:
+                return JS_HEAP
+
+        return None
+
+    def forget(self, target) -> None:
+        self._sampled_at.pop(id(target), None)
+
+    def record_recycle(self, engine: str, reason: str, before=None, after=None, pages: int = 0):
+        """
+        재시작 결과를 집계하고 회수된 메모리를 로그로 남김.
+        """
+        before = before or {}
+        after = after or {}
+
+        reclaimed_mb = None
+        if before.get("rss_mb") is not None and after.get("rss_mb") is not None:
+            reclaimed_mb = round(before["rss_mb"] - after["rss_mb"], 1)
+            self.reclaimed_mb += reclaimed_mb
+            metrics.observe("watchdog.reclaimed_mb", reclaimed_mb, engine=engine)
+
+        self.counters[f"{engine}.{reason}"] += 1
+        metrics.inc("watchdog.recycle", engine=engine, reason=reason)
+
+        Logger.event(
+            MemoryWatchdog.logger,
+            f"브라우저 재시작 ({engine}, {reason})",
+            engine=engine,
+            reason=reason,
+            pages=pages,
+            rss_before_mb=before.get("rss_mb"),
+            rss_after_mb=after.get("rss_mb"),
+            reclaimed_mb=reclaimed_mb,
+            js_heap_before_mb=before.get("js_heap_mb"),
+            js_heap_after_mb=after.get("js_heap_mb"),
+        )
+
+    def stats(self):
+        return {
+            "recycled": dict(self.counters),
+            "reclaimed_mb": round(self.reclaimed_mb, 1),
+        }
+
+    @staticmethod
+    def process_rss_mb(pids, children: bool = True) -> Optional[float]:
+        """
+        pids 프로세스들(children=True 면 하위 프로세스 포함)의 RSS 합계 (MB). psutil 이 없으면 None.
+        """
+        try:
+            import psutil
+        except ImportError:
+            return None
+
+        processes = {}
+        for pid in pids:
+            try:
+                process = psutil.Process(pid)
+                processes[pid] = process
+                if children:
+                    for child in process.children(recursive=True):
+                        processes[child.pid] = child
+            except psutil.Error:
+                pass
+
+        if not processes:
+            return None
+
+        total = 0
+        for process in processes.values():
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass
+
+        return total / _MB
+
+    @staticmethod
+    def sample_driver(driver):
+        """
+        Selenium Chrome 드라이버의 {"rss_mb": chromedriver 하위 프로세스 RSS, "js_heap_mb": 현재 탭 JS 힙}.
+        측정할 수 없는 값은 None.
+        """
+        rss_mb = None
+        try:
+            rss_mb = MemoryWatchdog.process_rss_mb([driver.service.process.pid])
+        except Exception:
+            pass
+
+        js_heap_mb = None
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+            js_heap_mb = _js_heap_mb(result)
+        except Exception:
+            pass
+
+        return {"rss_mb": _round(rss_mb), "js_heap_mb": _round(js_heap_mb)}
+
+    @staticmethod
+    async def sample_page(page, browser=None):
+        """
+        Playwright 페이지의 {"rss_mb": 브라우저 프로세스 RSS, "js_heap_mb": 페이지 JS 힙}.
+        RSS 는 브라우저 CDP SystemInfo.getProcessInfo 로 찾은 프로세스 기준 (Chromium 전용).
+        """
+        js_heap_mb = None
+        try:
+            session = await page.context.new_cdp_session(page)
+            try:
+                await session.send("Performance.enable")
+                js_heap_mb = _js_heap_mb(await session.send("Performance.getMetrics"))
+            finally:
+                await session.detach()
+        except Exception:
+            pass
+
+        rss_mb = None
+        if browser is not None:
+            try:
+                session = await browser.new_browser_cdp_session()
+                try:
+                    info = await session.send("SystemInfo.getProcessInfo")
+                finally:
+                    await session.detach()
+
+                pids = [process["id"] for process in info.get("processInfo", [])]
+                rss_mb = MemoryWatchdog.process_rss_mb(pids, children=False)
+            except Exception:
+                pass
+
+        return {"rss_mb": _round(rss_mb), "js_heap_mb": _round(js_heap_mb)}
+
+
+def _js_heap_mb(result):
+    for metric in (result or {}).get("metrics", []):
+        if metric.get("name") == "JSHeapUsedSize":
+            return metric["value"] / _MB
+
+    return None
+
+
+def _round(value):
+    return None if value is None else round(value, 1)
@@ -0,0 +1,208 @@
+import os
+import threading
+import time
+from app.core.utils import NetError
+
+# 프록시 상태를 나쁘게 만드는 오류 클래스 (DNS, 핸들러 오류 등은 대상 사이트 문제로 간주)
+PROXY_ERROR_CLASSES = frozenset(
+    {
+        NetError.PROXY_ERROR,
+        NetError.CONNECTION_RESET,
+        NetError.TIMED_OUT,
+        NetError.TIMEOUT,
+    }
+)
+
+
+class ProxyStats:
+    def __init__(self, server):
+        self.server = server
+        self.requests = 0
+        self.recent_requests = 0
+        self.errors = 0
+        self.latency_ms = None
+        self.error_rate = 0.0
+        self.consecutive_errors = 0
+        self.in_use = 0
+        self.cooldown_until = 0.0
+        self.cooldowns = 0
+
+    def to_dict(self):
+        return {
+            "server": self.server,
+            "requests": self.requests,
+            "recent_requests": self.recent_requests,
+            "errors": self.errors,
+            "latency_ms": self.latency_ms,
+            "error_rate": self.error_rate,
+            "consecutive_errors": self.consecutive_errors,
+            "in_use": self.in_use,
+            "cooldown_until": self.cooldown_until,
+            "cooldowns": self.cooldowns,
+        }
+
+
+class ProxyPool:
+    """
+    여러 프록시를 컨텍스트 단위로 배정하고 goto 결과로 상태를 평가하는 풀.
+
+    지연시간과 오류율은 지수이동평균(EWMA)으로 유지하며, 기준을 넘은 프록시는
+    cooldown 초 동안 배정에서 제외했다가 통계를 초기화하여 다시 투입함.
+    Playwright 에 의존하지 않으므로 로컬 프록시(예: http://127.0.0.1:8899) 로 검증 가능.
+
+    proxies = ProxyPool(["http://10.0.0.1:3128", "http://10.0.0.2:3128"])
+    async with WrightBrowserPool(playwright, proxies=proxies) as pool:
+        async for result in pool.crawl(urls):
+            ...
+    print(proxies.snapshot())
+    """
+
+    def __init__(
+        self,
+        servers,
+        alpha: float = 0.3,
+        max_error_rate: float = 0.5,
+        max_consecutive_errors: int = 3,
+        max_latency_ms: float = None,
+        min_requests: int = 5,
+        cooldown: float = 60.0,
+        clock=time.monotonic,
+    ):
+        """
+        :param servers: 프록시 서버 주소 목록 (예: "http://host:port")
+        :param alpha: EWMA 가중치 (클수록 최근 결과를 크게 반영)
+        :param max_error_rate: 이 오류율을 넘으면 cooldown (min_requests 이후부터 적용)
+        :param max_consecutive_errors: 연속 오류가 이 횟수에 도달하면 즉시 cooldown
+        :param max_latency_ms: 평균 지연이 이 값을 넘으면 cooldown (None 이면 사용 안 함)
+        :param min_requests: 오류율/지연 기준을 적용하기 위한 최소 요청 수
+        :param cooldown: 배정에서 제외할 시간 (초)
+        :param clock: 시간 함수 (테스트에서 교체용)
+        """
+        servers = list(servers)
+        if not servers:
+            raise ValueError("ValueError - 프록시 서버는 최소 1개 필요")
+
+        self.alpha = alpha
+        self.max_error_rate = max_error_rate
+        self.max_consecutive_errors = max_consecutive_errors
+        self.max_latency_ms = max_latency_ms
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self._clock = clock
+
+        self._stats = {server: ProxyStats(server) for server in servers}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, env_var: str = "WRIGHT_PROXIES", **kwargs):
+        """
+        콤마로 구분된 프록시 목록 환경변수로 풀을 생성. 값이 없으면 None.
+        """
+        value = os.environ.get(env_var, "")
+        servers = [s.strip() for s in value.split(",") if s.strip()]
+
+        return cls(servers, **kwargs) if servers else None
+
+    def acquire(self) -> str:
+        """
+        사용 가능한 프록시 중 점수가 가장 좋은(낮은) 프록시를 배정.
+        모두 cooldown 중이면 가장 먼저 복귀하는 프록시를 배정.
+        """
+        with self._lock:
+            now = self._clock()
+
+            for stats in self._stats.values():
+                if stats.cooldown_until and stats.cooldown_until <= now:
+                    self._restore(stats)
+
+            healthy = [s for s in self._stats.values() if not s.cooldown_until]
+
+            if healthy:
+                chosen = min(healthy, key=self._score)
+            else:
+                chosen = min(self._stats.values(), key=lambda s: s.cooldown_until)
+
+            chosen.in_use += 1
+
+            return chosen.server
+
+    def release(self, server: str) -> None:
+        with self._lock:
+            stats = self._stats.get(server)
+            if stats and stats.in_use > 0:
+                stats.in_use -= 1
+
+    def report(self, server: str, error_class: str = None, latency_ms: float = None):
+        """
+        goto 결과를 반영. error_class 가 None 이면 성공.
+        """
+        with self._lock:
+            stats = self._stats.get(server)
+            if stats is None:
+                return
+
+            failed = error_class in PROXY_ERROR_CLASSES
+
+            stats.requests += 1
+            stats.recent_requests += 1
+            stats.errors += failed
+            stats.consecutive_errors = stats.consecutive_errors + 1 if failed else 0
+            stats.error_rate += self.alpha * (failed - stats.error_rate)
+
+            if latency_ms is not None and not failed:
+                if stats.latency_ms is None:
+                    stats.latency_ms = latency_ms
+                else:
+                    stats.latency_ms += self.alpha * (latency_ms - stats.latency_ms)
+
+            if not stats.cooldown_until and self._is_degraded(stats):
+                stats.cooldown_until = self._clock() + self.cooldown
+                stats.cooldowns += 1
+
+    def is_healthy(self, server: str) -> bool:
+        with self._lock:
+            stats = self._stats.get(server)
+
+            return bool(stats) and (
+                not stats.cooldown_until or stats.cooldown_until <= self._clock()
+            )
+
+    @staticmethod
+    def context_options(server: str) -> dict:
+        """
+        browser.new_context 에 전달할 프록시 옵션.
+        """
+        return {"proxy": {"server": server}}
+
+    def snapshot(self):
+        with self._lock:
+            return [stats.to_dict() for stats in self._stats.values()]
+
+    def _is_degraded(self, stats):
+        if stats.consecutive_errors >= self.max_consecutive_errors:
+            return True
+        # cooldown 에서 복귀한 프록시는 min_requests 만큼 다시 측정한 뒤에 평가
+        if stats.recent_requests < self.min_requests:
+            return False
+        if stats.error_rate > self.max_error_rate:
+            return True
+
+        return bool(
+            self.max_latency_ms
+            and stats.latency_ms is not None
+            and stats.latency_ms > self.max_latency_ms
+        )
+
+    def _score(self, stats):
+        # 측정값이 없는 프록시는 먼저 시도되도록 지연 0 으로 취급
+        latency = stats.latency_ms or 0.0
+
+        return (latency + 100.0) * (1 + 4 * stats.error_rate) * (1 + stats.in_use)
+
+    @staticmethod
+    def _restore(stats):
+        stats.cooldown_until = 0.0
+        stats.consecutive_errors = 0
+        stats.error_rate = 0.0
+        stats.latency_ms = None
+        stats.recent_requests = 0
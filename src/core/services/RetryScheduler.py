@@ -0,0 +1,221 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from app.core.utils import NetError
+
+
+@dataclass
+class RetryPolicy:
+    """
+    오류 클래스 하나에 적용할 재시도 정책.
+    max_attempts 는 첫 시도를 포함한 총 시도 횟수 (1 이면 재시도 없음).
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+
+    def delay(self, attempt: int) -> float:
+        """
+        attempt 번째 실패 후 다음 시도까지의 대기 시간 (초).
+        지수 백오프 값에서 jitter 비율만큼 무작위로 줄여 동시 재시도가 몰리지 않게 함.
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+
+        return delay * (1 - self.jitter * random.random())
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+# DNS 실패는 대부분 영구적이므로 드물게, 연결 끊김은 일시적인 경우가 많으므로 자주 재시도
+DEFAULT_POLICIES = {
+    NetError.CONNECTION_RESET: RetryPolicy(max_attempts=4, base_delay=0.5),
+    NetError.TIMEOUT: RetryPolicy(max_attempts=3, base_delay=2.0),
+    NetError.TIMED_OUT: RetryPolicy(max_attempts=3, base_delay=2.0),
+    NetError.NAME_NOT_RESOLVED: RetryPolicy(max_attempts=2, base_delay=30.0),
+    NetError.BROWSER_ERROR: RetryPolicy(max_attempts=2, base_delay=1.0),
+    NetError.UNKNOWN: RetryPolicy(max_attempts=2, base_delay=1.0),
+    NetError.HANDLER_ERROR: NO_RETRY,
+}
+
+
+class RetryScheduler:
+    """
+    재시도 시각 순으로 정렬된 우선순위 큐.
+
+    실패한 URL 은 백오프 시간이 지난 뒤에 다시 꺼내지도록 큐에 되돌아가며,
+    그 동안 워커는 준비된 다른 URL 을 처리하므로 대기 때문에 막히지 않음.
+    크롤 한 번에 하나씩 사용.
+
+    scheduler = RetryScheduler(policies={NetError.TIMEOUT: RetryPolicy(max_attempts=5)})
+    async for result in browser.crawl(urls, retry=scheduler):
+        print(result.url, result.ok, result.attempts)
+    print(scheduler.report())
+    """
+
+    def __init__(self, policies=None, default_policy=NO_RETRY, capacity=1000):
+        """
+        :param policies: 오류 클래스별 RetryPolicy (생략 시 DEFAULT_POLICIES, 지정 시 덮어쓰기)
+        :param default_policy: policies 에 없는 오류 클래스에 적용할 정책
+        :param capacity: 대기+처리 중인 URL 최대 수, 넘으면 put 이 대기
+        """
+        self.policies = {**DEFAULT_POLICIES, **(policies or {})}
+        self.default_policy = default_policy
+        self.capacity = capacity
+
+        self.outcomes = Counter()
+        self._latency = {}
+
+        self._heap = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._closed = False
+        self._cond = None
+
+    @classmethod
+    def without_retry(cls, capacity=1000):
+        """
+        모든 오류를 재시도 없이 바로 최종 실패로 처리하는 스케줄러.
+        """
+        scheduler = cls(capacity=capacity)
+        scheduler.policies = {}
+
+        return scheduler
+
+    def policy_for(self, error_class):
+        return self.policies.get(error_class, self.default_policy)
+
+    async def put(self, url):
+        """
+        새 URL 을 즉시 처리 가능한 상태로 추가. 용량이 차 있으면 빌 때까지 대기.
+        """
+        cond = self._condition()
+
+        async with cond:
+            await cond.wait_for(
+                lambda: len(self._heap) + self._in_flight < self.capacity
+            )
+            heapq.heappush(self._heap, (time.monotonic(), next(self._seq), url, []))
+            cond.notify_all()
+
+    async def close(self):
+        """
+        더 이상 새 URL 이 없음을 알림. 남은 재시도가 모두 끝나면 get 이 None 을 반환.
+        """
+        cond = self._condition()
+
+        async with cond:
+            self._closed = True
+            cond.notify_all()
+
+    async def get(self):
+        """
+        재시도 시각이 지난 가장 이른 URL 을 (url, attempts) 로 반환.
+        모든 작업이 끝났으면 None.
+        """
+        cond = self._condition()
+
+        async with cond:
+            while True:
+                if self._heap:
+                    wait = self._heap[0][0] - time.monotonic()
+
+                    if wait <= 0:
+                        _, _, url, attempts = heapq.heappop(self._heap)
+                        self._in_flight += 1
+                        return url, attempts
+
+                    try:
+                        await asyncio.wait_for(cond.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                if self._closed and self._in_flight == 0:
+                    return None
+
+                await cond.wait()
+
+    async def done(self, url, attempts, error_class=None, elapsed_ms=0.0, retry=True):
+        """
+        시도 결과를 기록하고, 정책상 재시도가 남았으면 백오프 후 다시 큐에 넣음.
+
+        :param attempts: 지금까지의 시도 기록 리스트 (이번 시도가 추가됨)
+        :param error_class: 실패한 경우 오류 클래스, 성공이면 None
+        :param elapsed_ms: 이번 시도 소요 시간
+        :param retry: False 면 정책과 상관없이 최종 결과로 처리 (더 처리할 워커가 없는 경우 등)
+        :return: 최종 결과이면 True, 재시도 예약되었으면 False
+        """
+        cond = self._condition()
+
+        attempts.append(
+            {
+                "attempt": len(attempts) + 1,
+                "error_class": error_class,
+                "elapsed_ms": elapsed_ms,
+            }
+        )
+        self._record_latency(error_class, elapsed_ms)
+
+        async with cond:
+            self._in_flight -= 1
+
+            final = True
+            if error_class and retry:
+                policy = self.policy_for(error_class)
+
+                if len(attempts) < policy.max_attempts:
+                    ready_at = time.monotonic() + policy.delay(len(attempts))
+                    heapq.heappush(
+                        self._heap, (ready_at, next(self._seq), url, attempts)
+                    )
+                    final = False
+
+            if final:
+                if not error_class:
+                    outcome = "succeeded" if len(attempts) == 1 else "succeeded_after_retry"
+                else:
+                    outcome = f"failed:{error_class}"
+                self.outcomes[outcome] += 1
+            else:
+                self.outcomes["retried"] += 1
+
+            cond.notify_all()
+
+            return final
+
+    def report(self):
+        """
+        최종 결과별 건수와 오류 클래스별 시도 지연 통계 (ms) 를 반환.
+        """
+        return {
+            "outcomes": dict(self.outcomes),
+            "attempt_latency_ms": {
+                key: {
+                    "count": count,
+                    "avg": total / count,
+                    "max": maximum,
+                }
+                for key, (count, total, maximum) in self._latency.items()
+            },
+            "pending": len(self._heap),
+            "in_flight": self._in_flight,
+        }
+
+    def _record_latency(self, error_class, elapsed_ms):
+        key = error_class or "ok"
+        count, total, maximum = self._latency.get(key, (0, 0.0, 0.0))
+        self._latency[key] = (count + 1, total + elapsed_ms, max(maximum, elapsed_ms))
+
+    def _condition(self):
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+
+        return self._cond
@@ -0,0 +1,79 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+_DIGITS = re.compile(r"\d+")
+
+
+class SelectorMissCache:
+    """
+    페이지 템플릿별로 "없던" selector 를 기억하는 캐시.
+    한 번 찾지 못한 selector 는 같은 템플릿의 다음 페이지에서 기다리지 않고 즉시 확인만 함.
+
+    - 페이지 템플릿: URL 의 host + 경로에서 숫자를 {n} 으로 바꾼 값
+      (예: https://a.com/goods/123?x=1 → a.com/goods/{n}), template 인자로 바꿀 수 있음
+    - ttl 이 지난 기록은 다시 기다리며 확인
+    - 여러 스크래퍼(드라이버 풀)에서 공유 가능
+
+    cache = SelectorMissCache()
+    scraper = SeniumScraper(driver, fast_lookup=True, miss_cache=cache)
+    """
+
+    def __init__(self, ttl: float = 600.0, max_entries: int = 10000, template=None):
+        """
+        :param ttl: 없던 selector 를 기억하는 시간 (초)
+        :param max_entries: 최대 기록 수 (넘으면 오래된 것부터 삭제)
+        :param template: URL 을 페이지 템플릿 문자열로 바꾸는 함수 (기본값: page_template)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.template = template or SelectorMissCache.page_template
+
+        self.hits = 0
+        self._misses = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def page_template(url) -> str:
+        if not url:
+            return ""
+
+        parts = urlsplit(url)
+        return f"{parts.netloc}{_DIGITS.sub('{n}', parts.path)}"
+
+    def is_absent(self, url, by, expression) -> bool:
+        key = (self.template(url), by, expression)
+
+        with self._lock:
+            marked_at = self._misses.get(key)
+            if marked_at is None:
+                return False
+
+            if time.monotonic() - marked_at > self.ttl:
+                del self._misses[key]
+                return False
+
+            self.hits += 1
+            return True
+
+    def mark_absent(self, url, by, expression) -> None:
+        key = (self.template(url), by, expression)
+
+        with self._lock:
+            self._misses[key] = time.monotonic()
+            self._misses.move_to_end(key)
+
+            while len(self._misses) > self.max_entries:
+                self._misses.popitem(last=False)
+
+    def mark_present(self, url, by, expression) -> None:
+        key = (self.template(url), by, expression)
+
+        with self._lock:
+            self._misses.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._misses), "hits": self.hits}
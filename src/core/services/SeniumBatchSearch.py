@@ -0,0 +1,351 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+from app.core.services.SeniumRunner import RunResult, SeniumRunner
+from app.core.services.SeniumScraper import SeniumScraper
+from app.core.utils import NetError
+from app.core.utils.Logger import Logger
+from app.core.utils.Metrics import metrics
+
+DIRECT = "direct"
+FORM = "form"
+
+# 이동을 시작하기 전에 현재 문서에 표시를 남겨, 표시가 사라지면 새 문서가 로드된 것으로 판단
+_MARK_SCRIPT = "window.__seniumSearchPending = true; return location.href;"
+_NAVIGATE_SCRIPT = "window.__seniumSearchPending = true; window.location.href = arguments[0];"
+_LOADED_SCRIPT = """
+return document.readyState === 'complete'
+    && (window.__seniumSearchPending === undefined || location.href !== arguments[0]);
+"""
+
+
+@dataclass
+class _Pending:
+    """
+    탭 하나에서 진행 중인 키워드 검색.
+    """
+
+    keyword: str
+    mode: str
+    url: Optional[str]
+    previous_url: Optional[str]
+    started: float
+
+
+class SeniumBatchSearch:
+    """
+    키워드 목록을 검색창(search_keyword_in_form)으로 검색하고 키워드별 결과를 끝나는 순서대로 yield.
+
+    - 검색 결과 페이지에 검색창이 있으면 폼 페이지를 다시 불러오지 않고 그대로 사용
+    - 검색 결과 URL 에서 키워드가 들어간 쿼리 파라미터(또는 경로)를 하나만 찾으면 후보로 두고,
+      다음 검색 결과 URL 과도 일치하면 이후 키워드는 폼 없이 결과 URL 로 바로 이동
+      (template 으로 직접 지정 가능, 예: "https://x.com/search?q={keyword}")
+    - run(): 드라이버 하나의 탭 여러 개에서 동시에 로드
+    - run_parallel(): SeniumRunner(드라이버 풀)에 키워드를 나눠 실행
+
+    def parse(scraper, keyword):
+        return scraper.extract_all("li.item", fields={"title": "text"})
+
+    search = SeniumBatchSearch(form_url, By.CSS_SELECTOR, "input[name=q]", handler=parse)
+    for run in search.run(scraper, keywords, tabs=4):
+        print(run.item, run.ok, run.result)
+    """
+
+    logger = Logger.lazy(
+        name="SeniumBatchSearch", log_file="SeniumBatchSearch.log", json_format=True
+    )
+
+    def __init__(
+        self,
+        form_url: str,
+        by,
+        expression: str,
+        handler=None,
+        template: Optional[str] = None,
+        detect_template: bool = True,
+        load_timeout: float = 15.0,
+        poll_interval: float = 0.05,
+    ):
+        """
+        :param form_url: 검색창이 있는 페이지 URL
+        :param by: 검색창을 찾을 방법 (예: By.CSS_SELECTOR)
+        :param expression: 검색창 selector
+        :param handler: 결과 페이지가 로드된 뒤 handler(scraper, keyword) 로 결과를 만드는 함수
+            (생략 시 {"url": 현재 URL, "title": 제목})
+        :param template: "{keyword}" 자리에 키워드가 들어가는 결과 URL (생략 시 검색 결과에서 감지)
+        :param detect_template: False 면 결과 URL 을 감지하지 않고 항상 검색창 사용
+        :param load_timeout: 키워드 하나의 결과 페이지 로드를 기다릴 최대 시간 (초)
+        :param poll_interval: 로드 완료를 확인하는 간격 (초)
+        """
+        SeniumScraper._validate_selenium_input(by=by, expression=expression, context="검색")
+
+        self.form_url = form_url
+        self.by = by
+        self.expression = expression
+        self.handler = handler or SeniumBatchSearch.page_summary
+        self.template = template
+        self._candidate = None
+        self.detect_template = detect_template
+        self.load_timeout = load_timeout
+        self.poll_interval = poll_interval
+
+    def url_for(self, keyword: str) -> Optional[str]:
+        """
+        결과 URL 템플릿이 있으면 키워드의 결과 URL, 없으면 None.
+        """
+        if not self.template:
+            return None
+
+        return self.template.format(keyword=quote(keyword, safe=""))
+
+    def run(self, scraper: SeniumScraper, keywords, tabs: int = 1):
+        """
+        scraper 의 드라이버에 탭을 tabs 개 열어 키워드를 나눠 검색하고 RunResult 를 끝나는 순서대로 yield.
+        handler 는 해당 탭으로 전환된 상태에서 호출되며, 반복이 끝나면 추가로 연 탭을 닫음.
+        반복 중에는 yield 된 결과만 사용하고 드라이버를 직접 조작하지 않아야 함.
+        """
+        driver = scraper.driver
+        keywords = iter(keywords)
+
+        main_handle = driver.current_window_handle
+        handles = [main_handle]
+        pending = {}
+
+        try:
+            for _ in range(max(1, tabs) - 1):
+                driver.switch_to.new_window("tab")
+                handles.append(driver.current_window_handle)
+
+            for handle in handles:
+                driver.switch_to.window(handle)
+                yield from self._start_next(scraper, keywords, pending, handle)
+
+            while pending:
+                ready = False
+
+                for handle in list(pending):
+                    driver.switch_to.window(handle)
+
+                    job = pending[handle]
+                    timed_out = time.monotonic() - job.started > self.load_timeout
+                    if not timed_out and not self._is_loaded(driver, job):
+                        continue
+
+                    ready = True
+                    del pending[handle]
+                    yield self._finish(scraper, job, timed_out=timed_out)
+                    yield from self._start_next(scraper, keywords, pending, handle)
+
+                if not ready:
+                    time.sleep(self.poll_interval)
+
+        finally:
+            for handle in handles[1:]:
+                try:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                except Exception as e:
+                    SeniumBatchSearch.logger.info(f"검색 탭 종료 중 예외: {e}")
+
+            try:
+                driver.switch_to.window(main_handle)
+            except Exception:
+                pass
+
+    def run_parallel(self, keywords, runner: SeniumRunner = None, workers: int = 4, state=None):
+        """
+        SeniumRunner 의 드라이버들에 키워드를 나눠 검색하고 RunResult 를 끝나는 순서대로 yield.
+        결과 URL 템플릿은 워커별로 첫 검색에서 감지 (process 모드는 프로세스마다 감지).
+        """
+        runner = runner or SeniumRunner(workers=workers)
+
+        return runner.run(keywords, self.search, state=state)
+
+    def search(self, scraper: SeniumScraper, keyword: str):
+        """
+        키워드 하나를 검색하고 결과 페이지가 로드되면 handler 결과를 반환 (SeniumRunner 작업 함수).
+        """
+        job = self._start(scraper, keyword)
+
+        timed_out = False
+        while not self._is_loaded(scraper.driver, job):
+            if time.monotonic() - job.started > self.load_timeout:
+                timed_out = True
+                break
+            time.sleep(self.poll_interval)
+
+        # run() 과 같이 시간초과도 _finish 에서 지표/로그/속도 제한기 보고를 남김
+        run = self._finish(scraper, job, timed_out=timed_out)
+        if not run.ok:
+            if timed_out:
+                raise TimeoutError(f"TimeoutError - {run.error}: {keyword}")
+            raise RuntimeError(run.error)
+
+        return run.result
+
+    def _start_next(self, scraper, keywords, pending, handle):
+        """
+        handle 탭에서 다음 키워드 검색을 시작. 시작부터 실패한 키워드는 바로 yield.
+        """
+        for keyword in keywords:
+            try:
+                pending[handle] = self._start(scraper, keyword)
+                return
+            except Exception as e:
+                SeniumBatchSearch.logger.exception(f"검색 시작 실패: {keyword}\nMsg: {e}")
+                yield RunResult(item=keyword, error=str(e))
+
+    def _start(self, scraper, keyword) -> _Pending:
+        """
+        결과 URL 로 이동하거나 검색창에 입력/제출하여 검색을 시작하고 바로 반환 (로드는 기다리지 않음).
+        """
+        if not keyword:
+            raise ValueError("ValueError - 검색에 사용되는 키워드 입력은 필수")
+
+        driver = scraper.driver
+        scraper.page_count += 1
+
+        url = self.url_for(keyword)
+        if url:
+            previous_url = driver.current_url
+
+            if scraper.rate_limiter:
+                with scraper.rate_limiter.limit(url):
+                    driver.execute_script(_NAVIGATE_SCRIPT, url)
+            else:
+                driver.execute_script(_NAVIGATE_SCRIPT, url)
+
+            return _Pending(keyword, DIRECT, url, previous_url, time.monotonic())
+
+        # 현재 페이지(이전 검색 결과 포함)에 검색창이 있으면 폼 페이지를 다시 불러오지 않음
+        if not driver.find_elements(self.by, self.expression):
+            scraper.goto(self.form_url)
+            metrics.inc("senium.search.form_load")
+
+        previous_url = driver.execute_script(_MARK_SCRIPT)
+
+        if scraper.rate_limiter:
+            with scraper.rate_limiter.limit(self.form_url):
+                submitted = scraper.search_keyword_in_form(keyword, self.by, self.expression)
+        else:
+            submitted = scraper.search_keyword_in_form(keyword, self.by, self.expression)
+
+        if not submitted:
+            raise RuntimeError(f"RuntimeError - 검색창 입력 실패: {keyword}")
+
+        return _Pending(keyword, FORM, None, previous_url, time.monotonic())
+
+    def _is_loaded(self, driver, job) -> bool:
+        try:
+            return bool(driver.execute_script(_LOADED_SCRIPT, job.previous_url))
+        except Exception:
+            # 이동 직후 문서가 교체되는 중에는 스크립트 실행이 실패할 수 있음
+            return False
+
+    def _finish(self, scraper, job, timed_out: bool = False) -> RunResult:
+        elapsed_ms = round((time.monotonic() - job.started) * 1000, 1)
+        error_class = NetError.TIMEOUT if timed_out else None
+
+        if scraper.rate_limiter:
+            scraper.rate_limiter.report(job.url or self.form_url, error_class=error_class)
+
+        metrics.observe("senium.search", elapsed_ms, mode=job.mode, error_class=error_class)
+        Logger.event(
+            SeniumBatchSearch.logger,
+            "키워드 검색",
+            keyword=job.keyword,
+            mode=job.mode,
+            url=job.url,
+            duration_ms=elapsed_ms,
+            error_class=error_class,
+        )
+
+        if timed_out:
+            return RunResult(
+                item=job.keyword, error=f"검색 결과 로드 시간초과 ({self.load_timeout}초)"
+            )
+
+        if job.mode == FORM and self.detect_template and not self.template:
+            self._observe_result_url(scraper.driver.current_url, job.keyword)
+
+        try:
+            return RunResult(item=job.keyword, result=self.handler(scraper, job.keyword))
+        except Exception as e:
+            SeniumBatchSearch.logger.exception(f"검색 결과 처리 실패: {job.keyword}\nMsg: {e}")
+            return RunResult(item=job.keyword, error=str(e))
+
+    def _observe_result_url(self, url: str, keyword: str):
+        """
+        폼 검색 결과 URL 로 템플릿 후보를 만들고, 다음 폼 검색 결과 URL 이 후보와 일치하면 확정.
+        잘못 감지한 템플릿으로 이후 키워드가 조용히 다른 파라미터로 보내지는 것을 막기 위해 두 번 확인.
+        """
+        if self._candidate:
+            expected = self._candidate.format(keyword=quote(keyword, safe=""))
+            if _same_url(expected, url):
+                self.template = self._candidate
+                SeniumBatchSearch.logger.info(f"검색 결과 URL 확정: {self.template}")
+                return
+
+        self._candidate = SeniumBatchSearch.learn_template(url, keyword)
+
+    @staticmethod
+    def learn_template(url: str, keyword: str) -> Optional[str]:
+        """
+        검색 결과 URL 에서 값이 키워드인 쿼리 파라미터 또는 경로 조각을 "{keyword}" 로 바꾼 템플릿.
+        일치하는 곳이 정확히 하나가 아니면 (없거나 여러 곳) None.
+        """
+        parts = urlsplit(url)
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        segments = parts.path.split("/")
+        # 대소문자만 다른 값도 일치로 세어 애매한 경우(예: q=A&sort=a)를 걸러냄
+        target = keyword.strip().casefold()
+
+        query_hits = {i for i, (_, value) in enumerate(params) if value.strip().casefold() == target}
+        path_hits = {
+            i
+            for i, segment in enumerate(segments)
+            if segment and unquote(segment).strip().casefold() == target
+        }
+
+        if len(query_hits) + len(path_hits) != 1:
+            return None
+
+        query = [
+            f"{quote(name, safe='')}={{keyword}}"
+            if i in query_hits
+            else _escape(urlencode([(name, value)]))
+            for i, (name, value) in enumerate(params)
+        ]
+        path = "/".join(
+            "{keyword}" if i in path_hits else _escape(segment)
+            for i, segment in enumerate(segments)
+        )
+
+        return urlunsplit((parts.scheme, _escape(parts.netloc), path, "&".join(query), ""))
+
+    @staticmethod
+    def page_summary(scraper, keyword):
+        return {"url": scraper.driver.current_url, "title": scraper.driver.title}
+
+
+def _same_url(left: str, right: str) -> bool:
+    """
+    인코딩 차이(+, %20 등)와 쿼리 파라미터 순서를 무시하고 같은 URL 인지 비교.
+    """
+
+    def normalize(url):
+        parts = urlsplit(url)
+        return (
+            parts.scheme,
+            parts.netloc.lower(),
+            unquote(parts.path),
+            sorted(parse_qsl(parts.query, keep_blank_values=True)),
+        )
+
+    return normalize(left) == normalize(right)
+
+
+def _escape(text: str) -> str:
+    # str.format 에서 "{keyword}" 외의 중괄호가 해석되지 않도록 이스케이프
+    return text.replace("{", "{{").replace("}", "}}")
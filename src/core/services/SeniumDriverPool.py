@@ -0,0 +1,227 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from app.core.services.MemoryWatchdog import MemoryWatchdog
+from app.core.services.SeniumScraper import MAX_REQUEST, SeniumScraper
+
+
+def create_headless_chrome():
+    """
+    풀 기본 드라이버 생성 함수. 프로세스 실행기에서도 쓰이도록 모듈 최상위에 정의.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+
+    return webdriver.Chrome(options=options)
+
+
+class SeniumDriverPool:
+    """
+    헤드리스 Chrome 드라이버 N 개를 띄워두고 SeniumScraper 로 감싸 빌려주는 풀.
+    반납 시 상태를 확인하여 죽었거나, 처리한 페이지 수/메모리가 기준을 넘은 드라이버는 새로 띄움.
+
+    with SeniumDriverPool(size=4) as pool:
+        with pool.lease() as scraper:
+            scraper.goto(url)
+    """
+
+    def __init__(
+        self,
+        size: int = MAX_REQUEST,
+        driver_factory=create_headless_chrome,
+        max_pages_per_driver: int = 200,
+        max_rss_mb: float = None,
+        rate_limiter=None,
+        scraper_options: dict = None,
+        watchdog: MemoryWatchdog = None,
+    ):
+        """
+        :param size: 유지할 드라이버 수
+        :param driver_factory: 인자 없이 호출하면 webdriver.Chrome 을 반환하는 함수
+        :param max_pages_per_driver: 드라이버 하나가 goto 할 수 있는 페이지 수, 넘으면 재시작
+        :param max_rss_mb: 브라우저 프로세스 트리 RSS 상한 (psutil 필요, None 이면 검사 안 함)
+        :param rate_limiter: 빌려주는 스크래퍼들이 공유할 ThreadRateLimiter (선택)
+        :param scraper_options: SeniumScraper 에 전달할 추가 옵션
+            (예: {"fast_lookup": True, "miss_cache": SelectorMissCache()} 로 캐시 공유)
+        :param watchdog: 반납 시 페이지 수/RSS/JS 힙으로 재시작 여부를 판단할 MemoryWatchdog
+            (생략 시 max_pages_per_driver, max_rss_mb 로 생성)
+        """
+        if size < 1:
+            raise ValueError("ValueError - 드라이버 풀 크기는 1 이상이어야 함")
+
+        self.size = size
+        self.driver_factory = driver_factory
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_rss_mb = max_rss_mb
+        self.rate_limiter = rate_limiter
+        self.scraper_options = scraper_options or {}
+        self.watchdog = watchdog or MemoryWatchdog(
+            max_rss_mb=max_rss_mb, max_pages=max_pages_per_driver, check_every=1
+        )
+
+        self.recycled = 0
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+        self._closed = True
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """
+        드라이버들을 병렬로 실행. Chrome 시작 시간이 길어 순차 실행 대비 size 배 빠름.
+        """
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._create) for _ in range(self.size)]
+
+        drivers, errors = [], []
+        for future in futures:
+            try:
+                drivers.append(future.result())
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            # 일부만 실행된 경우 이미 띄운 드라이버를 종료하여 Chrome 프로세스가 남지 않게 함
+            self.close()
+            raise errors[0]
+
+        for driver in drivers:
+            self._idle.put((driver, 0))
+
+        self._closed = False
+
+    def close(self):
+        self._closed = True
+
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+
+        for driver in drivers:
+            SeniumDriverPool._quit(driver)
+
+    @contextmanager
+    def lease(self, timeout: float = None):
+        """
+        대기 중인 드라이버를 SeniumScraper 로 감싸 빌려줌.
+        :param timeout: 빈 드라이버를 기다릴 최대 시간 (초, None 이면 무한 대기)
+        """
+        if self._closed:
+            raise RuntimeError("RuntimeError - 드라이버 풀이 시작되지 않았거나 종료됨")
+
+        driver, pages = self._idle.get(timeout=timeout)
+
+        try:
+            if driver is None:
+                driver, pages = self._create(), 0
+            elif not SeniumDriverPool._is_healthy(driver):
+                SeniumScraper.logger.info("응답 없는 드라이버 교체")
+                driver, pages = self._replace(driver), 0
+        except Exception:
+            # 생성 실패: 풀 크기가 줄지 않도록 자리표시를 돌려놓아 다음 대여에서 다시 생성
+            self._idle.put((None, 0))
+            raise
+
+        scraper = SeniumScraper(
+            driver, rate_limiter=self.rate_limiter, **self.scraper_options
+        )
+        try:
+            yield scraper
+        finally:
+            pages += scraper.page_count
+            self._release(driver, pages)
+
+    def _release(self, driver, pages):
+        if self._closed:
+            SeniumDriverPool._quit(driver)
+            return
+
+        if not SeniumDriverPool._is_healthy(driver):
+            SeniumScraper.logger.info("드라이버 재시작 (응답 없음)")
+            self._idle.put((self._replace_or_placeholder(driver), 0))
+            return
+
+        # 메모리 측정은 check_every 페이지마다, 페이지 수 기준은 매번 확인
+        sample = None
+        if self.watchdog.due(driver, pages):
+            sample = MemoryWatchdog.sample_driver(driver)
+
+        reason = self.watchdog.check(pages, sample)
+        if reason:
+            if sample is None and self.watchdog.samples_memory:
+                sample = MemoryWatchdog.sample_driver(driver)
+
+            driver = self._replace_or_placeholder(driver)
+            after = MemoryWatchdog.sample_driver(driver) if sample and driver else None
+            self.watchdog.record_recycle("senium", reason, sample, after, pages=pages)
+            pages = 0
+
+        self._idle.put((driver, pages))
+
+    def _create(self):
+        driver = self.driver_factory()
+
+        with self._lock:
+            self._drivers.append(driver)
+
+        return driver
+
+    def _replace(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+
+        self.watchdog.forget(driver)
+
+        SeniumDriverPool._quit(driver)
+        self.recycled += 1
+
+        return self._create()
+
+    def _replace_or_placeholder(self, driver):
+        """
+        반납 중 교체. 새 드라이버 생성에 실패하면 None(자리표시)을 반환하여 다음 대여에서 다시 생성.
+        """
+        try:
+            return self._replace(driver)
+        except Exception as e:
+            SeniumScraper.logger.exception(f"드라이버 재생성 실패, 다음 대여에서 재시도\nMsg: {e}")
+            return None
+
+    @staticmethod
+    def driver_rss_mb(driver):
+        """
+        chromedriver 와 하위 브라우저 프로세스들의 RSS 합계 (MB). psutil 이 없으면 None.
+        """
+        try:
+            return MemoryWatchdog.process_rss_mb([driver.service.process.pid])
+        except Exception:
+            return None
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            SeniumScraper.logger.info(f"드라이버 종료 중 예외: {e}")
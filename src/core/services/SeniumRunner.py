@@ -0,0 +1,159 @@
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Any, Optional
+from app.core.services.CrawlState import CrawlState
+from app.core.services.SeniumDriverPool import SeniumDriverPool, create_headless_chrome
+from app.core.services.SeniumScraper import MAX_REQUEST, SeniumScraper
+
+THREAD = "thread"
+PROCESS = "process"
+
+# 프로세스 실행기의 워커 프로세스마다 하나씩 생성되는 드라이버 풀
+_process_pool = None
+
+
+@dataclass
+class RunResult:
+    """
+    작업 하나의 결과. 예외가 발생하면 error 에 메시지가 담김.
+    changed 는 CrawlState 를 사용할 때 이전 실행의 결과와 달라졌는지 여부.
+    """
+
+    item: Any
+    result: Any = None
+    error: Optional[str] = None
+    changed: Optional[bool] = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class SeniumRunner:
+    """
+    키워드/URL 목록을 드라이버 풀에 나눠 task(scraper, item) 를 병렬 실행하고
+    끝나는 순서대로 RunResult 를 yield.
+
+    - mode="thread": 한 프로세스 안에서 SeniumDriverPool 을 공유 (Selenium 작업은 대부분 I/O 대기)
+    - mode="process": 워커 프로세스마다 드라이버를 하나씩 보유 (결과 파싱이 무거운 경우)
+      이 경우 task, driver_factory 는 pickle 가능한 모듈 최상위 함수여야 함
+
+    def scrape(scraper, keyword):
+        scraper.goto(f"https://example.com/search?q={keyword}")
+        return scraper.extract_all("li.item", fields={"title": "text"})
+
+    for run in SeniumRunner(workers=4).run(keywords, scrape):
+        print(run.item, run.ok)
+    """
+
+    def __init__(
+        self,
+        workers: int = MAX_REQUEST,
+        mode: str = THREAD,
+        driver_factory=create_headless_chrome,
+        **pool_options,
+    ):
+        """
+        :param workers: 동시에 실행할 드라이버 수
+        :param mode: "thread" 또는 "process"
+        :param driver_factory: 드라이버 생성 함수
+        :param pool_options: SeniumDriverPool 에 전달할 추가 옵션 (max_pages_per_driver 등)
+        """
+        if mode not in (THREAD, PROCESS):
+            raise ValueError(f"ValueError - 지원하지 않는 실행 모드: {mode}")
+
+        self.workers = workers
+        self.mode = mode
+        self.driver_factory = driver_factory
+        self.pool_options = pool_options
+
+    def run(self, items, task, state=None):
+        """
+        :param items: 처리할 항목 이터러블 (한 번에 workers * 2 개까지만 제출하여 메모리 일정)
+        :param task: task(scraper, item) 형태의 함수
+        :param state: CrawlState 지정 시 이미 성공한 항목은 건너뛰고 결과를 기록 (키는 str(item))
+            task 는 항상 실행되며 changed 는 task 결과를 이전 결과와 비교한 값
+            (다시 실행하는 비용은 state.max_age 로 줄임)
+        """
+        if not state:
+            yield from self._execute(items, task)
+            return
+
+        items = (item for item in items if state.should_visit(str(item)))
+
+        for run in self._execute(items, task):
+            run.changed = state.record(
+                str(run.item),
+                run.ok,
+                content_hash=CrawlState.content_hash(run.result) if run.ok else None,
+                data=run.result,
+            )
+            yield run
+
+    def _execute(self, items, task):
+        if self.mode == THREAD:
+            pool = SeniumDriverPool(
+                size=self.workers, driver_factory=self.driver_factory, **self.pool_options
+            )
+            with pool, ThreadPoolExecutor(max_workers=self.workers) as executor:
+                yield from self._drain(executor, items, _run_with_pool, pool, task)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_process,
+                initargs=(self.driver_factory, self.pool_options),
+            ) as executor:
+                yield from self._drain(executor, items, _run_in_process, task)
+
+    def _drain(self, executor, items, fn, *args):
+        """
+        제출 중인 작업 수를 workers * 2 로 제한하면서 완료된 결과부터 yield.
+        """
+        limit = self.workers * 2
+        pending = {}
+
+        for item in items:
+            pending[executor.submit(fn, *args, item)] = item
+
+            if len(pending) >= limit:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield SeniumRunner._to_result(pending.pop(future), future)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield SeniumRunner._to_result(pending.pop(future), future)
+
+    @staticmethod
+    def _to_result(item, future):
+        try:
+            return RunResult(item=item, result=future.result())
+        except Exception as e:
+            SeniumScraper.logger.exception(f"작업 실패: {item}\nMsg: {e}")
+            return RunResult(item=item, error=str(e))
+
+
+def _run_with_pool(pool, task, item):
+    with pool.lease() as scraper:
+        return task(scraper, item)
+
+
+def _init_process(driver_factory, pool_options):
+    global _process_pool
+    from multiprocessing.util import Finalize
+
+    _process_pool = SeniumDriverPool(size=1, driver_factory=driver_factory, **pool_options)
+    _process_pool.start()
+
+    # 워커 프로세스 종료 시 드라이버도 함께 종료
+    Finalize(None, _process_pool.close, exitpriority=10)
+
+
+def _run_in_process(task, item):
+    return _run_with_pool(_process_pool, task, item)
@@ -1,34 +1,209 @@
-import traceback
-from datetime import datetime
+import logging
 import time
-from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
 from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from app.core.services.SelectorMissCache import SelectorMissCache
+from app.core.utils.LazyImport import LazyImport
 from app.core.utils.Logger import Logger
+from app.core.utils import NetError
+from app.core.utils.Metrics import metrics
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+# selenium.webdriver 는 import 만으로 모든 브라우저 드라이버를 불러오므로 처음 사용할 때 import
+WebDriverWait = LazyImport("selenium.webdriver.support.ui", "WebDriverWait")
+EC = LazyImport("selenium.webdriver.support.expected_conditions")
+By = LazyImport("selenium.webdriver.common.by", "By")
+exceptions = LazyImport("selenium.common.exceptions")
 
 MAX_REQUEST = 10
 
+# extract_all 에서 한 번의 execute_script 로 모든 매칭 요소의 필드를 수집하는 스크립트
+_EXTRACT_ALL_SCRIPT = """
+const [by, selector, fields, root] = arguments;
+
+function query(scope, sel) {
+    if (by === 'xpath') {
+        const snapshot = document.evaluate(
+            sel, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const found = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            found.push(snapshot.snapshotItem(i));
+        }
+        return found;
+    }
+    return Array.from(scope.querySelectorAll(sel));
+}
+
+function read(el, attr) {
+    if (!el) return null;
+    if (attr === 'text') return (el.innerText || el.textContent || '').trim();
+    if (attr === 'html') return el.innerHTML;
+    if (attr === 'href' || attr === 'src') return el[attr] || el.getAttribute(attr);
+    if (attr.startsWith('@')) return el.getAttribute(attr.slice(1));
+    const value = el[attr];
+    return value === undefined ? null : value;
+}
+
+function children(el, sel) {
+    return sel ? Array.from(el.querySelectorAll(sel)) : [el];
+}
+
+function extract(el, specs) {
+    const record = {};
+    for (const spec of specs) {
+        if (spec.fields) {
+            record[spec.name] = children(el, spec.selector).map(c => extract(c, spec.fields));
+        } else if (spec.all) {
+            record[spec.name] = children(el, spec.selector).map(c => read(c, spec.attr));
+        } else {
+            record[spec.name] = read(spec.selector ? el.querySelector(spec.selector) : el, spec.attr);
+        }
+    }
+    return record;
+}
+
+return query(root || document, selector).map(el => extract(el, fields));
+"""
+
+# 페이지 끝으로 스크롤한 뒤 DOM 변경이 멈출 때까지(또는 timeout) 기다리는 비동기 스크립트.
+# 변경이 시작된 뒤에는 리소스 로드 완료도 활동으로 간주하여 네트워크가 잠잠해질 때까지 대기.
+_WAIT_FOR_GROWTH_SCRIPT = """
+const [timeoutMs, quietMs, itemSelector] = arguments;
+const done = arguments[arguments.length - 1];
+
+const count = () => itemSelector ? document.querySelectorAll(itemSelector).length : null;
+const startHeight = document.body.scrollHeight;
+const startCount = count();
+const started = performance.now();
+let lastActivity = null;
+
+const observer = new MutationObserver(() => { lastActivity = performance.now(); });
+observer.observe(document.body, { childList: true, subtree: true });
+
+let resources = null;
+try {
+    resources = new PerformanceObserver(() => {
+        if (lastActivity !== null) lastActivity = performance.now();
+    });
+    resources.observe({ type: 'resource' });
+} catch (e) {}
+
+window.scrollTo(0, document.body.scrollHeight);
+
+const timer = setInterval(() => {
+    const now = performance.now();
+    const settled = lastActivity !== null && now - lastActivity >= quietMs;
+
+    if (settled || now - started >= timeoutMs) {
+        clearInterval(timer);
+        observer.disconnect();
+        if (resources) resources.disconnect();
+
+        const height = document.body.scrollHeight;
+        const itemCount = count();
+        done({
+            start_count: startCount,
+            count: itemCount,
+            height: height,
+            grew: height > startHeight || (itemCount !== null && itemCount > startCount),
+            settled: settled,
+            waited_ms: now - started,
+        });
+    }
+}, 50);
+"""
+
 
 class SeniumScraper:
 
-    logger = Logger(
-        name="SeniumScraper", log_file="SeniumScraper.log"
-    ).get_logger()
+    logger = Logger.lazy(
+        name="SeniumScraper", log_file="SeniumScraper.log", json_format=True
+    )
 
-    def __init__(self, driver: webdriver.Chrome):
+    def __init__(
+        self,
+        driver: "webdriver.Chrome",
+        rate_limiter=None,
+        fast_lookup: bool = False,
+        poll_frequency: float = 0.1,
+        miss_cache=None,
+    ):
+        """
+        :param driver: 사용할 Chrome 드라이버
+        :param rate_limiter: goto 에 적용할 ThreadRateLimiter (선택, 여러 스크래퍼가 공유 가능)
+        :param fast_lookup: True 면 find_element 류가 대기 없이 먼저 확인하고, 짧은 간격으로 폴링하며,
+            같은 페이지 템플릿에서 없던 selector 는 기다리지 않음 (없으면 예외 로그 대신 info 로그)
+        :param poll_frequency: fast_lookup 의 기본 폴링 간격 (초)
+        :param miss_cache: 공유할 SelectorMissCache (fast_lookup 에서 생략 시 스크래퍼 전용으로 생성)
+        """
         self.driver = driver
         self.target_link = None
+        self.rate_limiter = rate_limiter
+        self.page_count = 0
+
+        self.fast_lookup = fast_lookup
+        self.poll_frequency = poll_frequency
+        self.miss_cache = miss_cache
+        if fast_lookup and miss_cache is None:
+            self.miss_cache = SelectorMissCache()
+        self.selector_timeouts = {}
+
+    def tune_selector(self, expression, timeout=None, poll_frequency=None):
+        """
+        fast_lookup 에서 특정 selector 의 대기 시간/폴링 간격을 지정.
+        (예: 거의 항상 있는 요소는 길게, 선택적인 요소는 짧게)
+        """
+        self.selector_timeouts[expression] = (timeout, poll_frequency)
 
     def goto(self, url):
         self.target_link = url
-        self.driver.get(url)
+        self.page_count += 1
+
+        if not self.rate_limiter:
+            self._get(url)
+            self.driver.maximize_window()
+            return
+
+        with self.rate_limiter.limit(url):
+            try:
+                self._get(url)
+            except Exception as e:
+                self.rate_limiter.report(
+                    url, error_class=SeniumScraper._classify_error(e)
+                )
+                raise
+
+        self.rate_limiter.report(url)
         self.driver.maximize_window()
 
+    def _get(self, url):
+        """
+        driver.get 후 소요 시간을 지표로 남기고 "페이지 이동" 로그를 기록
+        (성공은 DEBUG, 실패는 ERROR 이며 예외는 그대로 전달).
+        """
+        started = time.perf_counter()
+        error_class = None
+
+        try:
+            self.driver.get(url)
+        except Exception as e:
+            error_class = SeniumScraper._classify_error(e)
+            raise
+        finally:
+            elapsed_ms = SeniumScraper._elapsed_ms(started)
+            metrics.observe("senium.goto", elapsed_ms, error_class=error_class)
+            Logger.event(
+                SeniumScraper.logger,
+                "페이지 이동",
+                level=logging.ERROR if error_class else logging.DEBUG,
+                url=url,
+                duration_ms=elapsed_ms,
+                error_class=error_class,
+            )
+
     def search_keyword_in_form(self, keyword, by, expression):
         if not keyword:
             raise ValueError("ValueError - 검색에 사용되는 키워드 입력은 필수")
@@ -44,18 +219,43 @@ class SeniumScraper:
                 element_description="검색창 폼",
             )
             if not search_box:
-                self.logger(f"{expression} 에 해당하는 검색창 폼 엘리멘트 없음")
+                self.logger.info(f"{expression} 에 해당하는 검색창 폼 엘리멘트 없음")
                 return False
 
+            # 이전 검색 결과 페이지의 검색창을 재사용할 때 남아 있는 키워드를 지움
+            search_box.clear()
             search_box.send_keys(keyword)
             search_box.submit()
             return True
         except Exception as e:
             SeniumScraper.handle_exception(
-                expression=expression, context="검색창 폼 엘리멘트", exception=e
+                expression=expression,
+                context="검색창 폼 엘리멘트",
+                exception=e,
+                url=self.target_link,
             )
             return False
 
+    def search_keywords(
+        self, keywords, by, expression, form_url=None, handler=None, tabs: int = 1, **options
+    ):
+        """
+        키워드 목록을 검색창으로 검색하고 키워드별 RunResult 를 끝나는 순서대로 yield.
+        검색창을 재사용하고, 결과 URL 형식이 감지되면 폼 없이 바로 이동하며, tabs 개의 탭에서 동시에 로드.
+        자세한 옵션은 app.core.services.SeniumBatchSearch 참고.
+
+        :param form_url: 검색창이 있는 페이지 URL (생략 시 마지막으로 이동한 페이지)
+        :param handler: 결과 페이지에서 handler(scraper, keyword) 로 결과를 만드는 함수
+        """
+        from app.core.services.SeniumBatchSearch import SeniumBatchSearch
+
+        search = SeniumBatchSearch(
+            form_url or self.target_link, by, expression, handler=handler, **options
+        )
+
+        return search.run(self, keywords, tabs=tabs)
+
+    @metrics.timed("senium.find_element")
     def find_element(
         self,
         by,
@@ -67,11 +267,16 @@ class SeniumScraper:
             by=by, expression=expression, context="검색"
         )
 
+        started = time.perf_counter()
         try:
 
-            element = WebDriverWait(self.driver, timeout=timeout).until(
-                EC.presence_of_element_located((by, expression))
-            )
+            if self.fast_lookup:
+                elements = self._fast_find(self.driver, by, expression, timeout)
+                element = elements[0] if elements else None
+            else:
+                element = WebDriverWait(self.driver, timeout=timeout).until(
+                    EC.presence_of_element_located((by, expression))
+                )
 
             if not element:
                 self.logger.info(f"{expression} 에 해당되는 엘리멘트 없음")
@@ -81,11 +286,16 @@ class SeniumScraper:
 
         except Exception as e:
             SeniumScraper.handle_exception(
-                expression=expression, context=element_description, exception=e
+                expression=expression,
+                context=element_description,
+                exception=e,
+                url=self.target_link,
+                duration_ms=SeniumScraper._elapsed_ms(started),
             )
 
             return None
 
+    @metrics.timed("senium.find_all_element")
     def find_all_element(
         self,
         by,
@@ -97,11 +307,15 @@ class SeniumScraper:
             by=by, expression=expression, context="검색"
         )
 
+        started = time.perf_counter()
         try:
 
-            elements = WebDriverWait(self.driver, timeout=timeout).until(
-                EC.presence_of_all_elements_located((by, expression))
-            )
+            if self.fast_lookup:
+                elements = self._fast_find(self.driver, by, expression, timeout)
+            else:
+                elements = WebDriverWait(self.driver, timeout=timeout).until(
+                    EC.presence_of_all_elements_located((by, expression))
+                )
 
             if not elements:
                 self.logger.info(f"{expression} 에 해당되는 엘리멘트들 없음")
@@ -111,7 +325,11 @@ class SeniumScraper:
 
         except Exception as e:
             SeniumScraper.handle_exception(
-                expression=expression, context=element_description, exception=e
+                expression=expression,
+                context=element_description,
+                exception=e,
+                url=self.target_link,
+                duration_ms=SeniumScraper._elapsed_ms(started),
             )
 
             return None
@@ -124,7 +342,16 @@ class SeniumScraper:
         element_description="multiple element정의되지않은-엘레멘트들",
         timeout=10,
     ):
+        started = time.perf_counter()
         try:
+            if self.fast_lookup:
+                children = self._fast_find(parent, by, expression, timeout)
+                if not children:
+                    self.logger.info(f"{expression} 에 해당되는 엘리멘트 없음")
+                    return None
+
+                return children[0]
+
             children = WebDriverWait(parent, timeout=timeout).until(
                 EC.presence_of_element_located((by, expression))
             )
@@ -133,11 +360,176 @@ class SeniumScraper:
 
         except Exception as e:
             SeniumScraper.handle_exception(
-                expression=expression, context=element_description, exception=e
+                expression=expression,
+                context=element_description,
+                exception=e,
+                url=self.target_link,
+                duration_ms=SeniumScraper._elapsed_ms(started),
             )
 
             return None
 
+    def _fast_find(self, scope, by, expression, timeout):
+        """
+        fast_lookup 의 요소 탐색. 못 찾으면 예외 대신 빈 리스트를 반환.
+        1. find_elements 로 대기 없이 확인
+        2. 같은 페이지 템플릿에서 없던 selector 면 기다리지 않고 포기
+        3. 그 외에는 selector 별 대기 시간/폴링 간격으로 기다린 뒤 결과를 캐시에 기록
+        """
+        url = self.target_link
+
+        elements = scope.find_elements(by, expression)
+        if elements:
+            self.miss_cache.mark_present(url, by, expression)
+            return elements
+
+        if self.miss_cache.is_absent(url, by, expression):
+            metrics.inc("senium.cached_miss")
+            return []
+
+        tuned_timeout, tuned_poll = self.selector_timeouts.get(expression, (None, None))
+
+        try:
+            elements = WebDriverWait(
+                scope,
+                timeout=timeout if tuned_timeout is None else tuned_timeout,
+                poll_frequency=tuned_poll or self.poll_frequency,
+            ).until(lambda s: s.find_elements(by, expression))
+        except exceptions.TimeoutException:
+            elements = []
+
+        if elements:
+            self.miss_cache.mark_present(url, by, expression)
+        else:
+            self.miss_cache.mark_absent(url, by, expression)
+            metrics.inc("senium.miss")
+
+        return elements
+
+    def extract_all(
+        self,
+        selector,
+        fields,
+        by=None,
+        parent=None,
+        columnar=False,
+        timeout=None,
+        element_description="일괄추출-엘레멘트들",
+    ):
+        """
+        selector 에 매칭되는 모든 요소의 필드를 execute_script 한 번으로 수집.
+        WebElement 마다 .text / .get_attribute 를 호출하는 왕복 비용을 없앰.
+
+        fields 값 형식 (자식 selector 는 CSS 기준):
+            "text" | "html" | "href" | "src" | "@속성명" | "DOM 프로퍼티명"  - 요소 자신의 값
+            (자식selector, 위 형식)                                        - 첫 번째 자식의 값
+            (자식selector, 위 형식, True)                                  - 모든 자식 값의 리스트
+            {"selector": 자식selector, "fields": {...}}                     - 자식마다 중첩 dict 리스트
+
+        예:
+            scraper.extract_all(
+                "li.item",
+                fields={
+                    "title": (".title", "text"),
+                    "link": ("a", "href"),
+                    "image": ("img", "@data-src"),
+                    "tags": (".tag", "text", True),
+                    "options": {"selector": ".option", "fields": {"name": "text"}},
+                },
+            )
+
+        :param selector: 대상 요소 selector
+        :param fields: 필드 이름 → 추출 방식 dict
+        :param by: By.CSS_SELECTOR(기본값) 또는 By.XPATH
+        :param parent: 검색 범위로 사용할 WebElement (기본값: document)
+        :param columnar: True 면 {필드: [값...]} 형태로 반환
+        :param timeout: 지정 시 첫 요소가 나타날 때까지 최대 timeout 초 대기
+        :return: dict 리스트 (columnar 면 dict), 예외 발생 시 None
+        """
+        by = by or By.CSS_SELECTOR
+
+        SeniumScraper._validate_selenium_input(
+            by=by, expression=selector, context="일괄추출"
+        )
+
+        if by not in (By.CSS_SELECTOR, By.XPATH):
+            raise ValueError(
+                "ValueError - 일괄추출은 By.CSS_SELECTOR 또는 By.XPATH 만 지원"
+            )
+
+        specs = SeniumScraper._normalize_fields(fields)
+        started = time.perf_counter()
+
+        try:
+            if timeout:
+                WebDriverWait(parent or self.driver, timeout=timeout).until(
+                    EC.presence_of_element_located((by, selector))
+                )
+
+            records = self.driver.execute_script(
+                _EXTRACT_ALL_SCRIPT,
+                "xpath" if by == By.XPATH else "css",
+                selector,
+                specs,
+                parent,
+            )
+
+        except Exception as e:
+            SeniumScraper.handle_exception(
+                expression=selector,
+                context=element_description,
+                exception=e,
+                url=self.target_link,
+                duration_ms=SeniumScraper._elapsed_ms(started),
+            )
+
+            return None
+
+        if not records:
+            self.logger.info(f"{selector} 에 해당되는 엘리멘트들 없음")
+
+        if columnar:
+            return {
+                spec["name"]: [record[spec["name"]] for record in records]
+                for spec in specs
+            }
+
+        return records
+
+    @staticmethod
+    def _normalize_fields(fields):
+        """
+        extract_all 의 fields 를 스크립트에 전달할 리스트 형태로 변환.
+        """
+        if not fields:
+            raise ValueError("ValueError - 일괄추출에 사용되는 'fields'는 필수")
+
+        specs = []
+        for name, spec in fields.items():
+            if isinstance(spec, str):
+                specs.append({"name": name, "selector": None, "attr": spec, "all": False})
+            elif isinstance(spec, (tuple, list)) and len(spec) in (2, 3):
+                specs.append(
+                    {
+                        "name": name,
+                        "selector": spec[0],
+                        "attr": spec[1],
+                        "all": bool(spec[2]) if len(spec) == 3 else False,
+                    }
+                )
+            elif isinstance(spec, dict) and "fields" in spec:
+                specs.append(
+                    {
+                        "name": name,
+                        "selector": spec.get("selector"),
+                        "fields": SeniumScraper._normalize_fields(spec["fields"]),
+                    }
+                )
+            else:
+                raise ValueError(f"ValueError - '{name}' 필드 형식이 올바르지 않음: {spec}")
+
+        return specs
+
     @contextmanager
     def switch_to_iframe(self, timeout=10):
         """
@@ -179,8 +571,21 @@ class SeniumScraper:
             return False
 
     def scroll_with_more_btn(
-        self, by, expression, max_scroll_attempts=10, timeout=10, sleep_for_loading=1
+        self,
+        by,
+        expression,
+        max_scroll_attempts=10,
+        timeout=10,
+        sleep_for_loading=1,
+        mode="sleep",
+        item_selector=None,
     ):
+        """
+        더보기 버튼을 반복 클릭하며 목록을 끝까지 불러오는 메서드.
+        - mode: "sleep" 은 기존 고정 대기, "observe" 는 scroll_page_to_end 의 이벤트 기반 대기
+          ("observe" 에서는 클릭 후 새 항목이 더 이상 생기지 않으면 바로 중지)
+        - item_selector: "observe" 에서 새 항목 수를 셀 CSS selector
+        """
         element_description = "더보기버튼"
 
         more_btn = None
@@ -205,21 +610,61 @@ class SeniumScraper:
 
         scroll_attempts = 0
         while scroll_attempts < max_scroll_attempts:
-            self.scroll_page_to_end(sleep=sleep_for_loading)
+            before = self.scroll_page_to_end(
+                sleep=sleep_for_loading, mode=mode, item_selector=item_selector
+            )
 
             more_btn.click()
 
-            self.scroll_page_to_end(sleep=sleep_for_loading)
+            after = self.scroll_page_to_end(
+                sleep=sleep_for_loading, mode=mode, item_selector=item_selector
+            )
 
             scroll_attempts += 1
+
+            # 클릭 직후 관찰 시작 전에 로드가 끝난 경우도 잡기 위해 클릭 전후 상태를 비교
+            if mode == "observe" and (
+                after["height"] <= before["height"]
+                and (after["count"] or 0) <= (before["count"] or 0)
+            ):
+                self.logger.info(
+                    f"더보기 클릭 후 새 항목 없음, 중지 (클릭 횟수: {scroll_attempts})"
+                )
+                break
         return True
 
-    def scroll_page_to_end(self, sleep=0.5, max_attempts=10):
+    @metrics.timed("senium.scroll_page_to_end")
+    def scroll_page_to_end(
+        self,
+        sleep=0.5,
+        max_attempts=10,
+        mode="sleep",
+        item_selector=None,
+        min_timeout=0.3,
+        max_timeout=5.0,
+        quiet=0.3,
+    ):
         """
         웹 페이지가 끝까지 로드될 때까지 스크롤하는 메서드.
-        - sleep: 각 스크롤 후 대기 시간 (초)
+        - sleep: 각 스크롤 후 대기 시간 (초, mode="sleep")
         - max_attempts: 스크롤 시도 횟수 제한
+        - mode: "sleep" (고정 대기) 또는 "observe" (MutationObserver 기반 대기)
+        - item_selector: "observe" 에서 로드된 항목 수를 셀 CSS selector (선택)
+        - min_timeout, max_timeout: "observe" 에서 한 번 기다리는 시간의 하한/상한 (초, 30초 미만)
+        - quiet: "observe" 에서 DOM/네트워크 활동이 이 시간(초) 동안 없으면 로드 완료로 판단
+        반환값: 시도 횟수, 새로 로드된 항목 수, 초당 로드 항목 수 등 통계 dict
         """
+        if mode == "observe":
+            return self._scroll_until_idle(
+                max_attempts=max_attempts,
+                item_selector=item_selector,
+                min_timeout=min_timeout,
+                max_timeout=max_timeout,
+                quiet=quiet,
+            )
+
+        started = time.perf_counter()
+        grew = False
         attempts = 0
         last_height = self.driver.execute_script("return document.body.scrollHeight")
 
@@ -240,11 +685,89 @@ class SeniumScraper:
             # 업데이트된 높이 저장 및 시도 횟수 증가
             last_height = new_height
             attempts += 1
+            grew = True
+
+        if attempts == max_attempts:
+            self.logger.info(
+                f"최대 스크롤 시도에 도달하여 중지 총 시도 횟수: {attempts}"
+            )
+
+        return {
+            "mode": "sleep",
+            "attempts": attempts,
+            "grew": grew,
+            "items": None,
+            "elapsed": time.perf_counter() - started,
+            "items_per_sec": None,
+        }
+
+    def _scroll_until_idle(
+        self, max_attempts, item_selector, min_timeout, max_timeout, quiet
+    ):
+        """
+        고정 sleep 대신 페이지의 DOM 변경을 기다리며 스크롤.
+        대기 시간은 지금까지 관측된 로드 시간의 3배로 조정하며, 새 항목이 없으면 즉시 중지.
+        """
+        started = time.perf_counter()
+        timeout = max_timeout
+        load_time = None
+        start_count = None
+        last_count = None
+        last_height = None
+        grew = False
+        attempts = 0
+
+        while attempts < max_attempts:
+            result = self.driver.execute_async_script(
+                _WAIT_FOR_GROWTH_SCRIPT,
+                int(timeout * 1000),
+                int(quiet * 1000),
+                item_selector,
+            )
+            attempts += 1
+
+            if start_count is None:
+                start_count = result["start_count"]
+            last_count = result["count"]
+            last_height = result["height"]
+
+            if not result["grew"]:
+                break
+
+            grew = True
+
+            # 로드 시간의 이동평균으로 다음 대기 시간 조정
+            waited = result["waited_ms"] / 1000
+            load_time = waited if load_time is None else (load_time + waited) / 2
+            timeout = min(max_timeout, max(min_timeout, load_time * 3))
+
+        elapsed = time.perf_counter() - started
+        items = None
+        if start_count is not None and last_count is not None:
+            items = last_count - start_count
+
+        items_per_sec = items / elapsed if items is not None and elapsed > 0 else None
 
         if attempts == max_attempts:
             self.logger.info(
                 f"최대 스크롤 시도에 도달하여 중지 총 시도 횟수: {attempts}"
             )
+        if items is not None:
+            self.logger.info(
+                f"스크롤 완료: {items}개 로드, {elapsed:.2f}초, "
+                f"초당 {items_per_sec or 0:.1f}개"
+            )
+
+        return {
+            "mode": "observe",
+            "attempts": attempts,
+            "grew": grew,
+            "height": last_height,
+            "count": last_count,
+            "items": items,
+            "elapsed": elapsed,
+            "items_per_sec": items_per_sec,
+        }
 
     @staticmethod
     def _validate_selenium_input(by, expression, context="검색"):
@@ -260,25 +783,53 @@ class SeniumScraper:
             )
 
     @staticmethod
-    def handle_exception(context, expression, exception):
+    def _classify_error(exception):
+        """
+        Selenium 예외를 app.core.utils.NetError 의 오류 클래스로 변환.
+        """
+        if isinstance(exception, exceptions.TimeoutException):
+            return NetError.TIMEOUT
+
+        return NetError.classify_message(str(exception)) or NetError.UNKNOWN
+
+    @staticmethod
+    def _elapsed_ms(started):
+        return round((time.perf_counter() - started) * 1000, 1)
+
+    @staticmethod
+    def handle_exception(context, expression, exception, **fields):
         """
         공통 예외 처리 함수.
         :param context: 현재 실행 중인 컨텍스트 설명 (예: "엘리먼트 찾기")
         :param expression: 처리 중이던 Selenium의 표현식
         :param exception: 발생한 예외 객체
+        :param fields: 로그에 함께 기록할 필드 (url, duration_ms 등)
         """
-        if isinstance(exception, TimeoutException):
-            SeniumScraper.logger.exception(
+        if isinstance(exception, exceptions.TimeoutException):
+            message = (
                 f"TimeoutException: {context}에서 '{expression}' 처리 중 시간초과\n"
                 f"Msg: {exception}"
             )
-        elif isinstance(exception, NoSuchElementException):
-            SeniumScraper.logger.exception(
+        elif isinstance(exception, exceptions.NoSuchElementException):
+            message = (
                 f"NoSuchElementException: {context}에서 '{expression}' 처리 중 엘리먼트 없음\n"
                 f"Msg: {exception}"
             )
         else:
-            SeniumScraper.logger.exception(
+            message = (
                 f"Exception: {context}에서 '{expression}' 처리 중 예외 발생\n"
                 f"Msg: {exception}"
             )
+
+        error_class = SeniumScraper._classify_error(exception)
+        metrics.inc("senium.errors", error_class=error_class)
+
+        Logger.event(
+            SeniumScraper.logger,
+            message,
+            level=logging.ERROR,
+            exc_info=exception,
+            selector=expression,
+            error_class=error_class,
+            **fields,
+        )
@@ -1,44 +1,119 @@
 import playwright
+from contextlib import asynccontextmanager
 from playwright.async_api import Playwright, async_playwright
+from app.core.utils.Logger import Logger
+
+
+EXTRA_HTTP_HEADERS = {
+    "Upgrade-Insecure-Requests": "1",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "sec-ch-ua": '"Not/A)Brand";v="8", "Chromium";v="126", "Google Chrome";v="126"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+}
+
+WEBDRIVER_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    """
 
 
 class WrightBrowser:
-    def __init__(self, playwright: Playwright) -> None:
+
+    logger = Logger.lazy(
+        name="WrightBrowser", log_file="WrightBrowser.log", json_format=True
+    )
+
+    def __init__(
+        self,
+        playwright: Playwright,
+        blocker=None,
+        proxies=None,
+        rate_limiter=None,
+        cache=None,
+        capture=None,
+        watchdog=None,
+        profile=None,
+    ) -> None:
+        """
+        :param playwright: 실행 중인 Playwright 객체 (None 이면 직접 시작)
+        :param blocker: 컨텍스트에 연결할 ResourceBlocker (선택)
+        :param proxies: 컨텍스트별 프록시를 배정할 ProxyPool (선택)
+        :param rate_limiter: goto 에 적용할 AsyncRateLimiter (선택)
+        :param cache: 컨텍스트에 연결할 ResponseCache (선택)
+        :param capture: 컨텍스트에 연결할 ResponseCapture (선택)
+        :param watchdog: 이동 전에 메모리/페이지 수를 확인해 컨텍스트를 재시작할 MemoryWatchdog (선택)
+        :param profile: 실행 프로필 이름 또는 LaunchProfile
+            (None 이면 WRIGHT_PROFILE 환경변수, app.core.services.WrightLaunchProfile 참고)
+        """
 
         self._playwright = playwright
+        self.blocker = blocker
+        self.proxies = proxies
+        self.proxy = None
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.capture = capture
+        self.watchdog = watchdog
+        self.profile = profile
         self.browser = None
         self.context = None
         self.page = None
+        self.pages_served = 0
+        self._context_options = {}
+        self._persistent = False
 
     async def __aenter__(self):
-        browser_options = WrightBrowser._get_browser_options()
+        from app.core.services.WrightLaunchProfile import LaunchProfile
 
-        if not playwright:
-            self._playwright = async_playwright().start()
+        self.profile = LaunchProfile.resolve(self.profile)
 
-        self.browser = await self._playwright.chromium.launch(**browser_options)
+        if not self._playwright:
+            self._playwright = await async_playwright().start()
 
-        self.context = await self.browser.new_context()
+        context_options = {}
+        if self.proxies:
+            self.proxy = self.proxies.acquire()
+            context_options = self.proxies.context_options(self.proxy)
 
-        await self.context.set_extra_http_headers(
-            {
-                "Upgrade-Insecure-Requests": "1",
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
-                "sec-ch-ua": '"Not/A)Brand";v="8", "Chromium";v="126", "Google Chrome";v="126"',
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": '"Windows"',
-            }
-        )
-
-        self.page = await self.context.new_page()
+        self._context_options = context_options
 
-        await self.page.add_init_script(
-            """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                """
-        )
+        try:
+            self._persistent = self.profile.persistent
+            if self._persistent:
+                # 프로필 폴더를 쓰는 영구 컨텍스트: 브라우저와 컨텍스트가 하나로 묶여 실행됨
+                browser_options = WrightBrowser._get_browser_options(
+                    self.profile, self._playwright
+                )
+                self.context = await self._playwright.chromium.launch_persistent_context(
+                    self.profile.user_data_dir, **{**browser_options, **context_options}
+                )
+                self.browser = self.context.browser
+                self.context = await WrightBrowser._prepare_context(
+                    self.context, blocker=self.blocker, cache=self.cache, capture=self.capture
+                )
+                # 영구 컨텍스트는 빈 탭 하나가 열린 상태로 시작됨
+                if self.context.pages:
+                    self.page = self.context.pages[0]
+            else:
+                self.browser = await WrightBrowser._launch(
+                    self._playwright, self.profile, per_context_proxy=bool(self.proxies)
+                )
+                self.context = await WrightBrowser._new_context(
+                    self.browser,
+                    blocker=self.blocker,
+                    cache=self.cache,
+                    capture=self.capture,
+                    **context_options,
+                )
+
+            if self.page is None:
+                self.page = await self.context.new_page()
+        except Exception:
+            # async with 는 __aenter__ 가 실패하면 __aexit__ 를 호출하지 않으므로 여기서 정리
+            await self._abort_enter()
+            raise
 
         return self
 
@@ -56,97 +131,380 @@ class WrightBrowser:
             await self.context.close()
         if self.browser:
             await self.browser.close()
+        if self.proxy:
+            self.proxies.release(self.proxy)
+            self.proxy = None
+
+    async def _abort_enter(self):
+        """
+        시작 도중 실패했을 때 열린 브라우저/컨텍스트를 닫고 배정받은 프록시를 반납.
+        """
+        try:
+            if self._persistent and self.context:
+                await self.context.close()
+            elif self.browser:
+                await self.browser.close()
+        except Exception as e:
+            WrightBrowser._log(f"브라우저 시작 실패 후 정리 중 예외: {e}")
+        finally:
+            if self.proxy:
+                self.proxies.release(self.proxy)
+                self.proxy = None
+            self.page = self.context = self.browser = None
 
     async def goto(self, url: str, timeout: int = 10000):
+        return await self._goto(url, timeout=timeout) is None
+
+    async def _goto(self, url: str, timeout: int = 10000):
+        """
+        페이지 이동 후 실패하면 (오류 클래스, 오류 메시지) 를, 성공하면 None 을 반환.
+        오류 클래스는 app.core.utils.NetError 의 상수를 사용.
+        """
+        import logging
+        import time
+        from app.core.utils.Metrics import metrics
+
+        if self.watchdog:
+            await self._watch_memory()
+
+        if self.rate_limiter:
+            async with self.rate_limiter.limit(url):
+                started = time.perf_counter()
+                failure = await self._navigate(url, timeout=timeout)
+
+            self.rate_limiter.report(url, error_class=failure[0] if failure else None)
+        else:
+            started = time.perf_counter()
+            failure = await self._navigate(url, timeout=timeout)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        error_class = failure[0] if failure else None
+
+        if self.proxy:
+            self.proxies.report(self.proxy, error_class=error_class, latency_ms=elapsed_ms)
+
+        metrics.observe("wright.goto", elapsed_ms, error_class=error_class)
+
+        # 실패는 _navigate 에서 ERROR 로 남기므로 성공한 이동만 DEBUG 로 기록 (집계는 지표 사용)
+        if failure is None:
+            WrightBrowser._log(
+                "페이지 이동",
+                level=logging.DEBUG,
+                url=url,
+                duration_ms=round(elapsed_ms, 1),
+                proxy=self.proxy,
+            )
+
+        return failure
+
+    async def _navigate(self, url: str, timeout: int = 10000):
         import asyncio
         from playwright._impl._errors import Error, TimeoutError
+        from app.core.utils import NetError
 
         try:
             await self.page.goto(url, timeout=timeout)
-            return True
+            return None
             # 사용자 행동 모방
             # await self.page.mouse.move(100, 200)  # 마우스 움직임 추가
             # await asyncio.sleep(0.5)  # 적절한 지연 추가
 
-        except TimeoutError:
-            self._log(f"페이지 로드 타임아웃: {url}")
+        except TimeoutError as e:
+            self._log(f"페이지 로드 타임아웃: {url}", url=url, error_class=NetError.TIMEOUT)
+            return NetError.TIMEOUT, str(e)
         except Error as e:
-            if "net::ERR_CONNECTION_RESET" in str(e):
-                self._log(f"네트워크 연결이 끊겼습니다: {url}")
-            elif "net::ERR_NAME_NOT_RESOLVED" in str(e):
-                self._log(f"DNS 문제로 사이트를 찾을 수 없습니다: {url}")
-            elif "net::ERR_TIMED_OUT" in str(e):
-                self._log(f"네트워크 요청 시간이 초과되었습니다: {url}")
+            error_class = NetError.classify_message(str(e))
+            fields = {"url": url, "error_class": error_class}
+
+            if error_class == NetError.CONNECTION_RESET:
+                self._log(f"네트워크 연결이 끊겼습니다: {url}", **fields)
+            elif error_class == NetError.NAME_NOT_RESOLVED:
+                self._log(f"DNS 문제로 사이트를 찾을 수 없습니다: {url}", **fields)
+            elif error_class == NetError.TIMED_OUT:
+                self._log(f"네트워크 요청 시간이 초과되었습니다: {url}", **fields)
+            elif error_class == NetError.PROXY_ERROR:
+                self._log(f"프록시 서버 연결에 실패했습니다: {self.proxy} {url}", **fields)
             else:
-                self._log(f"Playwright 관련 오류: {str(e)}")
+                error_class = NetError.BROWSER_ERROR
+                self._log(f"Playwright 관련 오류: {str(e)}", url=url, error_class=error_class)
+
+            return error_class, str(e)
         except Exception as e:
-            self._log(f"알 수 없는 오류 발생: {e}")
+            self._log(f"알 수 없는 오류 발생: {e}", url=url, error_class=NetError.UNKNOWN)
+            return NetError.UNKNOWN, str(e)
+
+    async def recycle(self, reason: str = "manual", before=None):
+        """
+        현재 컨텍스트/페이지를 닫고 같은 옵션으로 새로 열어 렌더러 메모리를 회수.
+        쿠키/로컬 스토리지는 storage_state 로 옮겨 로그인 상태를 유지.
+        :param reason: 로그에 남길 재시작 사유
+        :param before: 재시작 전 메모리 측정값 (없으면 여기서 측정)
+        """
+        from app.core.services.MemoryWatchdog import MemoryWatchdog
+
+        if before is None:
+            before = await MemoryWatchdog.sample_page(self.page, self.browser)
+
+        if self._persistent:
+            # 영구 컨텍스트는 교체할 수 없으므로 페이지(렌더러)만 새로 열어 교체
+            await self._replace_page()
+        else:
+            await self._replace_context()
+
+        after = await MemoryWatchdog.sample_page(self.page, self.browser)
+
+        if self.watchdog:
+            self.watchdog.forget(self)
+            self.watchdog.record_recycle(
+                "wright", reason, before, after, pages=self.pages_served
+            )
 
-        return False
+        self.pages_served = 0
 
-    @staticmethod
-    def _get_browser_options():
+    async def _replace_context(self):
         try:
-            headless_mode = False
-            executable_path = WrightBrowser._get_browser_path()
-            proxy = {
-                "server": "http://43.134.68.153:3128",  # 프록시 서버 주소와 포트
-            }
-
-            return {
-                "headless": headless_mode,
-                "proxy": proxy,
-                "executable_path": executable_path,
-                "args": [
-                    "--disable-blink-features=AutomationControlled",  # 자동화 탐지 방지
-                    "--no-sandbox",  # 샌드박스 비활성화
-                    "--disable-setuid-sandbox",
-                    "--disable-infobars",  # 브라우저에 '자동화된 소프트웨어' 알림 비활성화
-                    "--disable-dev-shm-usage",  # 공유 메모리 문제 방지
-                    "--disable-extensions",  # 확장 프로그램 비활성화
-                ],
-            }
+            storage_state = await self.context.storage_state()
+        except Exception as e:
+            WrightBrowser._log(f"재시작 전 storage_state 저장 실패: {e}")
+            storage_state = None
+
+        old_context = self.context
+        self.context = await WrightBrowser._new_context(
+            self.browser,
+            blocker=self.blocker,
+            cache=self.cache,
+            capture=self.capture,
+            storage_state=storage_state,
+            **self._context_options,
+        )
+        self.page = await self.context.new_page()
 
-        except Exception:
-            err_msg = f"driver의 browser options을 초기화 중 예외발생!\n"
-            WrightBrowser._log(err_msg=err_msg)
-            raise
+        try:
+            await old_context.close()
+        except Exception as e:
+            WrightBrowser._log(f"재시작 중 이전 컨텍스트 종료 예외: {e}")
 
-    @staticmethod
-    def _get_browser_path():
-        from pathlib import Path
+    async def _replace_page(self):
+        old_page = self.page
+        self.page = await self.context.new_page()
 
-        drivers_path = (
-            Path.cwd() / "drivers" / "ms-playwright" / "chromium-1140" / "chrome-win"
+        try:
+            await old_page.close()
+        except Exception as e:
+            WrightBrowser._log(f"재시작 중 이전 페이지 종료 예외: {e}")
+
+    async def _watch_memory(self):
+        """
+        다음 페이지로 이동하기 전에 watchdog 기준을 확인하고, 넘었으면 컨텍스트를 재시작.
+        """
+        from app.core.services.MemoryWatchdog import MemoryWatchdog
+
+        sample = None
+        if self.watchdog.due(self, self.pages_served):
+            sample = await MemoryWatchdog.sample_page(self.page, self.browser)
+
+        reason = self.watchdog.check(self.pages_served, sample)
+        if reason:
+            await self.recycle(reason, before=sample)
+
+        self.pages_served += 1
+
+    def crawl(
+        self,
+        urls,
+        concurrency: int = 4,
+        handler=None,
+        timeout: int = 10000,
+        retry=None,
+        state=None,
+        fingerprint=None,
+    ):
+        """
+        현재 브라우저에서 컨텍스트를 concurrency 개 열어 URL 들을 동시에 방문.
+        결과는 app.core.services.WrightCrawler.CrawlResult 로 끝나는 순서대로 스트리밍.
+
+        async for result in browser.crawl(urls, concurrency=8, handler=parse):
+            ...
+        """
+        from app.core.services.WrightCrawler import crawl
+
+        if self._persistent:
+            raise RuntimeError(
+                "RuntimeError - 영구 컨텍스트(user_data_dir) 프로필은 crawl 을 지원하지 않음"
+            )
+
+        return crawl(
+            lambda: WrightBrowser._open_lease(
+                self._playwright,
+                self.browser,
+                blocker=self.blocker,
+                proxies=self.proxies,
+                rate_limiter=self.rate_limiter,
+                cache=self.cache,
+                capture=self.capture,
+                watchdog=self.watchdog,
+            ),
+            urls,
+            concurrency=concurrency,
+            handler=handler,
+            timeout=timeout,
+            retry=retry,
+            state=state,
+            fingerprint=fingerprint,
         )
 
-        browser_path = drivers_path / "chrome.exe"
+    @staticmethod
+    @asynccontextmanager
+    async def _open_lease(
+        playwright,
+        browser,
+        blocker=None,
+        proxies=None,
+        rate_limiter=None,
+        cache=None,
+        capture=None,
+        watchdog=None,
+        **context_options,
+    ):
+        """
+        browser 위에 새 컨텍스트/페이지를 열어 WrightBrowser 로 감싸 빌려주고,
+        블록이 끝나면 컨텍스트를 닫음. proxies 가 있으면 컨텍스트마다 프록시를 배정.
+        watchdog 이 대여 중에 컨텍스트를 재시작하면 반납 시 마지막 컨텍스트를 닫음.
+        """
+        proxy = None
+        if proxies:
+            proxy = proxies.acquire()
+            context_options = {**context_options, **proxies.context_options(proxy)}
 
-        if not browser_path.exists():
-            err_msg = (
-                f"[오류] 'drivers' 디렉토리에서 'chrome.exe' 파일을 찾을 수 없습니다.\n"
-                f"현재 경로: {browser_path}"
+        try:
+            context = await WrightBrowser._new_context(
+                browser, blocker=blocker, cache=cache, capture=capture, **context_options
             )
+        except Exception:
+            if proxy:
+                proxies.release(proxy)
+            raise
 
-            WrightBrowser._log(err_msg=err_msg)
+        leased = WrightBrowser(
+            playwright,
+            blocker=blocker,
+            proxies=proxies,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            capture=capture,
+            watchdog=watchdog,
+        )
+        leased.proxy = proxy
+        leased.browser = browser
+        leased.context = context
+        leased._context_options = context_options
+
+        try:
+            leased.page = await context.new_page()
+
+            yield leased
 
-            raise FileNotFoundError(err_msg)
+        finally:
+            # 대여마다 새 WrightBrowser 이므로 공유 watchdog 의 측정 기록을 지워 누적되지 않게 함
+            if watchdog:
+                watchdog.forget(leased)
 
-        return str(browser_path)
+            try:
+                await leased.context.close()
+            except Exception as e:
+                WrightBrowser._log(f"컨텍스트 반납 중 예외: {e}")
+
+            if proxy:
+                proxies.release(proxy)
 
     @staticmethod
-    def _log(err_msg="예외!"):
-        import traceback as tb
-        import os
+    async def _new_context(
+        browser, blocker=None, cache=None, capture=None, **context_options
+    ):
+        """
+        공통 헤더와 navigator.webdriver 은닉 스크립트가 적용된 새 컨텍스트를 생성.
+        :param browser: 컨텍스트를 생성할 Browser 객체
+        :param blocker: 컨텍스트 전체에 적용할 ResourceBlocker (선택)
+        :param cache: 컨텍스트 전체에 적용할 ResponseCache (선택)
+        :param capture: 컨텍스트 전체의 JSON 응답을 잡을 ResponseCapture (선택)
+        :param context_options: browser.new_context 에 그대로 전달되는 옵션
+        """
+        context = await browser.new_context(**context_options)
+
+        return await WrightBrowser._prepare_context(
+            context, blocker=blocker, cache=cache, capture=capture
+        )
 
-        print(err_msg)
+    @staticmethod
+    async def _prepare_context(context, blocker=None, cache=None, capture=None):
+        """
+        컨텍스트에 공통 헤더, 은닉 스크립트, 캐시/차단/응답 수집을 등록.
+        """
+        await context.set_extra_http_headers(EXTRA_HTTP_HEADERS)
+
+        # 컨텍스트 단위로 등록하여 이후 생성되는 모든 페이지에 적용
+        await context.add_init_script(WEBDRIVER_INIT_SCRIPT)
+
+        # 라우트는 나중에 등록한 것이 먼저 실행되므로 캐시를 먼저 등록하여
+        # 차단 대상은 캐시 조회 없이 바로 차단되도록 함
+        if cache:
+            await cache.attach(context)
+        if blocker:
+            await blocker.attach(context)
+        if capture:
+            await capture.attach(context)
+
+        return context
 
-        tb.print_exc()
+    @staticmethod
+    async def _launch(playwright, profile=None, per_context_proxy: bool = False):
+        """
+        profile 의 옵션으로 Chromium 을 실행하고 시작 시간을 기록.
+        """
+        import time
+        from app.core.services.WrightLaunchProfile import LaunchProfile
+        from app.core.utils.Metrics import metrics
+
+        profile = LaunchProfile.resolve(profile)
+        options = WrightBrowser._get_browser_options(
+            profile, playwright, per_context_proxy=per_context_proxy
+        )
+
+        started = time.perf_counter()
+        browser = await playwright.chromium.launch(**options)
+        metrics.observe(
+            "wright.launch", (time.perf_counter() - started) * 1000, profile=profile.name
+        )
 
-        log_folder = "logs"
-        os.makedirs(log_folder, exist_ok=True)
+        return browser
 
-        with open(f"{log_folder}/error.log", "w", encoding="utf-8") as f:
-            f.write(err_msg + "\n")
+    @staticmethod
+    def _get_browser_options(profile=None, playwright=None, per_context_proxy: bool = False):
+        from app.core.services.WrightLaunchProfile import LaunchProfile
+
+        try:
+            return LaunchProfile.resolve(profile).launch_options(
+                playwright, per_context_proxy=per_context_proxy
+            )
 
-            tb.print_exc(file=f)
+        except Exception:
+            err_msg = f"driver의 browser options을 초기화 중 예외발생!\n"
+            WrightBrowser._log(err_msg=err_msg)
+            raise
+
+    @staticmethod
+    def _log(err_msg="예외!", level=None, **fields):
+        """
+        메시지를 url, error_class 등의 필드와 함께 로거에 기록.
+        처리 중인 예외가 있으면 traceback 도 함께 기록.
+        """
+        import logging
+        import sys
+
+        Logger.event(
+            WrightBrowser.logger,
+            err_msg,
+            level=level or logging.ERROR,
+            exc_info=sys.exc_info()[0] is not None,
+            **fields,
+        )
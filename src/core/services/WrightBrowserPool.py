@@ -0,0 +1,196 @@
+import asyncio
+from contextlib import asynccontextmanager
+from playwright.async_api import Playwright, async_playwright
+from app.core.services.WrightBrowser import WrightBrowser
+
+
+class WrightBrowserPool:
+    """
+    브라우저 프로세스를 미리 띄워두고 작업마다 새 컨텍스트/페이지를 빌려주는 풀.
+
+    async with WrightBrowserPool(playwright, size=2) as pool:
+        async with pool.lease() as browser:
+            await browser.goto(url)
+    """
+
+    def __init__(
+        self,
+        playwright: Playwright,
+        size: int = 2,
+        max_contexts_per_browser: int = 4,
+        blocker=None,
+        proxies=None,
+        rate_limiter=None,
+        cache=None,
+        capture=None,
+        watchdog=None,
+        profile=None,
+    ) -> None:
+        """
+        :param playwright: 실행 중인 Playwright 객체 (None 이면 풀이 직접 시작)
+        :param size: 유지할 브라우저 프로세스 수
+        :param max_contexts_per_browser: 브라우저 하나당 동시에 빌려줄 컨텍스트 수
+        :param blocker: 빌려주는 모든 컨텍스트에 연결할 ResourceBlocker (선택)
+        :param proxies: 빌려주는 컨텍스트마다 프록시를 배정할 ProxyPool (선택)
+        :param rate_limiter: 모든 컨텍스트가 공유할 AsyncRateLimiter (선택)
+        :param cache: 모든 컨텍스트가 공유할 ResponseCache (선택)
+        :param capture: 모든 컨텍스트의 JSON 응답을 잡을 ResponseCapture (선택)
+        :param watchdog: 빌려준 컨텍스트를 메모리/페이지 수 기준으로 재시작할 MemoryWatchdog (선택)
+        :param profile: 실행 프로필 이름 또는 LaunchProfile (None 이면 WRIGHT_PROFILE 환경변수)
+            풀은 컨텍스트를 작업마다 새로 만들므로 프로필의 user_data_dir 은 사용하지 않음
+        """
+        if size < 1:
+            raise ValueError("ValueError - 브라우저 풀 크기는 1 이상이어야 함")
+        if max_contexts_per_browser < 1:
+            raise ValueError("ValueError - 브라우저당 컨텍스트 수는 1 이상이어야 함")
+
+        self._playwright = playwright
+        self._owns_playwright = False
+        self.size = size
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.blocker = blocker
+        self.proxies = proxies
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.capture = capture
+        self.watchdog = watchdog
+        self.profile = profile
+
+        self.browsers = []
+        self._active = [0] * size
+        self._served = [0] * size
+        self._semaphore = None
+        self._launch_lock = None
+
+    async def __aenter__(self):
+        from app.core.services.WrightLaunchProfile import LaunchProfile
+
+        self.profile = LaunchProfile.resolve(self.profile)
+
+        if not self._playwright:
+            self._playwright = await async_playwright().start()
+            self._owns_playwright = True
+
+        self._semaphore = asyncio.Semaphore(self.size * self.max_contexts_per_browser)
+        self._launch_lock = asyncio.Lock()
+
+        self.browsers = list(
+            await asyncio.gather(*(self._launch() for _ in range(self.size)))
+        )
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        import traceback as tb
+
+        if exc_type:
+            print(f"예외 발생: {exc_type.__name__}, {exc_value}")
+            print("스택 추적 정보:")
+            tb.print_tb(traceback)
+
+        for browser in self.browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                WrightBrowser._log(f"브라우저 종료 중 예외: {e}")
+
+        self.browsers = []
+
+        if self._owns_playwright:
+            await self._playwright.stop()
+            self._playwright = None
+            self._owns_playwright = False
+
+    @asynccontextmanager
+    async def lease(self, **context_options):
+        """
+        풀의 브라우저 중 가장 한가한 프로세스에서 새 컨텍스트와 페이지를 빌려줌.
+        반납 시 컨텍스트를 닫아 쿠키/스토리지가 다음 작업으로 새지 않도록 함.
+        :param context_options: browser.new_context 에 전달되는 옵션
+        """
+        if self._semaphore is None:
+            raise RuntimeError("RuntimeError - 'async with' 로 풀을 먼저 시작해야 함")
+
+        await self._semaphore.acquire()
+
+        index = self._active.index(min(self._active))
+        self._active[index] += 1
+
+        try:
+            browser = await self._ensure_browser(index)
+
+            async with WrightBrowser._open_lease(
+                self._playwright,
+                browser,
+                blocker=self.blocker,
+                proxies=self.proxies,
+                rate_limiter=self.rate_limiter,
+                cache=self.cache,
+                capture=self.capture,
+                watchdog=self.watchdog,
+                **context_options,
+            ) as leased:
+                self._served[index] += 1
+
+                yield leased
+
+        finally:
+            self._active[index] -= 1
+            self._semaphore.release()
+
+    def crawl(
+        self,
+        urls,
+        concurrency: int = None,
+        handler=None,
+        timeout: int = 10000,
+        retry=None,
+        state=None,
+        fingerprint=None,
+    ):
+        """
+        풀에서 컨텍스트를 빌려 URL 들을 동시에 방문하고 결과를 스트리밍.
+        concurrency 를 생략하면 풀이 동시에 빌려줄 수 있는 최대치를 사용.
+        """
+        from app.core.services.WrightCrawler import crawl
+
+        if concurrency is None:
+            concurrency = self.size * self.max_contexts_per_browser
+
+        return crawl(
+            self.lease,
+            urls,
+            concurrency=concurrency,
+            handler=handler,
+            timeout=timeout,
+            retry=retry,
+            state=state,
+            fingerprint=fingerprint,
+        )
+
+    def stats(self):
+        """
+        브라우저별 현재 대여 수와 누적 대여 수를 반환.
+        """
+        return [
+            {"index": i, "active": self._active[i], "served": self._served[i]}
+            for i in range(self.size)
+        ]
+
+    async def _launch(self):
+        return await WrightBrowser._launch(
+            self._playwright, self.profile, per_context_proxy=bool(self.proxies)
+        )
+
+    async def _ensure_browser(self, index):
+        """
+        브라우저 프로세스가 죽었으면 같은 슬롯에 새로 띄움.
+        """
+        async with self._launch_lock:
+            browser = self.browsers[index]
+
+            if not browser.is_connected():
+                WrightBrowser._log(f"{index}번 브라우저 연결 끊김, 재실행")
+                self.browsers[index] = await self._launch()
+
+            return self.browsers[index]
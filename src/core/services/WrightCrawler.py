@@ -0,0 +1,284 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from app.core.services.CrawlState import CrawlState
+from app.core.services.RetryScheduler import RetryScheduler
+from app.core.utils import NetError
+from app.core.utils.Logger import Logger
+
+_DONE = object()
+
+
+@dataclass
+class CrawlResult:
+    """
+    URL 하나에 대한 크롤 결과.
+    error_class 는 app.core.utils.NetError 의 상수 (성공 시 None).
+    attempts 에는 시도별 오류 클래스와 소요 시간이 기록됨.
+    unchanged 는 CrawlState 에 저장된 해시(fingerprint)와 같아 handler 를 건너뛰고 저장된 data 를 재사용한 경우.
+    """
+
+    url: str
+    ok: bool
+    error_class: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+    data: Any = None
+    attempts: list = field(default_factory=list)
+    content_hash: Optional[str] = None
+    unchanged: bool = False
+
+
+async def crawl(
+    lease,
+    urls,
+    concurrency=4,
+    handler=None,
+    timeout=10000,
+    retry=None,
+    state=None,
+    fingerprint=None,
+):
+    """
+    URL 들을 concurrency 개의 워커로 나눠 방문하고 결과를 끝나는 순서대로 yield.
+
+    입력은 동기/비동기 이터러블 모두 받으며, 입력과 결과 모두 크기가 제한된
+    큐를 거치므로 URL 수와 상관없이 메모리에 올라가는 양은 일정함.
+    실패한 URL 은 retry 스케줄러의 정책에 따라 백오프 후 다시 시도되고,
+    최종 결과만 yield 됨. 모든 워커가 컨텍스트 대여에 실패하면 남은 URL 은
+    error_class=browser_error 인 실패 결과로 yield 됨.
+
+    :param lease: 호출하면 WrightBrowser 를 빌려주는 async context manager 를 반환하는 함수
+    :param urls: 방문할 URL 이터러블 (list, generator, async generator)
+    :param concurrency: 동시에 열어둘 컨텍스트(워커) 수
+    :param handler: 페이지 로드 성공 시 호출할 async 함수 handler(browser, url), 반환값은 result.data
+    :param timeout: 페이지 로드 타임아웃 (ms)
+    :param retry: RetryScheduler (생략 시 재시도 없음)
+    :param state: CrawlState 지정 시 이미 방문한 URL 은 건너뛰고, 최종 결과를 기록하며,
+        fingerprint 가 바뀌지 않은 페이지는 handler 대신 저장된 결과를 사용
+        (페이지 이동/렌더링은 항상 일어나고 handler 만 건너뜀. 방문 자체는 state.max_age 로 줄임)
+    :param fingerprint: 변경 여부를 판단할 대상 (state 지정 시에만 사용)
+        - None: 렌더링된 전체 HTML (토큰/시간/광고가 섞인 동적 페이지는 거의 항상 바뀐 것으로 판단됨)
+        - str: CSS selector, 일치하는 요소들의 텍스트
+        - 함수: async fingerprint(browser, url) 의 반환값 (JSON 직렬화 가능한 값)
+    """
+    if concurrency < 1:
+        raise ValueError("ValueError - concurrency 는 1 이상이어야 함")
+
+    scheduler = retry or RetryScheduler.without_retry(capacity=concurrency * 2)
+    result_queue = asyncio.Queue(maxsize=concurrency * 2)
+    live_workers = concurrency
+
+    async def enqueue(url):
+        if state and not await asyncio.to_thread(state.should_visit, url):
+            return
+        await scheduler.put(url)
+
+    async def feed():
+        try:
+            if hasattr(urls, "__aiter__"):
+                async for url in urls:
+                    await enqueue(url)
+            else:
+                for url in urls:
+                    await enqueue(url)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _log(f"크롤 URL 입력 중 예외, 이후 URL 은 무시: {e}")
+
+        await scheduler.close()
+
+    async def emit(result, attempts):
+        result.attempts = attempts
+        if state:
+            await asyncio.to_thread(_record, state, result)
+        await result_queue.put(result)
+
+    async def work():
+        nonlocal live_workers
+
+        item = None
+        failure = None
+        try:
+            finished_work = False
+            while not finished_work:
+                async with lease() as browser:
+                    while True:
+                        item = await scheduler.get()
+                        if item is None:
+                            finished_work = True
+                            break
+
+                        url, attempts = item
+                        with Logger.context(url=url, attempt=len(attempts) + 1):
+                            result = await _visit(
+                                browser, url, handler, timeout, state, fingerprint
+                            )
+
+                        item = None
+                        final = await scheduler.done(
+                            url, attempts, result.error_class, result.elapsed_ms
+                        )
+                        if final:
+                            await emit(result, attempts)
+
+                        # 배정된 프록시가 cooldown 에 들어가면 새 컨텍스트로 다시 대여
+                        if browser.proxy and not browser.proxies.is_healthy(
+                            browser.proxy
+                        ):
+                            break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _log(f"크롤 워커 종료, 컨텍스트 대여 실패: {e}")
+            failure = e
+
+        live_workers -= 1
+
+        if failure is not None:
+            # 처리 중이던 URL 은 실패로 기록 (재시도가 남았으면 다른 워커나 아래 정리에서 처리)
+            if item is not None:
+                url, attempts = item
+                if await scheduler.done(url, attempts, NetError.BROWSER_ERROR):
+                    await emit(_lease_failure(url, failure), attempts)
+
+            # 마지막 워커까지 대여에 실패하면 남은 URL 을 실패 결과로 내보내
+            # 호출한 쪽에서 방문하지 못한 URL 을 성공과 구분할 수 있게 함
+            if live_workers == 0:
+                while True:
+                    item = await scheduler.get()
+                    if item is None:
+                        break
+
+                    url, attempts = item
+                    await scheduler.done(url, attempts, NetError.BROWSER_ERROR, retry=False)
+                    await emit(_lease_failure(url, failure), attempts)
+
+        # 취소된 경우에는 소비자가 없으므로 종료 신호를 보내지 않음
+        await result_queue.put(_DONE)
+
+    tasks = [asyncio.create_task(feed())]
+    tasks += [asyncio.create_task(work()) for _ in range(concurrency)]
+
+    finished = 0
+    try:
+        while finished < concurrency:
+            result = await result_queue.get()
+
+            if result is _DONE:
+                finished += 1
+                continue
+
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _visit(browser, url, handler, timeout, state=None, fingerprint=None):
+    started = time.perf_counter()
+
+    failure = await browser._goto(url, timeout=timeout)
+
+    if failure:
+        error_class, error = failure
+        return CrawlResult(
+            url=url,
+            ok=False,
+            error_class=error_class,
+            error=error,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    content_hash = None
+    if state:
+        content_hash = await _fingerprint(browser, url, fingerprint)
+        previous = await asyncio.to_thread(state.lookup, url)
+
+        # 비교 대상이 그대로면 추출을 건너뛰고 이전 결과를 재사용
+        if content_hash and previous and previous["content_hash"] == content_hash:
+            return CrawlResult(
+                url=url,
+                ok=True,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                data=previous["data"],
+                content_hash=content_hash,
+                unchanged=True,
+            )
+
+    data = None
+    if handler:
+        try:
+            data = await handler(browser, url)
+        except Exception as e:
+            _log(
+                f"크롤 핸들러 처리 중 예외: {url}",
+                url=url,
+                error_class=NetError.HANDLER_ERROR,
+            )
+
+            return CrawlResult(
+                url=url,
+                ok=False,
+                error_class=NetError.HANDLER_ERROR,
+                error=str(e),
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+            )
+
+    return CrawlResult(
+        url=url,
+        ok=True,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+        data=data,
+        content_hash=content_hash,
+    )
+
+
+async def _fingerprint(browser, url, fingerprint):
+    """
+    변경 여부 비교에 사용할 해시. 계산에 실패하면 None (항상 변경된 것으로 처리).
+    """
+    try:
+        if fingerprint is None:
+            value = await browser.page.content()
+        elif isinstance(fingerprint, str):
+            value = await browser.page.locator(fingerprint).all_inner_texts()
+        else:
+            value = await fingerprint(browser, url)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        _log(f"변경 비교용 fingerprint 계산 실패: {e}", url=url)
+        return None
+
+    return CrawlState.content_hash(value)
+
+
+def _lease_failure(url, error):
+    return CrawlResult(
+        url=url,
+        ok=False,
+        error_class=NetError.BROWSER_ERROR,
+        error=f"컨텍스트 대여 실패로 방문하지 못함: {error}",
+    )
+
+
+def _record(state, result):
+    state.record(
+        result.url,
+        result.ok,
+        content_hash=result.content_hash,
+        data=result.data,
+        error_class=result.error_class,
+        elapsed_ms=result.elapsed_ms,
+    )
+
+
+def _log(err_msg, **fields):
+    from app.core.services.WrightBrowser import WrightBrowser
+
+    WrightBrowser._log(err_msg=err_msg, **fields)
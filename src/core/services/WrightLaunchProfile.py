@@ -0,0 +1,258 @@
+import os
+import sys
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Optional
+
+PROFILE_ENV = "WRIGHT_PROFILE"
+USER_DATA_DIR_ENV = "WRIGHT_USER_DATA_DIR"
+EXECUTABLE_ENV = "WRIGHT_CHROMIUM_PATH"
+LAUNCH_PROXY_ENV = "WRIGHT_LAUNCH_PROXY"
+
+# 프로필을 고르지 않으면 기존 실행 옵션(화면 표시 + 실행 프록시)을 그대로 사용
+DEFAULT_PROFILE = "default"
+
+# 기존 WrightBrowser 가 브라우저 실행 시 사용하던 프록시 (WRIGHT_LAUNCH_PROXY 로 변경 가능)
+DEFAULT_LAUNCH_PROXY = "http://43.134.68.153:3128"
+
+# Windows Chromium 은 컨텍스트별 프록시를 쓰려면 브라우저도 프록시로 실행해야 함.
+# 모든 컨텍스트가 프록시를 덮어쓰므로 실제로 쓰이지 않는 자리표시 주소를 사용
+PER_CONTEXT_PROXY = "http://per-context"
+
+COMMON_ARGS = (
+    "--disable-blink-features=AutomationControlled",  # 자동화 탐지 방지
+    "--no-sandbox",  # 샌드박스 비활성화
+    "--disable-setuid-sandbox",
+    "--disable-infobars",  # 브라우저에 '자동화된 소프트웨어' 알림 비활성화
+    "--disable-dev-shm-usage",  # 공유 메모리 문제 방지
+    "--disable-extensions",  # 확장 프로그램 비활성화
+)
+
+# 화면 출력이 없는 작업용 서버에서 불필요한 GPU/백그라운드 작업을 끄는 옵션
+LEAN_ARGS = (
+    "--disable-gpu",
+    "--disable-background-timer-throttling",  # 백그라운드 탭 타이머 지연 방지 (동시 컨텍스트)
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--mute-audio",
+    "--no-first-run",
+)
+
+# Playwright 설치 폴더 안의 chromium-<리비전> 하위 실행 파일 경로
+_EXECUTABLES = {
+    "linux": ("chrome-linux/chrome", "chrome-linux64/chrome"),
+    "darwin": (
+        "chrome-mac/Chromium.app/Contents/MacOS/Chromium",
+        "chrome-mac-arm64/Chromium.app/Contents/MacOS/Chromium",
+    ),
+    "win32": ("chrome-win/chrome.exe", "chrome-win64/chrome.exe"),
+}
+
+
+@dataclass
+class LaunchProfile:
+    """
+    Chromium 실행 옵션 묶음. 이름으로 PROFILES 에서 고르거나 직접 만들어 WrightBrowser/WrightBrowserPool 에 전달.
+    지정하지 않으면 기존 동작과 같은 "default" 프로필 (WRIGHT_PROFILE=headless 등으로 변경).
+
+    - headless: 기존 headless 모드 (Playwright 기본, 가장 가볍고 빠르게 뜸)
+    - new_headless: 실제 Chrome 과 같은 렌더링 경로의 --headless=new 모드 (탐지 회피에 유리)
+    - disk_cache_mb: 디스크 캐시 크기 상한
+    - user_data_dir: 브라우저 프로필 폴더. 지정하면 영구 컨텍스트로 실행되어 실행 사이에 캐시/쿠키가 유지됨
+      (WrightBrowser 단독 사용에만 적용, 프로필 폴더는 프로세스 하나만 쓸 수 있어 풀/crawl 은 사용 안 함)
+    - proxy: 브라우저 실행 프록시 (WRIGHT_LAUNCH_PROXY 환경변수가 있으면 그 값을 우선 사용)
+
+    profile = LaunchProfile.resolve("lean")
+    async with WrightBrowser(playwright, profile=profile) as browser: ...
+    """
+
+    name: str
+    headless: bool = True
+    new_headless: bool = False
+    args: tuple = COMMON_ARGS
+    disk_cache_mb: Optional[int] = None
+    user_data_dir: Optional[str] = None
+    executable_path: Optional[str] = None
+    proxy: Optional[str] = None
+    options: dict = field(default_factory=dict)
+
+    @property
+    def persistent(self) -> bool:
+        return bool(self.user_data_dir)
+
+    def replace(self, **changes) -> "LaunchProfile":
+        return replace(self, **changes)
+
+    def launch_options(self, playwright=None, per_context_proxy: bool = False):
+        """
+        chromium.launch / launch_persistent_context 에 전달할 옵션.
+        :param playwright: 실행 파일을 찾을 Playwright 객체 (선택)
+        :param per_context_proxy: 컨텍스트별 프록시(ProxyPool)를 쓰는지 여부
+        """
+        args = list(self.args)
+        headless = self.headless
+
+        if headless and self.new_headless:
+            # headless=True 는 기존 모드/headless shell 을 쓰므로 새 모드는 인자로 직접 지정
+            headless = False
+            args.append("--headless=new")
+
+        if self.disk_cache_mb:
+            args.append(f"--disk-cache-size={int(self.disk_cache_mb * 1024 * 1024)}")
+
+        options = {"headless": headless, "args": args}
+
+        executable_path = self.find_executable(playwright)
+        if executable_path:
+            options["executable_path"] = executable_path
+
+        proxy = os.environ.get(LAUNCH_PROXY_ENV) or self.proxy
+        if proxy:
+            options["proxy"] = {"server": proxy}
+        elif per_context_proxy and sys.platform == "win32":
+            options["proxy"] = {"server": PER_CONTEXT_PROXY}
+
+        options.update(self.options)
+
+        return options
+
+    def find_executable(self, playwright=None) -> Optional[str]:
+        """
+        실행할 Chromium 경로. 순서: executable_path → WRIGHT_CHROMIUM_PATH 환경변수 →
+        (Playwright 가 설치한 브라우저가 있으면 None 으로 Playwright 에 맡김) → drivers/ms-playwright 등의 설치 폴더.
+        """
+        path = self.executable_path or os.environ.get(EXECUTABLE_ENV)
+        if path:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"[오류] Chromium 실행 파일을 찾을 수 없습니다: {path}")
+            return path
+
+        if playwright is not None and LaunchProfile.installed_executable(playwright):
+            return None
+
+        return LaunchProfile.discover_executable()
+
+    def describe(self, playwright=None):
+        """
+        시작 시간 보고서 등에 남길 프로필 요약.
+        """
+        options = self.launch_options(playwright)
+
+        return {
+            "name": self.name,
+            "headless": self.headless,
+            "new_headless": self.new_headless,
+            "disk_cache_mb": self.disk_cache_mb,
+            "user_data_dir": self.user_data_dir,
+            "executable": options.get("executable_path")
+            or (LaunchProfile.installed_executable(playwright) if playwright else None),
+            "args": options["args"],
+        }
+
+    @staticmethod
+    def resolve(profile=None) -> "LaunchProfile":
+        """
+        LaunchProfile 은 그대로, 이름은 PROFILES 에서 찾아 반환.
+        None 이면 WRIGHT_PROFILE 환경변수, 없으면 DEFAULT_PROFILE.
+        이름으로 고른 프로필에는 WRIGHT_USER_DATA_DIR 환경변수의 프로필 폴더를 적용.
+        """
+        if isinstance(profile, LaunchProfile):
+            return profile
+
+        name = profile or os.environ.get(PROFILE_ENV) or DEFAULT_PROFILE
+        if name not in PROFILES:
+            raise ValueError(
+                f"ValueError - 알 수 없는 실행 프로필: {name} (사용 가능: {', '.join(PROFILES)})"
+            )
+
+        resolved = PROFILES[name]
+
+        user_data_dir = os.environ.get(USER_DATA_DIR_ENV)
+        if user_data_dir and resolved.user_data_dir:
+            resolved = resolved.replace(user_data_dir=user_data_dir)
+
+        return resolved
+
+    @staticmethod
+    def installed_executable(playwright) -> Optional[str]:
+        """
+        Playwright 가 설치한 Chromium 경로 (설치되어 있지 않으면 None).
+        """
+        try:
+            path = playwright.chromium.executable_path
+        except Exception:
+            return None
+
+        return path if path and os.path.exists(path) else None
+
+    @staticmethod
+    def discover_executable(roots=None) -> Optional[str]:
+        """
+        Playwright 브라우저 설치 폴더들에서 가장 최신 리비전의 Chromium 실행 파일을 찾음.
+        기본 검색 위치: PLAYWRIGHT_BROWSERS_PATH, ./drivers/ms-playwright, OS 별 Playwright 캐시 폴더.
+        """
+        candidates = _EXECUTABLES.get(sys.platform, _EXECUTABLES["linux"])
+
+        for root in roots or LaunchProfile.browser_roots():
+            root = Path(root)
+            if not root.is_dir():
+                continue
+
+            revisions = sorted(
+                (p for p in root.glob("chromium-*") if p.name.split("-", 1)[1].isdigit()),
+                key=lambda p: int(p.name.split("-", 1)[1]),
+                reverse=True,
+            )
+
+            for revision in revisions:
+                for candidate in candidates:
+                    path = revision / candidate
+                    if path.exists():
+                        return str(path)
+
+        return None
+
+    @staticmethod
+    def browser_roots():
+        roots = []
+
+        env_root = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+        if env_root and env_root != "0":
+            roots.append(Path(env_root))
+
+        # 이전 배포 방식: 실행 폴더의 drivers 안에 브라우저를 함께 배포
+        roots.append(Path.cwd() / "drivers" / "ms-playwright")
+
+        home = Path.home()
+        if sys.platform == "win32":
+            local = os.environ.get("LOCALAPPDATA") or home / "AppData" / "Local"
+            roots.append(Path(local) / "ms-playwright")
+        elif sys.platform == "darwin":
+            roots.append(home / "Library" / "Caches" / "ms-playwright")
+        else:
+            roots.append(Path(os.environ.get("XDG_CACHE_HOME") or home / ".cache") / "ms-playwright")
+
+        return roots
+
+
+PROFILES = {
+    # 기존 WrightBrowser 실행 옵션: 화면 표시 + 고정 실행 프록시
+    "default": LaunchProfile(name="default", headless=False, proxy=DEFAULT_LAUNCH_PROXY),
+    # 화면에 브라우저를 띄우되 실행 프록시 없이 직접 연결 (로컬 디버깅용)
+    "headed": LaunchProfile(name="headed", headless=False),
+    "headless": LaunchProfile(name="headless"),
+    "new-headless": LaunchProfile(name="new-headless", new_headless=True),
+    # 작업 서버용: GPU/백그라운드 제한 해제, 디스크 캐시 축소
+    "lean": LaunchProfile(name="lean", args=COMMON_ARGS + LEAN_ARGS, disk_cache_mb=64),
+    # lean + 실행 사이에 공유되는 프로필 폴더 (캐시가 데워진 상태로 시작)
+    "warm": LaunchProfile(
+        name="warm",
+        args=COMMON_ARGS + LEAN_ARGS,
+        disk_cache_mb=256,
+        user_data_dir=str(Path.home() / ".cache" / "wright-profile"),
+    ),
+}
@@ -0,0 +1,192 @@
+import fnmatch
+import re
+import weakref
+from collections import Counter
+from urllib.parse import urlsplit
+
+DEFAULT_BLOCKED_TYPES = ("image", "font", "media")
+
+# 관측값이 없을 때 사용하는 리소스 타입별 평균 응답 크기 추정치 (bytes)
+DEFAULT_SIZE_ESTIMATES = {
+    "image": 40_000,
+    "font": 30_000,
+    "media": 500_000,
+    "stylesheet": 20_000,
+    "script": 50_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+    "other": 5_000,
+}
+
+
+class BlockStats:
+    """
+    페이지 하나에 대한 차단/로드 카운터.
+    """
+
+    def __init__(self):
+        self.blocked_requests = 0
+        self.blocked_by_type = Counter()
+        self.blocked_by_reason = Counter()
+        self.loaded_requests = 0
+        self.loaded_bytes = 0
+
+    def to_dict(self, size_of):
+        saved_bytes = sum(
+            count * size_of(resource_type)
+            for resource_type, count in self.blocked_by_type.items()
+        )
+
+        return {
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "blocked_by_reason": dict(self.blocked_by_reason),
+            "loaded_requests": self.loaded_requests,
+            "loaded_bytes": self.loaded_bytes,
+            "estimated_saved_bytes": saved_bytes,
+        }
+
+
+class ResourceBlocker:
+    """
+    page.route / context.route 로 불필요한 리소스 요청을 프록시에 보내기 전에 차단.
+
+    blocker = ResourceBlocker(
+        block_types=("image", "font", "media"),
+        deny_domains=["google-analytics.com", "doubleclick.net"],
+        block_patterns=["*.gif", re.compile(r"/ads?/")],
+    )
+    async with WrightBrowser(playwright, blocker=blocker) as browser:
+        await browser.goto(url)
+        print(blocker.stats(browser.page))
+    """
+
+    def __init__(
+        self,
+        block_types=DEFAULT_BLOCKED_TYPES,
+        allow_domains=None,
+        deny_domains=None,
+        block_patterns=None,
+        size_estimates=None,
+    ):
+        """
+        :param block_types: 차단할 Playwright resource_type 목록 (image, font, media, stylesheet ...)
+        :param allow_domains: 지정 시 이 도메인(및 하위 도메인) 외의 요청은 모두 차단
+        :param deny_domains: 항상 차단할 도메인(및 하위 도메인) 목록 (트래커 등)
+        :param block_patterns: 차단할 URL 패턴, 문자열은 glob, re.Pattern 은 search 로 검사
+        :param size_estimates: 리소스 타입별 응답 크기 추정치 덮어쓰기
+        """
+        self.block_types = frozenset(block_types or ())
+        self.allow_domains = tuple(d.lower().lstrip(".") for d in allow_domains or ())
+        self.deny_domains = tuple(d.lower().lstrip(".") for d in deny_domains or ())
+        self.block_patterns = [
+            p if isinstance(p, re.Pattern) else re.compile(fnmatch.translate(p))
+            for p in block_patterns or ()
+        ]
+        self.size_estimates = {**DEFAULT_SIZE_ESTIMATES, **(size_estimates or {})}
+
+        self._page_stats = weakref.WeakKeyDictionary()
+        self._orphan_stats = BlockStats()
+        self._observed_bytes = Counter()
+        self._observed_count = Counter()
+
+    async def attach(self, target):
+        """
+        Page 또는 BrowserContext 에 차단 라우트와 로드 크기 수집 이벤트를 등록.
+        """
+        await target.route("**/*", self._handle_route)
+        target.on("requestfinished", self._on_request_finished)
+
+    def should_block(self, url, resource_type):
+        """
+        요청을 차단해야 하면 차단 사유를, 아니면 None 을 반환.
+        """
+        host = (urlsplit(url).hostname or "").lower()
+
+        if self.deny_domains and _match_domain(host, self.deny_domains):
+            return "deny_domain"
+        if self.allow_domains and host and not _match_domain(host, self.allow_domains):
+            return "not_allowed_domain"
+        if resource_type in self.block_types:
+            return "resource_type"
+        for pattern in self.block_patterns:
+            if pattern.search(url):
+                return "url_pattern"
+
+        return None
+
+    def stats(self, page=None):
+        """
+        page 를 지정하면 해당 페이지의 카운터를, 생략하면 전체 합계를 반환.
+        estimated_saved_bytes 는 같은 타입의 실제 로드 평균 크기(없으면 추정치) 기준.
+        """
+        if page is not None:
+            return self._page_stats.get(page, BlockStats()).to_dict(self._size_of)
+
+        total = BlockStats()
+        for stats in list(self._page_stats.values()) + [self._orphan_stats]:
+            total.blocked_requests += stats.blocked_requests
+            total.blocked_by_type.update(stats.blocked_by_type)
+            total.blocked_by_reason.update(stats.blocked_by_reason)
+            total.loaded_requests += stats.loaded_requests
+            total.loaded_bytes += stats.loaded_bytes
+
+        return total.to_dict(self._size_of)
+
+    async def _handle_route(self, route, request):
+        # 최상위 문서 이동은 차단하지 않음
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            await route.fallback()
+            return
+
+        reason = self.should_block(request.url, request.resource_type)
+
+        if not reason:
+            await route.fallback()
+            return
+
+        stats = self._stats_for(request)
+        stats.blocked_requests += 1
+        stats.blocked_by_type[request.resource_type] += 1
+        stats.blocked_by_reason[reason] += 1
+
+        await route.abort("blockedbyclient")
+
+    async def _on_request_finished(self, request):
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+
+        size = sizes.get("responseBodySize", 0) + sizes.get("responseHeadersSize", 0)
+
+        stats = self._stats_for(request)
+        stats.loaded_requests += 1
+        stats.loaded_bytes += size
+
+        self._observed_bytes[request.resource_type] += size
+        self._observed_count[request.resource_type] += 1
+
+    def _stats_for(self, request):
+        try:
+            page = request.frame.page
+        except Exception:
+            # service worker 요청 등 페이지에 속하지 않는 요청
+            return self._orphan_stats
+
+        stats = self._page_stats.get(page)
+        if stats is None:
+            stats = self._page_stats[page] = BlockStats()
+
+        return stats
+
+    def _size_of(self, resource_type):
+        count = self._observed_count[resource_type]
+        if count:
+            return self._observed_bytes[resource_type] / count
+
+        return self.size_estimates.get(resource_type, self.size_estimates["other"])
+
+
+def _match_domain(host, domains):
+    return any(host == d or host.endswith("." + d) for d in domains)
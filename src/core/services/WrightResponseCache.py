@@ -0,0 +1,326 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+READWRITE = "readwrite"
+RECORD = "record"
+REPLAY = "replay"
+
+# 본문은 디코딩된 상태로 저장되므로 인코딩/길이 관련 헤더는 재사용하지 않음
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class ResponseCache:
+    """
+    context.route 로 GET 응답을 디스크에 저장하고 재사용하는 응답 캐시.
+
+    - 키: 메서드 + URL + vary_headers 값의 해시
+    - 본문: sha256 해시 이름으로 objects/ 아래에 저장 (같은 본문은 한 번만 저장)
+    - 만료(ttl) 후에는 ETag/Last-Modified 로 재검증, 304 면 저장본을 그대로 사용
+    - 전체 크기가 max_bytes 를 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+    - mode="replay" 면 네트워크 없이 저장본만으로 페이지를 제공 (없는 요청은 차단)
+
+    cache = ResponseCache(".cache/wright", ttl=3600)
+    async with WrightBrowser(playwright, cache=cache) as browser:
+        await browser.goto(url)
+    print(cache.stats())
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache/wright",
+        ttl: float = 3600.0,
+        max_bytes: int = 1024 * 1024 * 1024,
+        mode: str = READWRITE,
+        vary_headers=("accept", "accept-language"),
+        resource_types=None,
+    ):
+        """
+        :param cache_dir: 캐시 저장 디렉토리
+        :param ttl: 저장본을 재검증 없이 사용할 시간 (초)
+        :param max_bytes: 본문 저장 용량 상한
+        :param mode: "readwrite" (기본), "record" (항상 새로 받아 저장), "replay" (오프라인 재생)
+        :param vary_headers: 캐시 키에 포함할 요청 헤더
+        :param resource_types: 캐시할 resource_type 목록 (None 이면 전체)
+        """
+        if mode not in (READWRITE, RECORD, REPLAY):
+            raise ValueError(f"ValueError - 지원하지 않는 캐시 모드: {mode}")
+
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.vary_headers = tuple(h.lower() for h in vary_headers)
+        self.resource_types = frozenset(resource_types) if resource_types else None
+
+        self.counters = Counter()
+
+        os.makedirs(os.path.join(cache_dir, "objects"), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(cache_dir, "index.sqlite3"), check_same_thread=False
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+        )
+        self._db.commit()
+
+    async def attach(self, target):
+        """
+        Page 또는 BrowserContext 에 캐시 라우트를 등록.
+        """
+        await target.route("**/*", self._handle_route)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def stats(self):
+        with self._lock:
+            (entries,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+            total = self._stored_bytes()
+
+        return {**self.counters, "entries": entries, "stored_bytes": total}
+
+    def cache_key(self, method, url, headers):
+        parts = [method.upper(), url]
+        parts += [f"{h}:{headers.get(h, '')}" for h in self.vary_headers]
+
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    async def _handle_route(self, route, request):
+        if request.method != "GET" or (
+            self.resource_types and request.resource_type not in self.resource_types
+        ):
+            if self.mode == REPLAY:
+                self.counters["replay_miss"] += 1
+                await route.abort("internetdisconnected")
+            else:
+                await route.fallback()
+            return
+
+        headers = await request.all_headers()
+        key = self.cache_key(request.method, request.url, headers)
+        entry = await asyncio.to_thread(self._load, key)
+
+        if self.mode == REPLAY:
+            if entry:
+                self.counters["hit"] += 1
+                await self._fulfill(route, entry)
+            else:
+                self.counters["replay_miss"] += 1
+                await route.abort("internetdisconnected")
+            return
+
+        if entry and self.mode == READWRITE:
+            if time.time() - entry["stored_at"] < self.ttl:
+                self.counters["hit"] += 1
+                await self._fulfill(route, entry)
+                return
+
+            validators = _validators(entry["headers"])
+            if validators:
+                await self._revalidate(route, key, entry, validators)
+                return
+
+        await self._fetch_and_store(route, key, request.url, entry)
+
+    async def _revalidate(self, route, key, entry, validators):
+        try:
+            response = await route.fetch(headers={**route.request.headers, **validators})
+        except Exception:
+            self.counters["stale_if_error"] += 1
+            await self._fulfill(route, entry)
+            return
+
+        if response.status == 304:
+            self.counters["revalidated"] += 1
+            await asyncio.to_thread(self._refresh, key)
+            await self._fulfill(route, entry)
+            return
+
+        await self._store_and_fulfill(route, key, route.request.url, response)
+
+    async def _fetch_and_store(self, route, key, url, entry):
+        try:
+            response = await route.fetch()
+        except Exception:
+            if entry:
+                self.counters["stale_if_error"] += 1
+                await self._fulfill(route, entry)
+                return
+
+            # 라우트를 처리하지 않으면 요청이 goto 타임아웃까지 멈추므로 브라우저에 넘겨
+            # 실제 네트워크 오류(연결 끊김, DNS, 프록시 등)가 그대로 페이지 이동 오류로 나오게 함
+            self.counters["fetch_error"] += 1
+            await route.fallback()
+            return
+
+        await self._store_and_fulfill(route, key, url, response)
+
+    async def _store_and_fulfill(self, route, key, url, response):
+        body = await response.body()
+
+        self.counters["miss"] += 1
+
+        if response.status == 200:
+            await asyncio.to_thread(
+                self._store, key, url, response.status, response.headers, body
+            )
+            self.counters["stored"] += 1
+
+        await route.fulfill(response=response, body=body)
+
+    async def _fulfill(self, route, entry):
+        body = await asyncio.to_thread(self._read_object, entry["body_hash"])
+
+        if body is None:
+            # 본문 파일이 사라진 경우 네트워크로 대체
+            if self.mode == REPLAY:
+                await route.abort("internetdisconnected")
+            else:
+                await route.fallback()
+            return
+
+        self.counters["bytes_served"] += len(body)
+
+        await route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+
+    def _load(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, headers, body_hash, stored_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if not row:
+                return None
+
+            self._db.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+
+        status, headers, body_hash, stored_at = row
+
+        return {
+            "status": status,
+            "headers": json.loads(headers),
+            "body_hash": body_hash,
+            "stored_at": stored_at,
+        }
+
+    def _refresh(self, key):
+        with self._lock:
+            now = time.time()
+            self._db.execute(
+                "UPDATE entries SET stored_at = ?, last_access = ? WHERE key = ?",
+                (now, now, key),
+            )
+            self._db.commit()
+
+    def _store(self, key, url, status, headers, body):
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._object_path(body_hash)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(body)
+            os.replace(temp_path, path)
+
+        headers = {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS}
+        now = time.time()
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(headers), body_hash, len(body), now, now),
+            )
+            self._db.commit()
+
+            self._evict()
+
+    def _stored_bytes(self):
+        """
+        본문 파일 크기 합계. 같은 본문은 body_hash 로 한 번만 저장되므로 중복 없이 합산.
+        """
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM"
+            " (SELECT MAX(size) AS size FROM entries GROUP BY body_hash)"
+        ).fetchone()
+
+        return total
+
+    def _evict(self):
+        total = self._stored_bytes()
+
+        if total <= self.max_bytes:
+            return
+
+        rows = self._db.execute(
+            "SELECT key, body_hash, size FROM entries ORDER BY last_access"
+        ).fetchall()
+
+        for key, body_hash, size in rows:
+            if total <= self.max_bytes:
+                break
+
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.counters["evicted"] += 1
+
+            (refs,) = self._db.execute(
+                "SELECT COUNT(*) FROM entries WHERE body_hash = ?", (body_hash,)
+            ).fetchone()
+            if not refs:
+                # 본문을 공유하는 항목이 모두 지워졌을 때만 실제로 공간이 확보됨
+                total -= size
+                try:
+                    os.remove(self._object_path(body_hash))
+                except OSError:
+                    pass
+
+        self._db.commit()
+
+    def _read_object(self, body_hash):
+        try:
+            with open(self._object_path(body_hash), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _object_path(self, body_hash):
+        return os.path.join(self.cache_dir, "objects", body_hash[:2], body_hash)
+
+
+def _validators(headers):
+    lowered = {k.lower(): v for k, v in headers.items()}
+    validators = {}
+
+    if "etag" in lowered:
+        validators["If-None-Match"] = lowered["etag"]
+    if "last-modified" in lowered:
+        validators["If-Modified-Since"] = lowered["last-modified"]
+
+    return validators
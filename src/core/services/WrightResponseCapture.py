@@ -0,0 +1,317 @@
+import asyncio
+import fnmatch
+import inspect
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from app.core.utils.Metrics import metrics
+
+DEFAULT_CONTENT_TYPES = ("application/json", "+json")
+DEFAULT_RESOURCE_TYPES = ("xhr", "fetch")
+
+CAPTURED = "captured"
+PAGINATED = "paginated"
+
+_CLOSED = object()
+
+
+@dataclass
+class CapturedResponse:
+    """
+    디코딩된 JSON 응답 하나.
+    source 는 페이지가 보낸 요청을 잡은 경우 "captured", paginate 로 직접 요청한 경우 "paginated".
+    """
+
+    url: str
+    status: int
+    data: Any
+    content_type: str = ""
+    method: str = "GET"
+    resource_type: Optional[str] = None
+    source: str = CAPTURED
+    elapsed_ms: Optional[float] = None
+
+
+class ResponseCapture:
+    """
+    page.on("response") 로 XHR/fetch JSON 응답을 잡아 callback 또는 asyncio 큐로 전달.
+    DOM 을 렌더링/스크롤해서 긁는 대신 목록 API 응답을 그대로 사용할 때 씀.
+
+    - url_patterns: 잡을 URL 패턴, 문자열은 glob, re.Pattern 은 search 로 검사 (없으면 전체)
+    - content_types: Content-Type 에 포함되어야 하는 문자열 (기본: JSON)
+    - callback 이 없으면 내부 큐에 쌓이고 stream() 으로 꺼냄 (큐가 가득 차면 응답 처리가 대기)
+    - paginate() 로 다음 페이지 API 를 브라우저 렌더링 없이 직접 요청 (컨텍스트 쿠키 공유)
+
+    capture = ResponseCapture(url_patterns=["*/api/items*"])
+    async with WrightBrowser(playwright, capture=capture) as browser:
+        await browser.goto(list_url)
+        first = await capture.next(timeout=10)
+        async for page in capture.paginate(browser.context.request, first.data, first.url):
+            rows.extend(page.data["items"])
+    """
+
+    def __init__(
+        self,
+        url_patterns=None,
+        content_types=DEFAULT_CONTENT_TYPES,
+        resource_types=DEFAULT_RESOURCE_TYPES,
+        callback=None,
+        queue: Optional[asyncio.Queue] = None,
+        max_queue: int = 1000,
+        ok_only: bool = True,
+    ):
+        """
+        :param url_patterns: 잡을 URL 패턴 목록 (None 이면 모든 URL)
+        :param content_types: Content-Type 에 포함되어야 하는 문자열 목록 (None 이면 검사 안 함)
+        :param resource_types: 잡을 Playwright resource_type 목록 (None 이면 전체)
+        :param callback: 응답마다 호출할 함수 callback(CapturedResponse), async 함수 가능
+        :param queue: 응답을 넣을 asyncio.Queue (callback 도 queue 도 없으면 내부 큐 생성)
+        :param max_queue: 내부 큐 크기
+        :param ok_only: True 면 2xx 응답만 잡음
+        """
+        self.url_patterns = [
+            p if isinstance(p, re.Pattern) else re.compile(fnmatch.translate(p))
+            for p in url_patterns or ()
+        ]
+        self.content_types = tuple(t.lower() for t in content_types or ())
+        self.resource_types = frozenset(resource_types) if resource_types else None
+        self.callback = callback
+        self.ok_only = ok_only
+
+        if queue is None and callback is None:
+            queue = asyncio.Queue(maxsize=max_queue)
+        self.queue = queue
+
+        self.counters = Counter()
+
+    async def attach(self, target):
+        """
+        Page 또는 BrowserContext 에 응답 이벤트를 등록.
+        """
+        target.on("response", self._on_response)
+
+    def detach(self, target):
+        target.remove_listener("response", self._on_response)
+
+    def matches(self, url, resource_type=None, content_type="") -> bool:
+        if self.resource_types and resource_type not in self.resource_types:
+            return False
+
+        content_type = (content_type or "").lower()
+        if self.content_types and not any(t in content_type for t in self.content_types):
+            return False
+
+        if self.url_patterns and not any(p.search(url) for p in self.url_patterns):
+            return False
+
+        return True
+
+    def stats(self):
+        return dict(self.counters)
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[CapturedResponse]:
+        """
+        내부 큐에서 다음 응답을 꺼냄. timeout 초 안에 없거나 close() 되었으면 None.
+        """
+        if self.queue is None:
+            raise RuntimeError(
+                "RuntimeError - callback 만 지정된 ResponseCapture 는 next()/stream() 을 쓸 수 없음"
+                " (queue 를 함께 지정해야 함)"
+            )
+
+        try:
+            item = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        if item is _CLOSED:
+            # 다른 소비자도 종료를 볼 수 있도록 다시 넣어 둠
+            self._put_closed()
+            return None
+
+        return item
+
+    async def stream(self, idle_timeout: Optional[float] = None):
+        """
+        잡힌 응답을 들어오는 순서대로 yield.
+        close() 가 호출되거나 idle_timeout 초 동안 새 응답이 없으면 끝남.
+        """
+        while True:
+            item = await self.next(timeout=idle_timeout)
+            if item is None:
+                return
+
+            yield item
+
+    async def close(self):
+        """
+        stream() 소비자에게 종료를 알림.
+        큐가 가득 차 있어도 기다리지 않도록 가장 오래된 응답을 버리고 종료 신호를 넣음.
+        """
+        if self.queue is not None:
+            self._put_closed()
+
+    def _put_closed(self):
+        while True:
+            try:
+                self.queue.put_nowait(_CLOSED)
+                return
+            except asyncio.QueueFull:
+                try:
+                    self.queue.get_nowait()
+                    self.counters["dropped"] += 1
+                except asyncio.QueueEmpty:
+                    pass
+
+    async def paginate(
+        self,
+        request,
+        data,
+        url: str,
+        next_page=None,
+        max_pages: int = 100,
+        delay: float = 0.0,
+        **request_options,
+    ):
+        """
+        첫 페이지 응답(data, url)에서 시작해 다음 페이지 API 를 직접 요청하며 CapturedResponse 를 yield.
+        첫 페이지는 다시 요청하지 않으며, 다음 URL 이 없거나 응답이 실패하면 끝남.
+
+        :param request: APIRequestContext (browser.context.request 면 컨텍스트 쿠키/헤더 공유)
+        :param data: 첫 페이지의 디코딩된 JSON
+        :param url: 첫 페이지 URL (상대 경로 다음 URL 의 기준)
+        :param next_page: next_page(data, url) -> 다음 URL 또는 None (기본: next_url("next"))
+        :param max_pages: 추가로 요청할 최대 페이지 수
+        :param delay: 요청 사이 대기 시간 (초)
+        :param request_options: request.get 에 그대로 전달되는 옵션 (headers, timeout 등)
+        """
+        next_page = next_page or next_url("next")
+
+        for page_index in range(max_pages):
+            url = next_page(data, url)
+            if not url:
+                return
+
+            if delay and page_index:
+                await asyncio.sleep(delay)
+
+            started = time.perf_counter()
+            response = await request.get(url, **request_options)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            metrics.observe("wright.paginate", elapsed_ms, status=response.status)
+
+            if not response.ok:
+                self.counters["paginate_error"] += 1
+                return
+
+            try:
+                data = await response.json()
+            except Exception:
+                self.counters["decode_error"] += 1
+                return
+
+            self.counters[PAGINATED] += 1
+
+            yield CapturedResponse(
+                url=url,
+                status=response.status,
+                data=data,
+                content_type=response.headers.get("content-type", ""),
+                source=PAGINATED,
+                elapsed_ms=round(elapsed_ms, 1),
+            )
+
+    async def _on_response(self, response):
+        request = response.request
+
+        if self.ok_only and not response.ok:
+            return
+
+        content_type = response.headers.get("content-type", "")
+        if not self.matches(response.url, request.resource_type, content_type):
+            return
+
+        try:
+            data = await response.json()
+        except Exception:
+            # 본문을 받기 전에 페이지가 닫혔거나 JSON 이 아닌 경우
+            self.counters["decode_error"] += 1
+            return
+
+        self.counters[CAPTURED] += 1
+        metrics.inc("wright.captured")
+
+        captured = CapturedResponse(
+            url=response.url,
+            status=response.status,
+            data=data,
+            content_type=content_type,
+            method=request.method,
+            resource_type=request.resource_type,
+        )
+
+        await self._deliver(captured)
+
+    async def _deliver(self, captured):
+        if self.callback:
+            try:
+                result = self.callback(captured)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                self.counters["callback_error"] += 1
+
+        if self.queue is not None:
+            await self.queue.put(captured)
+
+
+def next_url(key: str = "next"):
+    """
+    응답 JSON 의 key 값(점으로 중첩 경로 지정, 예: "paging.next")을 다음 URL 로 쓰는 next_page 함수.
+    상대 경로는 현재 URL 기준으로 변환.
+    """
+    path = key.split(".")
+
+    def next_page(data, url):
+        value = data
+        for name in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(name)
+
+        return urljoin(url, value) if isinstance(value, str) and value else None
+
+    return next_page
+
+
+def page_param(param: str = "page", step: int = 1, items_key: Optional[str] = None):
+    """
+    URL 쿼리의 param 값을 step 만큼 늘려 다음 URL 을 만드는 next_page 함수.
+    items_key 를 지정하면 응답의 해당 목록이 비었을 때 끝남 (예: "items", "data.list").
+    """
+    path = items_key.split(".") if items_key else []
+
+    def next_page(data, url):
+        if path:
+            items = data
+            for name in path:
+                items = items.get(name) if isinstance(items, dict) else None
+            if not items:
+                return None
+
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+
+        try:
+            current = int(query.get(param, 0))
+        except ValueError:
+            return None
+
+        query[param] = str(current + step)
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    return next_page
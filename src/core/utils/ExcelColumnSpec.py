@@ -0,0 +1,58 @@
+from typing import Optional, Sequence
+
+
+class ExcelColumnSpec:
+    """
+    엑셀 저장 시 칼럼별 서식 규칙.
+
+    - fixed_columns: 앞쪽에 고정되는 칼럼, 가운데 정렬
+    - link_columns: 값(URL)을 link_text 하이퍼링크로 바꾸는 칼럼
+    - image_columns: 값(출원번호)에 해당하는 사진을 삽입하는 칼럼
+      (None 이면 고정/링크/브랜드 칼럼을 제외한 모든 칼럼)
+    - brand_column: 사진 폴더 이름으로 사용할 브랜드 칼럼 (None 이면 첫 번째 칼럼)
+    """
+
+    def __init__(
+        self,
+        fixed_columns: Sequence[str] = (),
+        link_columns: Sequence[str] = ("브랜드 페이지",),
+        image_columns: Optional[Sequence[str]] = None,
+        brand_column: Optional[str] = None,
+        link_text: str = "바로가기",
+        image_size: int = 60,
+        width_padding: int = 10,
+    ):
+        self.fixed_columns = list(fixed_columns)
+        self.link_columns = list(link_columns)
+        self.image_columns = list(image_columns) if image_columns is not None else None
+        self.brand_column = brand_column
+        self.link_text = link_text
+        self.image_size = image_size
+        self.width_padding = width_padding
+
+    def fixed_in(self, columns):
+        return [col for col in columns if col in self.fixed_columns]
+
+    def links_in(self, columns):
+        return [col for col in columns if col in self.link_columns]
+
+    def brand_in(self, columns):
+        if self.brand_column is not None:
+            return self.brand_column if self.brand_column in columns else None
+
+        return columns[0] if columns else None
+
+    def images_in(self, columns):
+        if self.image_columns is not None:
+            return [col for col in columns if col in self.image_columns]
+
+        excluded = set(self.fixed_columns) | set(self.link_columns)
+        excluded.add(self.brand_in(columns))
+
+        return [col for col in columns if col not in excluded]
+
+    def order(self, columns):
+        """
+        고정 칼럼을 앞에 두고 나머지는 등장 순서대로 정렬한 최종 칼럼 목록.
+        """
+        return self.fixed_columns + [c for c in columns if c not in self.fixed_columns]
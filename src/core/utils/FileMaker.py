@@ -1,13 +1,38 @@
 import os
 import json
-import pandas as pd
-from openpyxl.drawing.image import Image
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, Font
-from openpyxl.utils import get_column_letter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from app.core.utils.ExcelColumnSpec import ExcelColumnSpec
+from app.core.utils.ImageIndex import ImageIndex
+from app.core.utils.LazyImport import LazyImport
 from app.core.utils.Logger import Logger
+from app.core.utils.Metrics import metrics
+from app.core.utils.RecordSink import iter_records, open_sink, record_columns
 
-logger = Logger(name="FileMaker", log_file="FileMaker.log").get_logger()
+# json/레코드 저장만 쓰는 경우 pandas/numpy/openpyxl 을 불러오지 않도록 사용 시점에 import
+np = LazyImport("numpy")
+pd = LazyImport("pandas")
+
+logger = Logger.lazy(name="FileMaker", log_file="FileMaker.log")
+
+# 엑셀 HYPERLINK 함수의 URL 길이 제한
+_HYPERLINK_MAX_LENGTH = 255
+
+
+@lru_cache(maxsize=None)
+def _excel_styles():
+    """
+    셀마다 새로 만들지 않도록 공유하는 스타일 객체 (openpyxl 스타일은 불변).
+    (링크 글꼴, 가운데 정렬, 사진 정렬)
+    """
+    from openpyxl.styles import Alignment, Font
+
+    return (
+        Font(color="0000FF", underline="single"),
+        Alignment(horizontal="center", vertical="center"),
+        Alignment(horizontal="center", vertical="bottom"),
+    )
 
 
 class FileMaker:
@@ -15,144 +40,464 @@ class FileMaker:
         pass
 
     @staticmethod
-    def save_list_to_json(list):
+    def save_list_to_json(list, json_file_path=".data/musinsa_event_links.json"):
         if len(list) == 0:
             logger.info("json파일저장실패, 저장된 링크 없음")
             return False
 
-        json_file_path = ".data/musinsa_event_links.json"
+        os.makedirs(os.path.dirname(json_file_path) or ".", exist_ok=True)
 
-        with open(json_file_path, "w", encoding="utf-8") as json_file:
+        # 임시 파일에 쓴 뒤 이름 변경 (저장 도중 중단되어도 기존 파일 유지)
+        temp_file_path = f"{json_file_path}.tmp"
+        with open(temp_file_path, "w", encoding="utf-8") as json_file:
             json.dump(list, json_file, ensure_ascii=False, indent=4)
+        os.replace(temp_file_path, json_file_path)
 
         print(f"총 {len(list)}개의 링크를 {json_file_path} 파일에 저장완료")
 
+    @staticmethod
+    def open_sink(path, resume=False, **options):
+        """
+        스크래핑 결과를 묶음 단위로 이어 쓰는 저장소를 생성 (.ndjson/.jsonl, .csv, .parquet).
+        전체 결과를 메모리에 모으지 않고 생성되는 대로 기록하며, close() 시 원자적으로 완성됨.
+
+        with FileMaker.open_sink(".data/results.parquet", resume=True) as sink:
+            for result in results:
+                sink.write([result])
+        FileMaker.save_excel_from_records(".data/results.parquet", "results")
+        """
+        return open_sink(path, resume=resume, **options)
+
+    @staticmethod
+    def save_excel_from_records(source_path, file_name=None, chunk_rows=1000, **options):
+        """
+        open_sink 로 저장한 결과 파일을 읽어 엑셀 보고서를 만드는 별도 단계.
+        파일을 chunk_rows 개씩 읽어 save_to_excel_streaming 으로 기록하므로 메모리 사용량이 일정함.
+
+        :param source_path: .ndjson/.jsonl, .csv, .parquet 결과 파일
+        :param file_name: 엑셀 파일명 (생략 시 source_path 의 확장자를 .xlsx 로 바꾼 이름)
+        :param options: save_to_excel_streaming 에 전달할 옵션 (fixed_columns, root_dir 등)
+        :return: 저장된 파일 경로
+        """
+        if file_name is None:
+            file_name = os.path.splitext(source_path)[0]
+
+        columns = options.pop("columns", None)
+        if columns is None:
+            columns = record_columns(source_path)
+        if columns is None:
+            # NDJSON 처럼 칼럼이 파일에 없으면 한 번 훑어 모든 레코드의 칼럼을 모음
+            seen = {}
+            for record in iter_records(source_path, batch_rows=chunk_rows):
+                seen.update(dict.fromkeys(record))
+            columns = list(seen)
+
+        column_spec = options.get("column_spec") or ExcelColumnSpec(
+            fixed_columns=options.get("fixed_columns") or [],
+            link_columns=options.get("link_columns", ("브랜드 페이지",)) or (),
+        )
+        options["column_spec"] = column_spec
+        columns = column_spec.order(columns)
+
+        return FileMaker.save_to_excel_streaming(
+            iter_records(source_path, batch_rows=chunk_rows),
+            file_name,
+            columns=columns,
+            chunk_rows=chunk_rows,
+            **options,
+        )
+
     @staticmethod
     def save_to_excel_for_musinsa(
         infos_list,
         file_name="infos_list",
         fixed_columns=None,
         root_dir="상표권출원등록사진",
+        image_index=None,
+        thumbnails=None,
+        column_spec=None,
     ):
-        if fixed_columns is None:
-            fixed_columns = []
+        """
+        레코드 리스트를 엑셀로 저장하면서 링크, 정렬, 사진을 적용.
+        칼럼 너비와 링크/사진 위치는 DataFrame 연산으로 한 번에 계산한 뒤,
+        해당 셀에만 서식을 적용 (임시 파일 저장/재로딩 없음).
 
-        # infos_list를 데이터프레임으로 변환
-        df = pd.DataFrame(infos_list)
+        image_index: 미리 만든 ImageIndex (생략 시 root_dir 을 한 번 훑어 생성)
+        thumbnails: ThumbnailCache 지정 시 원본 대신 미리 줄인 썸네일을 삽입
+        column_spec: 칼럼 서식 규칙 ExcelColumnSpec
+            (생략 시 fixed_columns 고정, "브랜드 페이지" 링크, 첫 칼럼 브랜드, 나머지 사진 칼럼)
+        """
+        from openpyxl import Workbook
+        from openpyxl.utils import get_column_letter
+
+        link_font, center_alignment, image_alignment = _excel_styles()
 
-        # 동적으로 추가되는 칼럼 추출
-        dynamic_columns = [col for col in df.columns if col not in fixed_columns]
+        phase = metrics.stopwatch("excel")
 
-        # 최종 칼럼 순서: 고정 칼럼 + 동적 칼럼
-        final_columns = fixed_columns + dynamic_columns
+        if column_spec is None:
+            column_spec = ExcelColumnSpec(fixed_columns=fixed_columns or [])
 
-        # 누락된 칼럼은 빈 문자열로 채우기
-        for col in final_columns:
-            if col not in df.columns:
-                df[col] = ""
+        if image_index is None:
+            image_index = ImageIndex(root_dir)
+        phase("index")
+
+        # infos_list를 데이터프레임으로 변환 후 최종 칼럼 순서로 정렬 (누락된 칼럼은 빈 문자열)
+        df = pd.DataFrame(infos_list)
+        final_columns = column_spec.order(list(df.columns))
+        df = FileMaker._normalize_frame(df, final_columns, fill_value="")
 
-        # 데이터프레임을 최종 칼럼 순서로 정렬
-        df = df[final_columns]
+        present = FileMaker._present_mask(df)
+        widths = FileMaker._column_widths(df, present, column_spec)
+        image_paths = FileMaker._image_paths(
+            df, present, column_spec, image_index.lookup()
+        )
+        phase("prepare")
 
-        # 임시 엑셀 파일로 저장
-        temp_file = f"{file_name}_temp.xlsx"
-        df.to_excel(temp_file, index=False)
+        thumbnail_paths = FileMaker._prepare_thumbnails(thumbnails, image_paths)
+        phase("thumbnails")
 
-        # openpyxl을 사용하여 하이퍼링크 추가 및 사진 삽입
-        workbook = load_workbook(temp_file)
+        workbook = Workbook()
         sheet = workbook.active
 
-        # "브랜드 페이지" 열의 위치를 찾기
-        brand_page_column = None
-        for col in sheet.iter_cols(1, sheet.max_column, 1, 1):
-            if col[0].value == "브랜드 페이지":
-                brand_page_column = col[0].column_letter
-                break
-
-        # "브랜드 페이지" 열에 하이퍼링크 추가
-        for row in range(2, sheet.max_row + 1):  # 헤더 제외
-            cell = sheet[f"{brand_page_column}{row}"]
-            url = cell.value
-            if url:
-                cell.value = "바로가기"
-                cell.hyperlink = url
-                cell.font = Font(color="0000FF", underline="single")
-
-        # Fixed columns 셀 값 세로 기준 가운데 정렬
-        for col in fixed_columns:
-            if col in final_columns:
-                col_idx = final_columns.index(col) + 1  # 1부터 시작하는 엑셀 인덱스
-                col_letter = get_column_letter(col_idx)
-                for row in range(2, sheet.max_row + 1):  # 헤더 제외
-                    cell = sheet[f"{col_letter}{row}"]
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
-
-
-        # 동적으로 추가된 칼럼에 사진 삽입 및 정렬
-        for col in dynamic_columns:
-            col_idx = final_columns.index(col) + 1  # 엑셀 컬럼 인덱스는 1부터 시작
-            col_letter = get_column_letter(col_idx)
-
-            for row in range(2, sheet.max_row + 1):  # 헤더 제외
-                brand = sheet[f"A{row}"].value  # 브랜드 셀 값 가져오기 (A열 가정)
-                application_number = sheet[f"{col_letter}{row}"].value  # 출원번호 값 가져오기
-
-                if not (brand and application_number):  # 값이 없으면 건너뜀
-                    continue
-
-                # 루트 디렉토리에서 브랜드 하위 디렉토리 찾기
-                brand_dir = os.path.join(root_dir, brand)
-                if not os.path.isdir(brand_dir):
-                    continue
-
-                # 하위 디렉토리에서 출원번호와 일치하는 jpg 파일 찾기
-                image_path = os.path.join(brand_dir, f"{application_number}.jpg")
-                if os.path.isfile(image_path):
-                    # 셀 값 유지
-                    cell = sheet[f"{col_letter}{row}"]
-                    cell.value = application_number
-
-                    # 텍스트 정렬
-                    cell.alignment = Alignment(horizontal="center", vertical="bottom")
-
-                    # 사진 삽입
-                    img = Image(image_path)
-                    img.height = 60  # 이미지 높이 조정
-                    img.width = 60  # 이미지 너비 조정
-                    img.anchor = f"{col_letter}{row}"
-                    sheet.add_image(img)
-
-                    # 행 높이와 열 너비를 이미지 크기에 맞춤
-                    sheet.row_dimensions[row].height = img.height + 10
-                    sheet.column_dimensions[col_letter].width = (img.width / 7) + 2  # 엑셀의 열 너비 단위 변환
-
-        # 칼럼 너비를 자동으로 조정
-        for col_idx, column_cells in enumerate(sheet.columns, start=1):
-            max_length = 0
-            col_letter = get_column_letter(col_idx)
-            for cell in column_cells:
-                if cell.value:
-                    try:
-                        max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-            adjusted_width = max_length + 10
-            sheet.column_dimensions[col_letter].width = adjusted_width
+        for col_idx, width in enumerate(widths, start=1):
+            sheet.column_dimensions[get_column_letter(col_idx)].width = width
+
+        sheet.append(final_columns)
+        for row in df.itertuples(index=False, name=None):
+            sheet.append(row)
+        phase("rows")
+
+        col_index = {col: idx for idx, col in enumerate(final_columns, start=1)}
+        row_count = len(df)
+
+        # 링크 칼럼: 값이 있는 셀만 하이퍼링크로 변환
+        for col in column_spec.links_in(final_columns):
+            for row in np.flatnonzero(present[col].to_numpy()):
+                cell = sheet.cell(row=row + 2, column=col_index[col])
+                cell.hyperlink = cell.value
+                cell.value = column_spec.link_text
+                cell.font = link_font
+
+        # 고정 칼럼: 세로 기준 가운데 정렬
+        for col in column_spec.fixed_in(final_columns):
+            for row in range(2, row_count + 2):
+                sheet.cell(row=row, column=col_index[col]).alignment = center_alignment
+
+        # 사진 칼럼: 사진이 있는 셀에만 사진 삽입 및 정렬
+        image_count = 0
+        for col, paths in image_paths.items():
+            col_letter = get_column_letter(col_index[col])
+
+            for row in np.flatnonzero(paths.notna().to_numpy()):
+                sheet.cell(row=row + 2, column=col_index[col]).alignment = image_alignment
+
+                img = FileMaker._image(paths.iat[row], thumbnail_paths, column_spec)
+                img.anchor = f"{col_letter}{row + 2}"
+                sheet.add_image(img)
+
+                sheet.row_dimensions[row + 2].height = column_spec.image_size + 10
+                image_count += 1
+        phase("styles")
 
         # 최종 엑셀 파일 저장
-        if not file_name.endswith(".xlsx"):
-            final_file = f"{file_name}.xlsx"
-        else:
-            final_file = file_name
+        final_file = file_name if file_name.endswith(".xlsx") else f"{file_name}.xlsx"
 
         workbook.save(final_file)
         workbook.close()
+        phase("save")
+        metrics.inc("excel.rows", row_count)
+        metrics.inc("excel.images", image_count)
 
-        # temp.xlsx 삭제
+        logger.info(
+            f"엑셀 저장 완료: {final_file} (행 {row_count}개, 사진 {image_count}개)"
+        )
+        print(f"파일이 저장되었습니다: {final_file}")
+
+    @staticmethod
+    def save_to_excel_streaming(
+        records,
+        file_name="infos_list",
+        fixed_columns=None,
+        columns=None,
+        root_dir="상표권출원등록사진",
+        link_columns=("브랜드 페이지",),
+        chunk_rows=1000,
+        image_index=None,
+        thumbnails=None,
+        column_spec=None,
+    ):
+        """
+        레코드 이터레이터를 openpyxl write-only 모드로 한 번에 기록하는 엑셀 저장.
+        임시 파일 저장/재로딩 없이 행을 쓰는 시점에 링크, 정렬, 사진을 적용하므로
+        행 수와 상관없이 메모리 사용량이 일정함 (chunk_rows 개씩 DataFrame 으로 묶어 처리).
+
+        - 칼럼 순서: columns 지정 시 그대로, 아니면 고정 칼럼 + 첫 묶음에서 발견된 칼럼
+          (헤더를 먼저 써야 하므로 이후 묶음에서 처음 나온 칼럼은 기록되지 않고 경고 로그로 남김.
+           모든 칼럼이 필요하면 columns 를 지정)
+        - 칼럼 너비: 헤더와 첫 묶음 기준 (write-only 모드는 너비를 먼저 지정해야 함)
+        - 링크 칼럼 값은 HYPERLINK 수식으로 기록 (255자 초과 URL 은 원문 유지)
+        - 사진 칼럼 값은 출원번호로 보고 image_index 에 사진이 있으면 삽입
+
+        :param records: dict 레코드 이터러블 (generator 가능)
+        :param image_index: 미리 만든 ImageIndex (생략 시 root_dir 을 한 번 훑어 생성)
+        :param thumbnails: ThumbnailCache 지정 시 원본 대신 미리 줄인 썸네일을 삽입
+        :param column_spec: 칼럼 서식 규칙 ExcelColumnSpec (생략 시 fixed_columns, link_columns 로 생성)
+        :return: 저장된 파일 경로
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
+        link_font, center_alignment, image_alignment = _excel_styles()
+
+        if column_spec is None:
+            column_spec = ExcelColumnSpec(
+                fixed_columns=fixed_columns or [], link_columns=link_columns or ()
+            )
+
+        phase = metrics.stopwatch("excel_streaming")
+
+        if image_index is None:
+            image_index = ImageIndex(root_dir)
+        phase("index")
+
+        image_lookup = image_index.lookup()
+
+        records = iter(records)
+        first_chunk = list(islice(records, chunk_rows))
+
+        # 칼럼을 첫 묶음에서 정한 경우에만 이후 묶음의 새 칼럼을 확인
+        inferred = columns is None
+        if inferred:
+            seen = {}
+            for record in first_chunk:
+                seen.update(dict.fromkeys(record))
+            columns = column_spec.order(list(seen))
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+
+        first_frame = FileMaker._normalize_frame(pd.DataFrame(first_chunk), columns)
+        widths = FileMaker._column_widths(
+            first_frame, FileMaker._present_mask(first_frame), column_spec
+        )
+        for col_idx, width in enumerate(widths, start=1):
+            sheet.column_dimensions[get_column_letter(col_idx)].width = width
+
+        sheet.append(columns)
+
+        col_letters = [get_column_letter(i) for i in range(1, len(columns) + 1)]
+        link_idx = [columns.index(col) for col in column_spec.links_in(columns)]
+        fixed_idx = [columns.index(col) for col in column_spec.fixed_in(columns)]
+
+        row_idx = 2
+        image_count = 0
+        thumbnail_paths = {}
+        known_columns = set(columns)
+        dropped_columns = {}
+        chunks = chain([first_chunk], iter(lambda: list(islice(records, chunk_rows)), []))
+
+        # 묶음마다 프로세스 풀을 새로 띄우지 않도록 내보내기 전체에서 하나를 공유
+        # (워커 프로세스는 처음 썸네일을 생성할 때 시작됨)
+        executor = ProcessPoolExecutor() if thumbnails else None
         try:
-            os.remove(temp_file)
-            print(f"임시 파일 {temp_file}이 삭제되었습니다.")
-        except Exception as e:
-            print(f"임시 파일 {temp_file} 삭제 중 오류 발생: {e}")
+            for chunk in chunks:
+                if inferred and chunk is not first_chunk:
+                    FileMaker._count_unknown_columns(chunk, known_columns, dropped_columns)
+
+                frame = (
+                    first_frame
+                    if chunk is first_chunk
+                    else FileMaker._normalize_frame(pd.DataFrame(chunk), columns)
+                )
+                present_mask = FileMaker._present_mask(frame)
+                present = present_mask.to_numpy()
+                chunk_images = FileMaker._image_paths(
+                    frame, present_mask, column_spec, image_lookup
+                )
+                image_arrays = [
+                    (columns.index(col), paths.to_numpy(dtype=object))
+                    for col, paths in chunk_images.items()
+                ]
+
+                # 레코드를 미리 알 수 없으므로 묶음마다 새로 참조된 사진의 썸네일만 생성
+                thumbnail_paths.update(
+                    FileMaker._prepare_thumbnails(
+                    thumbnails, chunk_images, known=thumbnail_paths, executor=executor
+                )
+                )
+
+                for i, values in enumerate(frame.itertuples(index=False, name=None)):
+                    row = [WriteOnlyCell(sheet, value=value) for value in values]
+
+                    for c in link_idx:
+                        if present[i, c]:
+                            row[c].value = FileMaker._hyperlink_formula(
+                                values[c], column_spec.link_text
+                            )
+                            row[c].font = link_font
+
+                    for c in fixed_idx:
+                        row[c].alignment = center_alignment
+
+                    has_image = False
+                    for c, paths in image_arrays:
+                        if isinstance(paths[i], str):
+                            row[c].alignment = image_alignment
+
+                            img = FileMaker._image(paths[i], thumbnail_paths, column_spec)
+                            img.anchor = f"{col_letters[c]}{row_idx}"
+                            sheet.add_image(img)
+
+                            has_image = True
+                            image_count += 1
+
+                    # write-only 모드에서는 행을 쓰기 전에 행 높이를 지정해야 함
+                    if has_image:
+                        sheet.row_dimensions[row_idx].height = column_spec.image_size + 10
+
+                    sheet.append(row)
+                    row_idx += 1
+        finally:
+            if executor:
+                executor.shutdown()
+        phase("rows")
+
+        final_file = file_name if file_name.endswith(".xlsx") else f"{file_name}.xlsx"
 
-        print(f"파일이 저장되었습니다: {final_file}")
+        workbook.save(final_file)
+        workbook.close()
+        phase("save")
+        metrics.inc("excel.rows", row_idx - 2)
+        metrics.inc("excel.images", image_count)
+
+        if dropped_columns:
+            logger.warning(
+                f"첫 묶음 이후에 처음 나온 칼럼은 엑셀에 기록되지 않음: {final_file} "
+                f"{dropped_columns} (칼럼별 레코드 수, 모든 칼럼이 필요하면 columns 지정)"
+            )
+
+        logger.info(
+            f"엑셀 저장 완료: {final_file} (행 {row_idx - 2}개, 사진 {image_count}개)"
+        )
+
+        return final_file
+
+    @staticmethod
+    def _count_unknown_columns(chunk, known_columns, counts):
+        """
+        헤더에 없는 칼럼이 값으로 들어 있는 레코드 수를 칼럼별로 셈.
+        """
+        for record in chunk:
+            for key in record.keys() - known_columns:
+                counts[key] = counts.get(key, 0) + 1
+
+    @staticmethod
+    def _normalize_frame(df, columns, fill_value=None):
+        """
+        칼럼 순서를 맞추고 누락 칼럼은 fill_value, 결측값(NaN)은 None 으로 바꿈.
+        결측값 때문에 float 이 된 정수 칼럼(출원번호 등)은 정수로 되돌림.
+        """
+        df = df.reindex(columns=columns, fill_value=fill_value)
+
+        for col in df.columns:
+            values = df[col]
+            if values.dtype.kind == "f":
+                filled = values.dropna()
+                if (filled % 1 == 0).all():
+                    df[col] = values.astype("Int64")
+
+        df = df.astype(object)
+
+        return df.where(df.notna(), None)
+
+    @staticmethod
+    def _present_mask(df):
+        """
+        값이 있는 셀(None, 빈 문자열, 0 제외)의 bool 마스크.
+        """
+        return df.astype(bool)
+
+    @staticmethod
+    def _column_widths(df, present, column_spec):
+        """
+        칼럼별 (헤더와 값 중 가장 긴 문자열 길이 + 여백) 을 DataFrame 연산으로 계산.
+        링크 칼럼은 셀에 표시되는 link_text 길이를 기준으로 함.
+        """
+        columns = list(df.columns)
+        header = np.array([len(str(col)) for col in columns])
+
+        if df.empty:
+            return (header + column_spec.width_padding).tolist()
+
+        lengths = df.astype(str).apply(lambda column: column.str.len()).where(present, 0)
+        for col in column_spec.links_in(columns):
+            lengths[col] = present[col] * len(column_spec.link_text)
+
+        longest = lengths.max().fillna(0).to_numpy(dtype=int)
+
+        return (np.maximum(longest, header) + column_spec.width_padding).tolist()
+
+    @staticmethod
+    def _image_paths(df, present, column_spec, lookup):
+        """
+        사진 칼럼별로 (브랜드, 출원번호) 에 해당하는 사진 경로 Series 를 계산 (없으면 NaN).
+        사진이 하나도 없는 칼럼은 제외.
+        lookup: ImageIndex.lookup() 의 {"브랜드/출원번호": 경로} (내보내기마다 한 번만 생성)
+        """
+        columns = list(df.columns)
+        brand_column = column_spec.brand_in(columns)
+
+        if df.empty or brand_column is None or not lookup:
+            return {}
+
+        brands = df[brand_column].astype(str) + "/"
+
+        result = {}
+        for col in column_spec.images_in(columns):
+            paths = (brands + df[col].astype(str)).map(lookup)
+            paths = paths.where(present[brand_column] & present[col])
+
+            if paths.notna().any():
+                result[col] = paths
+
+        return result
+
+    @staticmethod
+    def _image(image_path, thumbnail_paths, column_spec):
+        from openpyxl.drawing.image import Image
+
+        img = Image(thumbnail_paths.get(image_path, image_path))
+        img.height = column_spec.image_size
+        img.width = column_spec.image_size
+
+        return img
+
+    @staticmethod
+    def _hyperlink_formula(url, link_text="바로가기"):
+        url = str(url)
+        if len(url) > _HYPERLINK_MAX_LENGTH:
+            return url
+
+        escaped = url.replace('"', '""')
+
+        return f'=HYPERLINK("{escaped}", "{link_text}")'
+
+    @staticmethod
+    def _prepare_thumbnails(thumbnails, image_paths, known=None, executor=None):
+        """
+        엑셀에 들어갈 사진(_image_paths 결과)만 썸네일을 병렬로 미리 생성하고 {원본: 썸네일} 을 반환.
+        known 에 이미 있는 원본은 건너뜀. 썸네일 캐시가 없으면 빈 dict (원본 사용).
+        executor: 묶음마다 호출할 때 공유할 프로세스 풀 (생략 시 호출마다 새로 생성)
+        """
+        if not thumbnails or not image_paths:
+            return {}
+
+        sources = set()
+        for paths in image_paths.values():
+            sources.update(paths.dropna())
+
+        if known:
+            sources.difference_update(known)
+
+        return thumbnails.ensure(sorted(sources), executor=executor) if sources else {}
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+
+class ImageIndex:
+    """
+    root_dir/<브랜드>/<출원번호>.jpg 구조의 사진 폴더를 한 번만 훑어
+    {브랜드: {출원번호: 경로}} 색인을 만드는 클래스.
+
+    index_file 을 지정하면 색인을 JSON 으로 저장하고, 다음 실행에서는
+    수정 시간(mtime)이 바뀐 브랜드 디렉토리만 다시 읽음.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        index_file: Optional[str] = None,
+        extensions=(".jpg",),
+    ):
+        """
+        Args:
+            root_dir (str): 사진 루트 디렉토리.
+            index_file (Optional[str]): 색인 저장 파일 경로 (None 이면 저장하지 않음).
+            extensions (tuple): 색인할 확장자 (소문자).
+        """
+        self.root_dir = root_dir
+        self.index_file = index_file
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.brands = {}
+        self._mtimes = {}
+        self._lookup = None
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        루트 디렉토리를 다시 훑어 변경된 브랜드 디렉토리만 갱신.
+        """
+        persisted = self._load_index_file()
+        brands = {}
+        mtimes = {}
+        changed = False
+
+        if os.path.isdir(self.root_dir):
+            with os.scandir(self.root_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+
+                    mtime = entry.stat().st_mtime
+                    cached = persisted.get(entry.name)
+
+                    if cached and cached["mtime"] == mtime:
+                        images = cached["images"]
+                    else:
+                        images = self._scan_brand(entry.path)
+                        changed = True
+
+                    brands[entry.name] = images
+                    mtimes[entry.name] = mtime
+
+        changed = changed or set(brands) != set(persisted)
+
+        self.brands = brands
+        self._mtimes = mtimes
+        self._lookup = None
+
+        if changed:
+            self._save_index_file()
+
+    def find(self, brand, application_number) -> Optional[str]:
+        """
+        브랜드와 출원번호에 해당하는 사진 경로를 반환 (없으면 None).
+        """
+        images = self.brands.get(str(brand))
+        if not images:
+            return None
+
+        return images.get(str(application_number))
+
+    def lookup(self) -> dict:
+        """
+        {"브랜드/출원번호": 경로} 평면 색인 (처음 호출할 때 만들고 refresh 전까지 재사용).
+        """
+        if self._lookup is None:
+            self._lookup = {
+                f"{brand}/{number}": path
+                for brand, images in self.brands.items()
+                for number, path in images.items()
+            }
+
+        return self._lookup
+
+    def paths(self):
+        for images in self.brands.values():
+            yield from images.values()
+
+    def __len__(self):
+        return sum(len(images) for images in self.brands.values())
+
+    def _scan_brand(self, brand_dir):
+        images = {}
+        with os.scandir(brand_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() in self.extensions and entry.is_file():
+                    images[stem] = entry.path
+
+        return images
+
+    def _load_index_file(self):
+        if not self.index_file or not os.path.isfile(self.index_file):
+            return {}
+
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if data.get("root_dir") != os.path.abspath(self.root_dir):
+            return {}
+
+        return data.get("brands", {})
+
+    def _save_index_file(self):
+        if not self.index_file:
+            return
+
+        data = {
+            "root_dir": os.path.abspath(self.root_dir),
+            "brands": {
+                brand: {"mtime": self._mtimes[brand], "images": images}
+                for brand, images in self.brands.items()
+            },
+        }
+
+        os.makedirs(os.path.dirname(self.index_file) or ".", exist_ok=True)
+        temp_file = f"{self.index_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_file, self.index_file)
+
+
+class ThumbnailCache:
+    """
+    원본 사진을 엑셀 표시 크기로 미리 줄여 저장하는 썸네일 캐시.
+    원본 경로, 수정 시간, 크기로 파일명을 정하므로 원본이 바뀌면 자동으로 새로 생성됨.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/thumbnails", size=(60, 60), quality=85):
+        """
+        Args:
+            cache_dir (str): 썸네일 저장 디렉토리.
+            size (tuple): 썸네일 크기 (가로, 세로).
+            quality (int): JPEG 저장 품질.
+        """
+        self.cache_dir = cache_dir
+        self.size = tuple(size)
+        self.quality = quality
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path_for(self, source: str) -> str:
+        mtime = os.stat(source).st_mtime_ns
+        key = f"{os.path.abspath(source)}|{mtime}|{self.size[0]}x{self.size[1]}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.jpg")
+
+    def get(self, source: str) -> str:
+        """
+        썸네일 경로를 반환. 없으면 현재 프로세스에서 바로 생성.
+        """
+        target = self.path_for(source)
+        if not os.path.isfile(target):
+            _make_thumbnail((source, target, self.size, self.quality))
+
+        return target
+
+    def ensure(self, sources, workers: Optional[int] = None, executor=None) -> dict:
+        """
+        여러 원본의 썸네일을 프로세스 풀로 병렬 생성.
+        executor 를 넘기면 그 풀을 사용 (여러 번 호출할 때 풀을 한 번만 만들도록),
+        없으면 새로 만든 풀을 사용한 뒤 닫음.
+
+        Returns:
+            dict: {원본 경로: 썸네일 경로} (생성 실패한 원본은 제외)
+        """
+        result = {}
+        missing = []
+
+        for source in sources:
+            try:
+                target = self.path_for(source)
+            except OSError:
+                continue
+
+            result[source] = target
+            if not os.path.isfile(target):
+                missing.append((source, target, self.size, self.quality))
+
+        if not missing:
+            return result
+
+        owned = executor is None
+        if owned:
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+        try:
+            for (source, _, _, _), ok in zip(
+                missing, executor.map(_make_thumbnail, missing, chunksize=32)
+            ):
+                if not ok:
+                    result.pop(source, None)
+        finally:
+            if owned:
+                executor.shutdown()
+
+        return result
+
+
+def _make_thumbnail(args) -> bool:
+    from PIL import Image as PILImage
+
+    source, target, size, quality = args
+
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        with PILImage.open(source) as img:
+            thumbnail = img.convert("RGB").resize(size, PILImage.LANCZOS)
+
+        temp_target = f"{target}.{os.getpid()}.tmp"
+        thumbnail.save(temp_target, "JPEG", quality=quality)
+        os.replace(temp_target, target)
+
+        return True
+    except Exception:
+        return False
@@ -0,0 +1,69 @@
+import importlib
+from typing import Optional
+
+
+class LazyImport:
+    """
+    처음 속성에 접근할 때 import 되는 모듈(또는 모듈 안의 이름) 대리 객체.
+    무거운 의존성(selenium, pandas, openpyxl)을 모듈 수준 이름으로 쓰면서
+    import 비용은 실제로 사용하는 시점으로 미룸.
+
+    pd = LazyImport("pandas")
+    By = LazyImport("selenium.webdriver.common.by", "By")
+
+    pd.DataFrame(...)  # 이 시점에 pandas import
+    By.XPATH
+
+    - 대리한 이름이 클래스/함수면 그대로 호출 가능 (WebDriverWait(driver, 10))
+    - 대리 객체이므로 isinstance/except 에는 쓸 수 없음 (exceptions.TimeoutException 처럼 속성으로 접근)
+    - 함수 기본값/클래스 본문처럼 import 시점에 평가되는 곳에서 속성에 접근하면 바로 import 됨
+    """
+
+    __slots__ = ("_module_name", "_attribute", "_target")
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        """
+        :param module_name: import 할 모듈 이름
+        :param attribute: 모듈 대신 대리할 모듈 안의 이름 (예: 클래스)
+        """
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+
+    def __getattr__(self, name):
+        target = self._target
+        if target is None:
+            target = self._load()
+
+        return getattr(target, name)
+
+    def __call__(self, *args, **kwargs):
+        target = self._target
+        if target is None:
+            target = self._load()
+
+        return target(*args, **kwargs)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        name = self._module_name
+        if self._attribute:
+            name = f"{name}.{self._attribute}"
+
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {name} ({state})>"
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def _load(self):
+        # import_module 은 스레드 안전하므로 여러 스레드가 동시에 불러도 같은 모듈을 받음
+        target = importlib.import_module(self._module_name)
+        if self._attribute:
+            target = getattr(target, self._attribute)
+
+        self._target = target
+        return target
@@ -1,13 +1,36 @@
+import atexit
+import contextvars
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
 import sys
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from typing import Optional
 
 # 모듈 버전 정의
 __version__ = "1.0.0"
 
+# 큐 모드 기본값을 켜는 환경 변수 (값이 "1", "true", "yes" 이면 사용)
+QUEUE_ENV = "LOGGER_QUEUE"
+
+DROP = "drop"
+BLOCK = "block"
+
+# 로거 이름별 큐 리스너 (같은 이름의 Logger 를 여러 번 만들어도 하나만 실행)
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+# 구조화 로그에 기록되는 작업 단위 필드 (이 외의 필드도 그대로 기록됨)
+CONTEXT_FIELDS = ("url", "selector", "attempt", "duration_ms", "error_class")
+
+# Logger.context 로 묶은 필드 (스레드/asyncio 태스크마다 독립)
+_context = contextvars.ContextVar("logger_context", default={})
+
 class Logger:
     def __init__(
         self,
@@ -18,6 +41,12 @@ class Logger:
         backup_count: int = 3,
         max_files: int = 5,
         log_dir: Optional[str] = ".logs",
+        use_queue: Optional[bool] = None,
+        queue_size: int = 10000,
+        overflow: str = DROP,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        json_format: bool = False,
     ):
         """
         Logger 클래스 생성자.
@@ -30,7 +59,27 @@ class Logger:
             backup_count (int): 로그 파일 백업 개수 (기본값: 3).
             max_files (int): 전체 로그 파일 최대 개수 (기본값: 5).
             log_dir (Optional[str]): 로그 파일 저장 디렉토리 (기본값: ".logs").
+            use_queue (Optional[bool]): 큐 모드 사용 여부. 로그 호출은 큐에 넣기만 하고
+                출력/파일 기록은 별도 스레드가 묶음 단위로 처리 (기본값: LOGGER_QUEUE 환경 변수).
+            queue_size (int): 큐 모드의 최대 대기 레코드 수 (기본값: 10000).
+            overflow (str): 큐가 가득 찼을 때 "drop" (버리고 개수만 셈) 또는 "block" (대기).
+            batch_size (int): 큐 모드에서 한 번에 기록 후 flush 할 최대 레코드 수.
+            flush_interval (float): 큐 모드에서 묶음을 모으기 위해 기다리는 최대 시간 (초).
+            json_format (bool): 로그 파일을 한 줄에 JSON 하나씩 기록 (터미널 출력은 텍스트 유지).
         """
+        if overflow not in (DROP, BLOCK):
+            raise ValueError(f"ValueError - 지원하지 않는 overflow 정책: {overflow}")
+
+        if use_queue is None:
+            use_queue = os.environ.get(QUEUE_ENV, "").lower() in ("1", "true", "yes")
+
+        self.use_queue = use_queue
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.json_format = json_format
+
         self.name = name
         self.level = level
         self.log_dir = log_dir or ".logs"
@@ -87,23 +136,49 @@ class Logger:
 
         logger.setLevel(level)
         logger.propagate = False
+        logger.addFilter(_ContextFilter())
 
         # Formatter 설정
-        formatter = logging.Formatter(
+        formatter = ContextFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
+        file_formatter = JsonFormatter() if self.json_format else formatter
+
+        stream_class, file_class = logging.StreamHandler, RotatingFileHandler
+        if self.use_queue:
+            stream_class, file_class = _BatchStreamHandler, _BatchRotatingFileHandler
 
         # Stream Handler 추가 (터미널 출력용)
-        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler = stream_class(sys.stdout)
         stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
 
         # Rotating File Handler 추가 (파일 출력용)
-        file_handler = RotatingFileHandler(
+        file_handler = file_class(
             log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
         )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(file_formatter)
+
+        if not self.use_queue:
+            logger.addHandler(stream_handler)
+            logger.addHandler(file_handler)
+            return logger
+
+        # 큐 모드: 로거에는 큐 핸들러만 연결하고 실제 핸들러는 리스너 스레드에서 실행
+        record_queue = queue.Queue(maxsize=self.queue_size)
+        queue_handler = _OverflowQueueHandler(record_queue, block=self.overflow == BLOCK)
+        listener = _BatchQueueListener(
+            record_queue,
+            [stream_handler, file_handler],
+            queue_handler,
+            logger,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+        )
+        logger.addHandler(queue_handler)
+
+        with _listeners_lock:
+            _listeners[name] = listener
+        listener.start()
 
         return logger
 
@@ -138,6 +213,74 @@ class Logger:
         """
         self.logger.error(f"{message} - Exception: {exc}", exc_info=True)
 
+    @staticmethod
+    def lazy(name: str, log_file: str, **options) -> "LazyLogger":
+        """
+        처음 로그를 기록할 때 Logger 를 생성하는 logging.Logger 대리 객체를 반환.
+        모듈 수준 로거에 사용하면 import 시점에 로그 디렉토리 생성/파일 정리가 일어나지 않음.
+
+        logger = Logger.lazy(name="FileMaker", log_file="FileMaker.log")
+        logger.info("...")  # 이 시점에 Logger 생성
+
+        Args:
+            name (str): 로거 이름.
+            log_file (str): 로그 파일 이름.
+            **options: Logger 생성자의 나머지 인자.
+        """
+        return LazyLogger(name, log_file, **options)
+
+    @staticmethod
+    @contextmanager
+    def context(**fields):
+        """
+        블록 안에서 기록되는 모든 로그에 필드를 붙임 (중첩 가능).
+
+        with Logger.context(url=url, attempt=2):
+            logger.info("페이지 이동")
+        """
+        token = _context.set({**_context.get(), **fields})
+        try:
+            yield
+        finally:
+            _context.reset(token)
+
+    @staticmethod
+    def event(logger, message, level=logging.INFO, exc_info=False, **fields):
+        """
+        작업 단위 필드(url, selector, attempt, duration_ms, error_class 등)와 함께 로그를 기록.
+        값이 None 인 필드는 생략.
+
+        Logger.event(logger, "페이지 로드 타임아웃", level=logging.ERROR,
+                     url=url, duration_ms=812.4, error_class="timeout")
+        """
+        if not logger.isEnabledFor(level):
+            return
+
+        fields = {key: value for key, value in fields.items() if value is not None}
+        logger.log(level, message, exc_info=exc_info, extra={"context": fields})
+
+    @property
+    def dropped(self) -> int:
+        """
+        큐 모드에서 큐가 가득 차 버려진 레코드 수.
+        """
+        return sum(
+            handler.dropped
+            for handler in self.logger.handlers
+            if isinstance(handler, _OverflowQueueHandler)
+        )
+
+    def shutdown(self) -> None:
+        """
+        큐 모드 리스너를 멈추고 남은 레코드를 모두 기록. 이후 로그는 동기 방식으로 기록됨.
+        (프로그램 종료 시 자동 호출)
+        """
+        with _listeners_lock:
+            listener = _listeners.pop(self.name, None)
+
+        if listener:
+            listener.stop()
+
     def get_logger(self) -> logging.Logger:
         """
         로거 인스턴스를 반환.
@@ -146,3 +289,310 @@ class Logger:
             logging.Logger: 로거 인스턴스.
         """
         return self.logger
+
+
+class LazyLogger:
+    """
+    Logger.lazy 가 돌려주는 대리 객체. 속성에 처음 접근할 때 Logger 를 만들고
+    이후에는 logging.Logger 의 속성을 그대로 전달.
+    """
+
+    def __init__(self, name: str, log_file: str, **options):
+        self.name = name
+        self._log_file = log_file
+        self._options = options
+        self._wrapper = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr):
+        return getattr(self.get_wrapper().logger, attr)
+
+    def __repr__(self):
+        state = "created" if self._wrapper is not None else "not created"
+        return f"<LazyLogger {self.name} ({state})>"
+
+    def get_wrapper(self) -> Logger:
+        """
+        생성된 Logger 인스턴스 (없으면 지금 생성).
+        """
+        wrapper = self._wrapper
+        if wrapper is None:
+            with self._lock:
+                if self._wrapper is None:
+                    self._wrapper = Logger(self.name, self._log_file, **self._options)
+                wrapper = self._wrapper
+
+        return wrapper
+
+
+class _BatchFlushMixin:
+    """
+    레코드마다 flush 하지 않고 리스너가 묶음을 기록한 뒤 한 번만 flush 하도록 하는 핸들러 믹스인.
+    리스너가 멈춘 뒤 로거에 다시 연결되면 batched=False 로 바뀌어 일반 핸들러처럼 동작.
+    """
+
+    batched = True
+
+    def flush(self):
+        if not self.batched:
+            self.flush_batch()
+
+    def flush_batch(self):
+        logging.StreamHandler.flush(self)
+
+
+class _BatchStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    pass
+
+
+class _BatchRotatingFileHandler(_BatchFlushMixin, RotatingFileHandler):
+    """
+    기본 shouldRollover 는 레코드마다 stream.tell() 을 호출하여 버퍼가 flush 되므로
+    파일 크기를 메모리에서 세어 롤오버를 판단 (열 때 파일 크기로 시작, 롤오버 시 0).
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self._size = 0
+        if os.path.isfile(self.baseFilename):
+            self._size = os.path.getsize(self.baseFilename)
+
+    def emit(self, record):
+        try:
+            size = self._record_bytes(record)
+            if self._exceeds(size):
+                self.doRollover()
+
+            logging.FileHandler.emit(self, record)
+            self._size += size
+        except Exception:
+            self.handleError(record)
+
+    def shouldRollover(self, record):
+        return self._exceeds(self._record_bytes(record))
+
+    def doRollover(self):
+        super().doRollover()
+        self._size = 0
+
+    def _record_bytes(self, record):
+        # 텍스트 모드에서 "\n" 은 OS 줄바꿈으로 바뀌어 기록됨
+        message = (self.format(record) + self.terminator).replace("\n", os.linesep)
+        return len(message.encode(self.encoding or "utf-8", errors="replace"))
+
+    def _exceeds(self, size):
+        # 기본 구현과 같이 빈 파일은 롤오버하지 않음
+        return 0 < self.maxBytes <= self._size + size and self._size > 0
+
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class _ContextFilter(logging.Filter):
+    """
+    Logger.context 로 묶인 필드와 Logger.event 의 필드를 record.context 로 합침.
+    큐 모드에서도 로그를 호출한 스레드/태스크의 필드가 기록되도록 로거에 연결.
+    """
+
+    def filter(self, record):
+        bound = _context.get()
+        fields = getattr(record, "context", None)
+
+        if bound or fields:
+            record.context = {**bound, **(fields or {})}
+        else:
+            record.context = None
+
+        return True
+
+
+class ContextFormatter(logging.Formatter):
+    """
+    텍스트 로그 뒤에 작업 단위 필드를 " | url=... duration_ms=..." 형태로 붙이는 포맷터.
+    """
+
+    def formatMessage(self, record):
+        message = super().formatMessage(record)
+
+        fields = getattr(record, "context", None)
+        if not fields:
+            return message
+
+        pairs = " ".join(f"{key}={_format_value(value)}" for key, value in fields.items())
+        return f"{message} | {pairs}"
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    레코드를 한 줄 JSON 으로 기록하는 포맷터. pandas.read_json(path, lines=True) 로 바로 읽을 수 있음.
+
+    {"ts": "...", "level": "ERROR", "logger": "WrightBrowser", "message": "...",
+     "url": "...", "duration_ms": 812.4, "error_class": "timeout", "exc": "Traceback ..."}
+    """
+
+    def format(self, record):
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        fields = getattr(record, "context", None)
+        if fields:
+            for key, value in fields.items():
+                data.setdefault(key, value)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return f"{value:.1f}"
+
+    return value
+
+
+class _OverflowQueueHandler(QueueHandler):
+    """
+    큐가 가득 찼을 때 block=False 면 레코드를 버리고 개수만 세는 QueueHandler.
+    """
+
+    def __init__(self, record_queue, block: bool = False):
+        super().__init__(record_queue)
+        self.block = block
+        self.dropped = 0
+
+    def prepare(self, record):
+        """
+        포맷은 리스너 스레드에서 하도록 인자만 메시지에 합치고 예외 정보는 텍스트로 바꿈.
+        (기본 구현은 호출한 스레드에서 포맷과 레코드 복사를 수행)
+        """
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+    def enqueue(self, record):
+        if self.block:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BatchQueueListener:
+    """
+    큐에서 레코드를 batch_size 개 또는 flush_interval 초 동안 모아 핸들러로 기록하고
+    묶음마다 한 번 flush 하는 리스너 스레드.
+
+    멈추면 로거에서 큐 핸들러를 떼고 실제 핸들러를 다시 연결하므로,
+    이후의 로그는 동기 모드로 기록됨 (큐에 쌓여 버려지거나 block 에서 멈추지 않음).
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        record_queue,
+        handlers,
+        queue_handler,
+        logger,
+        batch_size=256,
+        flush_interval=0.5,
+    ):
+        self.queue = record_queue
+        self.handlers = handlers
+        self.queue_handler = queue_handler
+        self.logger = logger
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._monitor, name="LoggerQueueListener", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if not self._thread:
+            return
+
+        thread, self._thread = self._thread, None
+        atexit.unregister(self.stop)
+
+        # 큐가 가득 차 있어도 종료 신호는 반드시 전달
+        self.queue.put(self._STOP)
+        thread.join()
+
+        dropped = self.queue_handler.dropped
+        if dropped:
+            message = f"큐가 가득 차 로그 {dropped}개를 버렸습니다"
+            record = logging.LogRecord(
+                "Logger", logging.WARNING, __file__, 0, message, None, None
+            )
+            self._handle([record])
+
+        # 큐 핸들러를 실제 핸들러로 교체 (닫기는 프로그램 종료 시 logging.shutdown 이 처리)
+        self.logger.removeHandler(self.queue_handler)
+        for handler in self.handlers:
+            handler.batched = False
+            self.logger.addHandler(handler)
+
+    def _monitor(self):
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size and batch[-1] is not self._STOP:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is self._STOP
+            self._handle([record for record in batch if record is not self._STOP])
+
+            if stop:
+                # 종료 신호 뒤에 들어온 레코드까지 기록
+                remaining = []
+                while True:
+                    try:
+                        remaining.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                self._handle(remaining)
+                return
+
+    def _handle(self, records):
+        if not records:
+            return
+
+        for record in records:
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+        for handler in self.handlers:
+            handler.flush_batch()
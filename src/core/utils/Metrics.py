@@ -0,0 +1,375 @@
+import inspect
+import functools
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+# 기본 레지스트리를 켜는 환경 변수 (값이 "1", "true", "yes" 이면 사용)
+METRICS_ENV = "SCRAPER_METRICS"
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class Histogram:
+    """
+    관측값의 개수/합계/최소/최대는 정확히, 분위수는 최대 max_samples 개의 표본(reservoir)으로 계산.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.max_samples = max_samples
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._samples = []
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if len(self._samples) < self.max_samples:
+            self._samples.append(value)
+        else:
+            index = random.randrange(self.count)
+            if index < self.max_samples:
+                self._samples[index] = value
+
+    def quantiles(self, qs=QUANTILES):
+        if not self._samples:
+            return [None] * len(qs)
+
+        samples = sorted(self._samples)
+        return [samples[min(len(samples) - 1, int(q * len(samples)))] for q in qs]
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            **{f"p{int(q * 100)}": v for q, v in zip(QUANTILES, self.quantiles())},
+        }
+
+
+class _NullTimer:
+    """
+    비활성화 상태에서 timer() 가 돌려주는 아무 일도 하지 않는 컨텍스트 매니저.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Stopwatch:
+    """
+    호출할 때마다 직전 호출(또는 생성) 이후의 시간을 "prefix.단계" 히스토그램에 기록.
+    """
+
+    def __init__(self, registry, prefix):
+        self.registry = registry
+        self.prefix = prefix
+        self._last = time.perf_counter()
+
+    def __call__(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.registry.observe(f"{self.prefix}.{phase}", (now - self._last) * 1000)
+        self._last = now
+
+
+def _null_stopwatch(phase: str) -> None:
+    pass
+
+
+class MetricsRegistry:
+    """
+    스크래핑 작업의 카운터와 소요 시간 히스토그램(ms)을 모으는 레지스트리.
+    enabled=False 면 모든 기록 호출이 플래그 확인 한 번으로 끝남.
+
+    metrics = MetricsRegistry(enabled=True)
+
+    @metrics.timed("senium.find_element")
+    def find_element(...): ...
+
+    with metrics.timer("excel.save"):
+        workbook.save(path)
+
+    print(metrics.to_prometheus())
+    """
+
+    def __init__(self, enabled: bool = False, max_samples: int = 10000):
+        self.enabled = enabled
+        self.max_samples = max_samples
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+        self._reporter = None
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        if not self.enabled:
+            return
+
+        key = (name, _label_key(labels) if labels else ())
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        if not self.enabled:
+            return
+
+        key = (name, _label_key(labels) if labels else ())
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.max_samples)
+            histogram.observe(value)
+
+    def timer(self, name: str, **labels):
+        """
+        블록의 소요 시간(ms)을 name 히스토그램에 기록하는 컨텍스트 매니저.
+        블록에서 예외가 나면 error="예외 클래스 이름" 라벨로 기록.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+
+        return self._timer(name, labels)
+
+    @contextmanager
+    def _timer(self, name, labels):
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self._observe_since(name, started, e, **labels)
+            raise
+
+        self._observe_since(name, started, **labels)
+
+    def _observe_since(self, name, started, error=None, **labels):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if error is not None:
+            labels["error"] = type(error).__name__
+
+        self.observe(name, elapsed_ms, **labels)
+
+    def stopwatch(self, prefix: str):
+        """
+        여러 단계로 나뉜 작업의 단계별 소요 시간을 기록.
+
+        phase = metrics.stopwatch("excel")
+        ...  # 데이터 준비
+        phase("prepare")
+        ...  # 저장
+        phase("save")
+        """
+        if not self.enabled:
+            return _null_stopwatch
+
+        return _Stopwatch(self, prefix)
+
+    def timed(self, name: str):
+        """
+        함수(동기/async) 실행 시간을 name 히스토그램에 기록하는 데코레이터.
+        """
+
+        def decorator(fn):
+            if inspect.iscoroutinefunction(fn):
+
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await fn(*args, **kwargs)
+
+                    started = time.perf_counter()
+                    try:
+                        result = await fn(*args, **kwargs)
+                    except BaseException as e:
+                        self._observe_since(name, started, e)
+                        raise
+
+                    self._observe_since(name, started)
+                    return result
+
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+
+                started = time.perf_counter()
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    self._observe_since(name, started, e)
+                    raise
+
+                self._observe_since(name, started)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def summary(self):
+        """
+        {"counters": {이름{라벨}: 값}, "histograms": {이름{라벨}: {count, p50, p99, ...}}}
+        """
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = {key: h.summary() for key, h in self.histograms.items()}
+
+        return {
+            "counters": {_display_name(*key): value for key, value in sorted(counters.items())},
+            "histograms": {
+                _display_name(*key): value for key, value in sorted(histograms.items())
+            },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.summary(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Prometheus 텍스트 형식. 카운터는 counter, 히스토그램은 quantile 이 있는 summary 로 출력.
+        """
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(
+                (key, h.count, h.total, h.quantiles())
+                for key, h in self.histograms.items()
+            )
+
+        lines = []
+        typed = set()
+
+        for (name, labels), value in counters:
+            metric = _prometheus_name(name) + "_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_prometheus_labels(labels)} {value}")
+
+        for (name, labels), count, total, quantiles in histograms:
+            metric = _prometheus_name(name) + "_ms"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} summary")
+                typed.add(metric)
+
+            for q, value in zip(QUANTILES, quantiles):
+                quantile_labels = labels + (("quantile", str(q)),)
+                lines.append(f"{metric}{_prometheus_labels(quantile_labels)} {value}")
+
+            lines.append(f"{metric}_sum{_prometheus_labels(labels)} {total}")
+            lines.append(f"{metric}_count{_prometheus_labels(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> str:
+        """
+        확장자가 .prom 이면 Prometheus 텍스트, 그 외에는 JSON 으로 저장 (원자적 교체).
+        """
+        content = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+        return path
+
+    def start_reporter(self, interval: float = 60.0, path: Optional[str] = None, logger=None):
+        """
+        interval 초마다 요약을 path 에 저장하거나 logger 로 기록하는 데몬 스레드를 시작.
+        """
+        self.stop_reporter()
+
+        stop = threading.Event()
+
+        def report():
+            while not stop.wait(interval):
+                self._report(path, logger)
+
+        thread = threading.Thread(target=report, name="MetricsReporter", daemon=True)
+        self._reporter = (thread, stop, path, logger)
+        thread.start()
+
+    def stop_reporter(self) -> None:
+        """
+        주기 보고 스레드를 멈추고 마지막 요약을 한 번 더 기록.
+        """
+        if not self._reporter:
+            return
+
+        thread, stop, path, logger = self._reporter
+        self._reporter = None
+
+        stop.set()
+        thread.join()
+        self._report(path, logger)
+
+    def _report(self, path, logger):
+        if path:
+            self.dump(path)
+        if logger:
+            for name, stats in self.summary()["histograms"].items():
+                logger.info(
+                    f"[metrics] {name} count={stats['count']} "
+                    f"p50={_ms(stats['p50'])} p99={_ms(stats['p99'])} max={_ms(stats['max'])}"
+                )
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items() if value is not None))
+
+
+def _display_name(name, labels):
+    if not labels:
+        return name
+
+    return name + "{" + ",".join(f"{key}={value}" for key, value in labels) + "}"
+
+
+def _prometheus_name(name):
+    return "".join(ch if ch.isalnum() or ch in "_:" else "_" for ch in name)
+
+
+def _prometheus_labels(labels):
+    if not labels:
+        return ""
+
+    pairs = ",".join(f'{_prometheus_name(key)}="{_escape(value)}"' for key, value in labels)
+    return "{" + pairs + "}"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _ms(value):
+    return "-" if value is None else f"{value:.1f}ms"
+
+
+# 패키지 전체에서 공유하는 기본 레지스트리 (SCRAPER_METRICS=1 이거나 enabled 를 켜면 기록)
+metrics = MetricsRegistry(
+    enabled=os.environ.get(METRICS_ENV, "").lower() in ("1", "true", "yes")
+)
@@ -0,0 +1,42 @@
+"""
+스크래퍼 공통 네트워크 오류 분류.
+
+Playwright/Selenium 예외 메시지에 포함된 Chromium 'net::ERR_*' 코드를
+엔진에 상관없이 같은 오류 클래스 문자열로 변환.
+"""
+
+from typing import Optional
+
+TIMEOUT = "timeout"
+CONNECTION_RESET = "connection_reset"
+NAME_NOT_RESOLVED = "name_not_resolved"
+TIMED_OUT = "timed_out"
+PROXY_ERROR = "proxy_error"
+BROWSER_ERROR = "browser_error"
+HANDLER_ERROR = "handler_error"
+UNKNOWN = "unknown"
+
+_NET_ERROR_CODES = {
+    "net::ERR_CONNECTION_RESET": CONNECTION_RESET,
+    "net::ERR_NAME_NOT_RESOLVED": NAME_NOT_RESOLVED,
+    "net::ERR_TIMED_OUT": TIMED_OUT,
+    "net::ERR_PROXY_CONNECTION_FAILED": PROXY_ERROR,
+    "net::ERR_TUNNEL_CONNECTION_FAILED": PROXY_ERROR,
+}
+
+
+def classify_message(message: str) -> Optional[str]:
+    """
+    예외 메시지에서 net::ERR_* 코드를 찾아 오류 클래스로 변환.
+
+    Args:
+        message (str): 예외 메시지.
+
+    Returns:
+        Optional[str]: 알려진 코드가 있으면 오류 클래스, 없으면 None.
+    """
+    for code, error_class in _NET_ERROR_CODES.items():
+        if code in message:
+            return error_class
+
+    return None
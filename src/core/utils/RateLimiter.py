@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+from urllib.parse import urlsplit
+from app.core.utils import NetError
+
+# 이 오류가 보이면 해당 호스트의 요청 속도를 낮춤
+SLOWDOWN_ERROR_CLASSES = frozenset(
+    {NetError.TIMEOUT, NetError.TIMED_OUT, NetError.CONNECTION_RESET}
+)
+
+
+class TokenBucket:
+    """
+    초당 rate 개의 토큰이 최대 burst 개까지 쌓이는 토큰 버킷.
+    동기화는 호출하는 쪽에서 담당.
+    """
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """
+        토큰 하나를 예약하고 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환.
+        토큰이 부족하면 음수로 빌려두어 뒤에 온 요청이 순서대로 대기하도록 함.
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+
+        if self.tokens >= 0:
+            return 0.0
+
+        return -self.tokens / self.rate
+
+
+class _RateLimiter:
+    """
+    호스트별 토큰 버킷과 오류 기반 속도 조절 (AIMD) 의 공통 구현.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: float = 1.0,
+        max_concurrency: int = 2,
+        min_rate: float = None,
+        max_rate: float = None,
+        decrease_factor: float = 0.5,
+        increase_step: float = None,
+        host_rates: Optional[dict] = None,
+        clock=time.monotonic,
+    ):
+        """
+        :param rate: 호스트당 기본 초당 요청 수
+        :param burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        :param max_concurrency: 호스트당 동시 요청 수 상한
+        :param min_rate: 자동 감속 시 하한 (기본값: rate / 10)
+        :param max_rate: 자동 가속 시 상한 (기본값: rate)
+        :param decrease_factor: 타임아웃/연결 끊김 발생 시 rate 에 곱할 값
+        :param increase_step: 성공할 때마다 rate 에 더할 값 (기본값: rate / 20)
+        :param host_rates: 호스트별 기본 rate 덮어쓰기 (예: {"www.musinsa.com": 0.5})
+        :param clock: 시간 함수 (테스트에서 교체용)
+        """
+        if rate <= 0:
+            raise ValueError("ValueError - rate 는 0 보다 커야 함")
+        if max_concurrency < 1:
+            raise ValueError("ValueError - max_concurrency 는 1 이상이어야 함")
+
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step if increase_step is not None else rate / 20
+        self.host_rates = dict(host_rates or {})
+        self._clock = clock
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def report(self, url: str, error_class: str = None) -> None:
+        """
+        요청 결과를 반영하여 해당 호스트의 rate 를 조절.
+        error_class 가 None 이면 성공.
+        """
+        host = _host_of(url)
+
+        with self._lock:
+            bucket = self._bucket(host)
+            ceiling = self.host_rates.get(host, self.max_rate)
+
+            if error_class in SLOWDOWN_ERROR_CLASSES:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+            elif error_class is None:
+                bucket.rate = min(ceiling, bucket.rate + self.increase_step)
+
+    def current_rate(self, url: str) -> float:
+        with self._lock:
+            return self._bucket(_host_of(url)).rate
+
+    def snapshot(self):
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+    def _reserve(self, host: str) -> float:
+        with self._lock:
+            return self._bucket(host).reserve(self._clock())
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate = self.host_rates.get(host, self.rate)
+            bucket = self._buckets[host] = TokenBucket(rate, self.burst, self._clock())
+
+        return bucket
+
+
+class AsyncRateLimiter(_RateLimiter):
+    """
+    asyncio 용 호스트별 속도 제한기 (WrightBrowser).
+
+    limiter = AsyncRateLimiter(rate=2, max_concurrency=4)
+    async with limiter.limit(url):
+        await page.goto(url)
+    limiter.report(url, error_class)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._semaphores = {}
+
+    @asynccontextmanager
+    async def limit(self, url: str):
+        host = _host_of(url)
+
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.max_concurrency)
+
+        async with semaphore:
+            wait = self._reserve(host)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            yield
+
+
+class ThreadRateLimiter(_RateLimiter):
+    """
+    스레드 안전한 호스트별 속도 제한기 (SeniumScraper).
+
+    limiter = ThreadRateLimiter(rate=1, max_concurrency=2)
+    with limiter.limit(url):
+        driver.get(url)
+    limiter.report(url, error_class)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._semaphores = {}
+
+    @contextmanager
+    def limit(self, url: str):
+        host = _host_of(url)
+
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_concurrency)
+                self._semaphores[host] = semaphore
+
+        with semaphore:
+            wait = self._reserve(host)
+            if wait > 0:
+                time.sleep(wait)
+
+            yield
+
+
+def _host_of(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
@@ -0,0 +1,409 @@
+import abc
+import csv
+import glob
+import json
+import os
+import shutil
+from typing import Optional, Sequence
+
+NDJSON = "ndjson"
+CSV = "csv"
+PARQUET = "parquet"
+
+_FORMATS_BY_EXTENSION = {
+    ".ndjson": NDJSON,
+    ".jsonl": NDJSON,
+    ".csv": CSV,
+    ".parquet": PARQUET,
+}
+
+
+class RecordSink(abc.ABC):
+    """
+    스크래핑 결과를 묶음(batch) 단위로 이어 쓰는 저장소의 기본 클래스.
+
+    - 쓰는 동안에는 <path>.part 에 기록하고 close() 시 원자적으로 <path> 로 이름 변경
+    - 묶음을 쓸 때마다 <path>.part.state 에 기록된 레코드 수/위치를 저장
+    - resume=True 로 다시 열면 마지막으로 저장된 묶음 뒤부터 이어 씀
+      (written 만큼은 이미 저장된 것이므로 호출자는 그 다음 레코드부터 넘기면 됨)
+    - with 블록에서 예외가 발생하면 .part 를 남겨 두어 다음 실행에서 이어 쓸 수 있음
+
+    with open_sink(".data/results.ndjson", resume=True) as sink:
+        for record in records[sink.written:]:
+            sink.write([record])
+    """
+
+    format = None
+
+    def __init__(
+        self, path: str, columns: Optional[Sequence[str]] = None, resume: bool = False
+    ):
+        """
+        :param path: 최종 저장 파일 경로
+        :param columns: 저장할 칼럼 목록 (None 이면 첫 묶음에서 발견된 칼럼)
+        :param resume: 이전 실행의 .part 파일이 있으면 이어 쓸지 여부
+        """
+        self.path = path
+        self.part_path = f"{path}.part"
+        self.state_path = f"{self.part_path}.state"
+        self.columns = list(columns) if columns else None
+        self.written = 0
+        self.closed = False
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        state = self._load_state() if resume else None
+        if state is None:
+            self._discard()
+        else:
+            self.written = state["records"]
+            self.columns = state.get("columns") or self.columns
+
+        self._open(state)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, records) -> int:
+        """
+        레코드(dict) 묶음을 기록하고 기록한 레코드 수를 반환.
+        """
+        if self.closed:
+            raise RuntimeError("RuntimeError - 이미 닫힌 저장소")
+
+        records = list(records)
+        if not records:
+            return 0
+
+        if self.columns is None:
+            seen = {}
+            for record in records:
+                seen.update(dict.fromkeys(record))
+            self.columns = list(seen)
+
+        stored = self._write_batch(records)
+        if stored:
+            self.written += stored
+            self._save_state()
+
+        return len(records)
+
+    def close(self) -> str:
+        """
+        남은 내용을 기록하고 .part 를 최종 경로로 원자적으로 이름 변경.
+        """
+        if self.closed:
+            return self.path
+
+        self._finish()
+        self._publish()
+        self._remove(self.state_path)
+        self.closed = True
+
+        return self.path
+
+    def abort(self) -> None:
+        """
+        파일만 닫고 .part 와 상태 파일은 남겨 둠 (다음 실행에서 resume 가능).
+        """
+        if not self.closed:
+            self._close_file()
+            self.closed = True
+
+    def _load_state(self):
+        if not os.path.exists(self.part_path) or not os.path.isfile(self.state_path):
+            return None
+
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return state if state.get("format") == self.format else None
+
+    def _save_state(self):
+        state = {
+            "format": self.format,
+            "records": self.written,
+            "columns": self.columns,
+            **self._state(),
+        }
+
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(temp_path, self.state_path)
+
+    def _discard(self):
+        self._remove(self.part_path)
+        self._remove(self.state_path)
+
+    @staticmethod
+    def _remove(path):
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    @abc.abstractmethod
+    def _open(self, state):
+        """
+        .part 파일을 열고, state 가 있으면 마지막으로 저장된 위치부터 이어 쓸 준비를 함.
+        """
+
+    @abc.abstractmethod
+    def _write_batch(self, records) -> int:
+        """
+        묶음을 기록하고 파일에 저장 완료된 레코드 수를 반환 (상태 파일 갱신 기준).
+        """
+
+    def _state(self):
+        return {}
+
+    def _finish(self):
+        self._close_file()
+
+    def _publish(self):
+        os.replace(self.part_path, self.path)
+
+    def _close_file(self):
+        pass
+
+
+class _TextSink(RecordSink):
+    """
+    한 줄에 레코드 하나씩 이어 쓰는 텍스트 저장소 (NDJSON, CSV 공통).
+    상태 파일에 마지막 묶음까지의 바이트 수를 저장하고, 이어 쓸 때 그 뒤의 불완전한 내용은 잘라냄.
+    """
+
+    def _open(self, state):
+        if state is not None:
+            with open(self.part_path, "r+b") as f:
+                f.truncate(state["bytes"])
+
+        self._file = open(self.part_path, "a", encoding="utf-8", newline="")
+
+    def _state(self):
+        self._file.flush()
+        return {"bytes": os.fstat(self._file.fileno()).st_size}
+
+    def _close_file(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class NdjsonSink(_TextSink):
+    """
+    줄 단위 JSON (NDJSON) 저장소. 레코드마다 칼럼이 달라도 그대로 저장됨.
+    """
+
+    format = NDJSON
+
+    def _write_batch(self, records):
+        self._file.write(
+            "".join(
+                json.dumps(record, ensure_ascii=False, default=str) + "\n"
+                for record in records
+            )
+        )
+
+        return len(records)
+
+
+class CsvSink(_TextSink):
+    """
+    CSV 저장소. 칼럼은 columns 또는 첫 묶음 기준으로 고정되며, 이후 새로 등장한 칼럼은 버려짐.
+    """
+
+    format = CSV
+
+    def _open(self, state):
+        super()._open(state)
+        self._writer = None
+
+    def _write_batch(self, records):
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self._file, fieldnames=self.columns, extrasaction="ignore", lineterminator="\n"
+            )
+            if self._file.tell() == 0:
+                self._writer.writeheader()
+
+        self._writer.writerows(records)
+
+        return len(records)
+
+
+class ParquetSink(RecordSink):
+    """
+    Parquet 저장소 (pyarrow 필요).
+
+    segment_rows 개씩 모아 <path>.part 디렉토리에 조각 파일로 저장하고,
+    close() 시 하나의 Parquet 파일로 합쳐 최종 경로로 이름 변경한 뒤 조각 디렉토리를 삭제.
+    (합치는 도중 중단되어도 조각과 상태 파일이 남아 있어 resume 가능)
+    이어 쓸 때는 저장 완료된 조각까지만 유효하므로, 버퍼에만 있던 레코드는 written 에 포함되지 않음.
+    """
+
+    format = PARQUET
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[Sequence[str]] = None,
+        resume: bool = False,
+        segment_rows: int = 50_000,
+        compression: str = "snappy",
+    ):
+        self.segment_rows = segment_rows
+        self.compression = compression
+        self._buffer = []
+        self._segments = 0
+
+        super().__init__(path, columns=columns, resume=resume)
+
+    def _write_batch(self, records):
+        self._buffer.extend(records)
+        if len(self._buffer) >= self.segment_rows:
+            return self._flush_segment()
+
+        return 0
+
+    def _open(self, state):
+        os.makedirs(self.part_path, exist_ok=True)
+
+        if state is None:
+            return
+
+        self._segments = state["segments"]
+
+        # 상태 파일에 기록되기 전에 중단된 조각은 삭제
+        for path in glob.glob(os.path.join(self.part_path, "*.parquet")):
+            index = int(os.path.basename(path).split(".")[0].split("-")[1])
+            if index >= self._segments:
+                os.remove(path)
+
+    def _state(self):
+        return {"segments": self._segments}
+
+    def _flush_segment(self):
+        import pyarrow.parquet as pq
+
+        if not self._buffer:
+            return 0
+
+        table = self._to_table(self._buffer)
+        segment_path = self._segment_path(self._segments)
+
+        pq.write_table(table, f"{segment_path}.tmp", compression=self.compression)
+        os.replace(f"{segment_path}.tmp", segment_path)
+
+        stored = len(self._buffer)
+        self._segments += 1
+        self._buffer = []
+
+        return stored
+
+    def _finish(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.written += self._flush_segment()
+
+        segments = [self._segment_path(i) for i in range(self._segments)]
+        if segments:
+            schema = pa.unify_schemas(
+                [pq.read_schema(path) for path in segments], promote_options="permissive"
+            )
+        else:
+            schema = pa.schema([(col, pa.null()) for col in self.columns or []])
+
+        temp_path = f"{self.path}.tmp"
+        with pq.ParquetWriter(temp_path, schema, compression=self.compression) as writer:
+            for path in segments:
+                writer.write_table(pq.read_table(path).cast(schema))
+
+        os.replace(temp_path, self.path)
+
+    def _publish(self):
+        # _finish 에서 최종 경로에 바로 기록했으므로 조각 디렉토리만 삭제
+        shutil.rmtree(self.part_path, ignore_errors=True)
+
+    def _to_table(self, records):
+        import pyarrow as pa
+
+        return pa.Table.from_pylist(
+            [{col: record.get(col) for col in self.columns} for record in records]
+        )
+
+    def _segment_path(self, index):
+        return os.path.join(self.part_path, f"part-{index:05d}.parquet")
+
+
+_SINKS = {NDJSON: NdjsonSink, CSV: CsvSink, PARQUET: ParquetSink}
+
+
+def sink_format(path: str) -> str:
+    """
+    파일 확장자로 저장 형식을 판별.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in _FORMATS_BY_EXTENSION:
+        raise ValueError(f"ValueError - 지원하지 않는 저장 형식: {path}")
+
+    return _FORMATS_BY_EXTENSION[ext]
+
+
+def open_sink(path: str, resume: bool = False, **options) -> RecordSink:
+    """
+    확장자(.ndjson/.jsonl, .csv, .parquet)에 맞는 저장소를 생성.
+    """
+    return _SINKS[sink_format(path)](path, resume=resume, **options)
+
+
+def record_columns(path: str):
+    """
+    저장된 파일의 칼럼 목록 (NDJSON 처럼 미리 알 수 없으면 None).
+    """
+    fmt = sink_format(path)
+
+    if fmt == CSV:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return next(csv.reader(f), None)
+
+    if fmt == PARQUET:
+        import pyarrow.parquet as pq
+
+        return pq.read_schema(path).names
+
+    return None
+
+
+def iter_records(path: str, batch_rows: int = 10_000):
+    """
+    저장된 파일을 레코드(dict) 단위로 읽음. 파일 전체를 메모리에 올리지 않음.
+    """
+    fmt = sink_format(path)
+
+    if fmt == NDJSON:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    elif fmt == CSV:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+
+    else:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=batch_rows):
+            yield from batch.to_pylist()
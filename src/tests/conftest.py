@@ -0,0 +1,11 @@
+import os
+import sys
+import types
+
+# src 는 배포 시 app 패키지로 설치되므로, 저장소에서 바로 실행할 때는 src 를 app 으로 등록
+try:
+    import app.core  # noqa: F401
+except ImportError:
+    app = types.ModuleType("app")
+    app.__path__ = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+    sys.modules["app"] = app
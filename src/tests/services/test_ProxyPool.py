@@ -0,0 +1,194 @@
+import asyncio
+
+import pytest
+
+from app.core.services.ProxyPool import ProxyPool
+from app.core.utils import NetError
+
+FAST = "http://127.0.0.1:8801"
+SLOW = "http://127.0.0.1:8802"
+BROKEN = "http://127.0.0.1:8803"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pool(clock, **options):
+    options = {"min_requests": 3, "cooldown": 60.0, "max_latency_ms": 1500.0, **options}
+    return ProxyPool([FAST, SLOW, BROKEN], clock=clock, **options)
+
+
+def _serve(pool, latencies, rounds):
+    """
+    가짜 프록시: 배정받은 프록시의 지연시간(None 이면 연결 실패)으로 결과를 보고.
+    """
+    assigned = []
+    for _ in range(rounds):
+        server = pool.acquire()
+        latency = latencies[server]
+        if latency is None:
+            pool.report(server, error_class=NetError.PROXY_ERROR)
+        else:
+            pool.report(server, latency_ms=latency)
+        pool.release(server)
+        assigned.append(server)
+
+    return assigned
+
+
+def test_broken_proxy_is_cooled_down_after_consecutive_errors():
+    clock = FakeClock()
+    pool = _pool(clock, max_consecutive_errors=3)
+
+    for _ in range(3):
+        pool.report(BROKEN, error_class=NetError.PROXY_ERROR)
+
+    assert not pool.is_healthy(BROKEN)
+    stats = {s["server"]: s for s in pool.snapshot()}
+    assert stats[BROKEN]["cooldowns"] == 1
+    assert stats[BROKEN]["cooldown_until"] == clock.now + 60.0
+
+    # cooldown 중에는 배정되지 않음
+    assert BROKEN not in _serve(pool, {FAST: 100.0, SLOW: 100.0, BROKEN: None}, 20)
+
+
+def test_target_site_errors_do_not_count_against_proxy():
+    pool = _pool(FakeClock(), max_consecutive_errors=2)
+
+    for _ in range(5):
+        pool.report(FAST, error_class=NetError.NAME_NOT_RESOLVED)
+        pool.report(FAST, error_class=NetError.HANDLER_ERROR)
+
+    assert pool.is_healthy(FAST)
+
+
+def test_ewma_scoring_prefers_fast_proxy():
+    pool = _pool(FakeClock(), max_latency_ms=None)
+    latencies = {FAST: 80.0, SLOW: 900.0, BROKEN: 400.0}
+
+    # 측정값이 없는 프록시부터 한 번씩 시도된 뒤 빠른 프록시로 몰림
+    assigned = _serve(pool, latencies, 30)
+    assert set(assigned[:3]) == {FAST, SLOW, BROKEN}
+    assert assigned[3:].count(FAST) == len(assigned) - 3
+
+    stats = {s["server"]: s for s in pool.snapshot()}
+    assert stats[FAST]["latency_ms"] == pytest.approx(80.0)
+    assert stats[SLOW]["latency_ms"] == pytest.approx(900.0)
+
+
+def test_ewma_follows_latency_changes():
+    pool = _pool(FakeClock(), alpha=0.5, max_latency_ms=None)
+
+    pool.report(FAST, latency_ms=100.0)
+    pool.report(FAST, latency_ms=300.0)
+    pool.report(FAST, latency_ms=300.0)
+
+    # 100 → 200 → 250
+    assert pool.snapshot()[0]["latency_ms"] == pytest.approx(250.0)
+
+
+def test_slow_proxy_is_cooled_down_only_after_min_requests():
+    clock = FakeClock()
+    pool = _pool(clock, min_requests=3, max_latency_ms=1000.0)
+
+    pool.report(SLOW, latency_ms=3000.0)
+    pool.report(SLOW, latency_ms=3000.0)
+    assert pool.is_healthy(SLOW)
+
+    pool.report(SLOW, latency_ms=3000.0)
+    assert not pool.is_healthy(SLOW)
+
+
+def test_restored_proxy_is_measured_again_before_next_cooldown():
+    clock = FakeClock()
+    pool = _pool(clock, min_requests=3, max_latency_ms=1000.0)
+
+    for _ in range(3):
+        pool.report(SLOW, latency_ms=3000.0)
+    assert not pool.is_healthy(SLOW)
+
+    clock.now += 61.0
+    assert pool.is_healthy(SLOW)
+
+    # 복귀 시 acquire 에서 통계가 초기화되어 다시 min_requests 만큼 측정
+    pool.release(pool.acquire())
+    stats = {s["server"]: s for s in pool.snapshot()}
+    assert stats[SLOW]["cooldown_until"] == 0.0
+    assert stats[SLOW]["latency_ms"] is None
+
+    pool.report(SLOW, latency_ms=100.0)
+    pool.report(SLOW, latency_ms=3000.0)
+    assert pool.is_healthy(SLOW)
+    assert {s["server"]: s for s in pool.snapshot()}[SLOW]["cooldowns"] == 1
+
+
+def test_all_cooled_down_assigns_earliest_returning_proxy():
+    clock = FakeClock()
+    pool = _pool(clock, max_consecutive_errors=1)
+
+    for server in (FAST, SLOW, BROKEN):
+        pool.report(server, error_class=NetError.PROXY_ERROR)
+        clock.now += 1.0
+
+    assert pool.acquire() == FAST
+
+
+def test_in_use_spreads_concurrent_leases():
+    pool = _pool(FakeClock(), max_latency_ms=None)
+    for server in (FAST, SLOW, BROKEN):
+        pool.report(server, latency_ms=100.0)
+
+    leased = [pool.acquire() for _ in range(3)]
+
+    assert sorted(leased) == sorted([FAST, SLOW, BROKEN])
+
+
+def test_proxy_is_released_when_context_creation_fails():
+    pytest.importorskip("playwright")
+    from app.core.services.WrightBrowser import WrightBrowser
+
+    class FailingBrowser:
+        closed = False
+
+        async def new_context(self, **options):
+            raise RuntimeError("context failed")
+
+        async def close(self):
+            self.closed = True
+
+    browser = FailingBrowser()
+
+    class FakeChromium:
+        executable_path = None
+
+        async def launch(self, **options):
+            return browser
+
+    class FakePlaywright:
+        chromium = FakeChromium()
+
+    pool = _pool(FakeClock())
+
+    async def enter():
+        async with WrightBrowser(FakePlaywright(), proxies=pool, profile="headless"):
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(enter())
+
+    assert browser.closed
+    assert all(s["in_use"] == 0 for s in pool.snapshot())
+
+    async def lease():
+        async with WrightBrowser._open_lease(FakePlaywright(), browser, proxies=pool):
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(lease())
+
+    assert all(s["in_use"] == 0 for s in pool.snapshot())
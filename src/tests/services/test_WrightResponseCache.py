@@ -0,0 +1,237 @@
+import asyncio
+import types
+
+import pytest
+
+from app.core.services import WrightResponseCache as module
+from app.core.services.WrightResponseCache import REPLAY, ResponseCache
+
+
+class FakeResponse:
+    def __init__(self, status=200, body=b"", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRequest:
+    def __init__(self, url, method="GET", resource_type="document", headers=None):
+        self.url = url
+        self.method = method
+        self.resource_type = resource_type
+        self.headers = headers or {"accept": "text/html"}
+
+    async def all_headers(self):
+        return self.headers
+
+
+class FakeRoute:
+    """
+    가짜 네트워크(server)에서 응답을 받아오는 Playwright Route 대체 객체.
+    어떤 방식으로 처리되었는지(fulfilled/fallback/aborted)와 fetch 호출 기록을 남김.
+    """
+
+    def __init__(self, request, server):
+        self.request = request
+        self.server = server
+        self.fetched = []
+        self.outcome = None
+        self.fulfilled = None
+
+    async def fetch(self, headers=None):
+        self.fetched.append(headers)
+        return self.server(self.request, headers or {})
+
+    async def fulfill(self, response=None, status=None, headers=None, body=None):
+        self.outcome = "fulfilled"
+        self.fulfilled = {
+            "status": status if response is None else response.status,
+            "headers": headers if response is None else response.headers,
+            "body": body,
+        }
+
+    async def fallback(self):
+        self.outcome = "fallback"
+
+    async def abort(self, error_code=None):
+        self.outcome = "aborted"
+
+
+class FakeServer:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = 0
+        self.down = False
+
+    def __call__(self, request, headers):
+        if self.down:
+            raise ConnectionError("net::ERR_CONNECTION_RESET")
+
+        self.requests += 1
+        body, etag = self.pages[request.url]
+        if etag and headers.get("If-None-Match") == etag:
+            return FakeResponse(304)
+
+        response_headers = {"content-type": "text/html", "content-length": str(len(body))}
+        if etag:
+            response_headers["etag"] = etag
+
+        return FakeResponse(200, body, response_headers)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    fake_time = types.SimpleNamespace(time=lambda: now[0])
+    monkeypatch.setattr(module, "time", fake_time)
+
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache"), ttl=60.0, max_bytes=1000)
+    yield cache
+    cache.close()
+
+
+def _get(cache, server, url, **request_options):
+    route = FakeRoute(FakeRequest(url, **request_options), server)
+    asyncio.run(cache._handle_route(route, route.request))
+
+    return route
+
+
+def test_miss_stores_and_hit_serves_from_disk(cache):
+    server = FakeServer({"http://site/a": (b"A" * 100, None)})
+
+    first = _get(cache, server, "http://site/a")
+    second = _get(cache, server, "http://site/a")
+
+    assert first.outcome == second.outcome == "fulfilled"
+    assert server.requests == 1
+    assert second.fetched == []
+    assert second.fulfilled["body"] == b"A" * 100
+    # 디코딩된 본문을 저장하므로 길이 헤더는 재사용하지 않음
+    assert "content-length" not in second.fulfilled["headers"]
+
+    stats = cache.stats()
+    assert (stats["miss"], stats["stored"], stats["hit"]) == (1, 1, 1)
+    assert stats["entries"] == 1
+    assert stats["stored_bytes"] == 100
+
+
+def test_vary_headers_are_part_of_the_key(cache):
+    server = FakeServer({"http://site/a": (b"A", None)})
+
+    _get(cache, server, "http://site/a", headers={"accept-language": "ko"})
+    _get(cache, server, "http://site/a", headers={"accept-language": "en"})
+
+    assert server.requests == 2
+    assert cache.stats()["entries"] == 2
+
+
+def test_non_get_requests_are_not_cached(cache):
+    server = FakeServer({"http://site/a": (b"A", None)})
+
+    route = _get(cache, server, "http://site/a", method="POST")
+
+    assert route.outcome == "fallback"
+    assert cache.stats()["entries"] == 0
+
+
+def test_expired_entry_is_revalidated_with_etag(cache, clock):
+    server = FakeServer({"http://site/a": (b"A" * 10, '"v1"')})
+    _get(cache, server, "http://site/a")
+
+    clock[0] += 61.0
+    route = _get(cache, server, "http://site/a")
+
+    assert route.fetched[0]["If-None-Match"] == '"v1"'
+    assert route.fulfilled["body"] == b"A" * 10
+    assert cache.stats()["revalidated"] == 1
+
+    # 304 로 저장 시각이 갱신되어 ttl 동안 다시 네트워크를 쓰지 않음
+    requests = server.requests
+    _get(cache, server, "http://site/a")
+    assert server.requests == requests
+
+
+def test_network_error_serves_stale_entry_or_falls_back(cache, clock):
+    server = FakeServer({"http://site/a": (b"A", '"v1"'), "http://site/b": (b"B", None)})
+    _get(cache, server, "http://site/a")
+
+    clock[0] += 61.0
+    server.down = True
+
+    stale = _get(cache, server, "http://site/a")
+    missing = _get(cache, server, "http://site/b")
+
+    assert stale.outcome == "fulfilled"
+    assert stale.fulfilled["body"] == b"A"
+    assert missing.outcome == "fallback"
+
+    stats = cache.stats()
+    assert stats["stale_if_error"] == 1
+    assert stats["fetch_error"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(cache, clock):
+    pages = {f"http://site/{name}": (name.encode() * 400, None) for name in "abc"}
+    server = FakeServer(pages)
+
+    _get(cache, server, "http://site/a")
+    clock[0] += 1
+    _get(cache, server, "http://site/b")
+    clock[0] += 1
+    _get(cache, server, "http://site/a")  # a 를 최근 사용으로 갱신
+    clock[0] += 1
+    _get(cache, server, "http://site/c")  # 1200 바이트 > 1000 → b 삭제
+
+    stats = cache.stats()
+    assert stats["evicted"] == 1
+    assert stats["entries"] == 2
+    assert stats["stored_bytes"] == 800
+
+    requests = server.requests
+    _get(cache, server, "http://site/a")
+    assert server.requests == requests
+    _get(cache, server, "http://site/b")
+    assert server.requests == requests + 1
+
+
+def test_shared_bodies_are_counted_and_removed_once(cache, clock):
+    body = b"S" * 600
+    server = FakeServer({"http://site/x": (body, None), "http://site/y": (body, None)})
+
+    _get(cache, server, "http://site/x")
+    clock[0] += 1
+    _get(cache, server, "http://site/y")
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["stored_bytes"] == 600
+    assert stats.get("evicted", 0) == 0
+
+
+def test_replay_mode_never_uses_the_network(tmp_path, clock):
+    server = FakeServer({"http://site/a": (b"A", None), "http://site/b": (b"B", None)})
+
+    recorder = ResponseCache(str(tmp_path / "cache"))
+    _get(recorder, server, "http://site/a")
+    recorder.close()
+
+    replay = ResponseCache(str(tmp_path / "cache"), mode=REPLAY)
+    try:
+        server.down = True
+        hit = _get(replay, server, "http://site/a")
+        miss = _get(replay, server, "http://site/b")
+    finally:
+        replay.close()
+
+    assert hit.fulfilled["body"] == b"A"
+    assert miss.outcome == "aborted"
+    assert hit.fetched == miss.fetched == []